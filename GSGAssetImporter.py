@@ -31,10 +31,28 @@
 #
 
 import os
-import json
+import time
+import hashlib
+import threading
 import webbrowser
+import importlib.util
+from collections import deque, OrderedDict
+from concurrent.futures import Future
 from PySide6 import QtWidgets, QtCore, QtGui
-from pymxs import runtime as rt
+try:
+    from pymxs import runtime as rt
+except ImportError:
+    rt = None  # Outside 3ds Max (benchmarks and tooling); callers provide their own runtime.
+# The asset index, caches, jobs and 3ds Max operations live in GSGCore, which imports no Qt.
+from GSGCore import (HDRI_EXTENSIONS, HDRI_SUN_AZIMUTH, HDRI_TARGET_KEY, LIBRARY_CHUNK_SIZE, PROXY_TIERS, TEXTURE_EXTENSIONS,
+                     JobCancelled, submit_work, get_cache_dir, enforce_cache_budget, get_asset_index, analyze_hdri_cached,
+                     iter_create_octane_material, iter_create_octane_materials, iter_build_material_library, restore_full_resolution_textures,
+                     iter_analyze_hdri, iter_create_octane_hdri, list_browser_assets, iter_import_fbx_files, iter_import_fbx_file_list,
+                     clear_fbx_cache, iter_import_textures_as_nodes, warm_start, mirror_enabled, set_mirror_enabled,
+                     iter_localize_scene_textures, restore_network_textures, clear_mirror_cache, archive_member_info, localize_paths)
+from GSGHDRI import suggest_power, suggest_rotation
+import GSGTrace
+from GSGTrace import span, traced
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # +                        SECTION 1: CONSTANTS                       +
@@ -49,6 +67,25 @@ LINKS = {
     "The Greyscalegorilla Studio": "https://greyscalegorilla.com/"
 }
 
+# Background jobs: how long the UI thread may spend on a job per event loop turn before it lets Qt repaint. The log
+# view keeps at most LOG_MAX_LINES and is refreshed every LOG_FLUSH_MS.
+JOB_SLICE_MS = 50
+JOB_POLL_MS = 15
+LOG_MAX_LINES = 5000
+LOG_FLUSH_MS = 100
+
+# Chrome trace exports are offered in this cache subfolder (tracing is also enabled by the GSG_TRACE environment variable)
+TRACE_DIR_NAME = "traces"
+
+# Asset browser thumbnails: longest side in pixels, how many are kept in memory (about 64 KB each), generator threads
+# and the on-disk cache budget. The grid shows the items BROWSER_GRID_SIZE apart.
+THUMBNAIL_SIZE = 128
+THUMBNAIL_MEMORY_ITEMS = 1000
+THUMBNAIL_THREADS = 4
+THUMBNAIL_DIR_NAME = "thumbnails"
+THUMBNAIL_CACHE_BUDGET_MB = 512
+BROWSER_GRID_SIZE = 150
+
 # A modern, consistent style for the main action buttons
 BUTTON_STYLE = """
     QPushButton {
@@ -67,6 +104,7 @@ BUTTON_STYLE = """
     }
 """
 
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # +               SECTION 2: DIALOGS AND TAB WIDGETS                  +
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -96,6 +134,181 @@ class AboutDialog(QtWidgets.QDialog):
         layout.addStretch()
         layout.addWidget(ok_button, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
+class LogSink(QtCore.QObject):
+    """ A bounded, batched log: write() only queues the line (from any thread) and a timer appends everything queued
+        to the view in one call, so thousands of log lines cost the running job next to nothing. """
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self._view = view
+        self._view.setMaximumBlockCount(LOG_MAX_LINES)
+        self._lock = threading.Lock()
+        self._pending = deque(maxlen=LOG_MAX_LINES)
+        self._dropped = 0
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(LOG_FLUSH_MS)
+
+    def write(self, message):
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen: self._dropped += 1
+            self._pending.append(str(message))
+
+    def flush(self):
+        with self._lock:
+            if not self._pending: return
+            lines = list(self._pending); self._pending.clear()
+            dropped, self._dropped = self._dropped, 0
+        if dropped: lines.insert(0, f"... {dropped} earlier line(s) not shown ...")
+        text = "\n".join(lines)
+        self._view.appendPlainText(text)
+        print(text)
+
+    def clear(self):
+        with self._lock: self._pending.clear(); self._dropped = 0
+        self._view.clear()
+
+class JobRunner(QtCore.QObject):
+    """ Drives a job generator (see BACKGROUND JOBS in GSGCore) on the UI thread. The job is advanced for at most
+        JOB_SLICE_MS per event loop turn, futures are polled instead of waited on, and a cancel request is thrown into
+        the job at its next progress report or pending future. """
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._job = None; self._future = None; self._resume = (None, None); self._cancel_requested = False; self._span = None
+        self.result = None  # The finished job's return value, the exception it raised, or JobCancelled
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._step)
+
+    def is_running(self):
+        return self._job is not None
+
+    def start(self, job):
+        self._job = job; self._future = None; self._resume = (None, None); self._cancel_requested = False
+        self._span = span(f"job {getattr(job, '__name__', 'job')}"); self._span.__enter__()
+        self._timer.start(0)
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def _step(self):
+        deadline = time.perf_counter() + JOB_SLICE_MS / 1000.0
+        while time.perf_counter() < deadline:
+            if self._future is not None:
+                if not self._future.done() and not self._cancel_requested:
+                    self._timer.start(JOB_POLL_MS); return
+                future, self._future = self._future, None
+                if self._cancel_requested: self._resume = (None, JobCancelled())
+                else:
+                    try: self._resume = (future.result(), None)
+                    except Exception as e: self._resume = (None, e)
+            value, error = self._resume; self._resume = (None, None)
+            try:
+                item = self._job.throw(error) if error is not None else self._job.send(value)
+            except StopIteration as stop:
+                self._finish(stop.value); return
+            except JobCancelled:
+                self._finish(JobCancelled); return
+            except Exception as e:
+                self._finish(e); return
+            if isinstance(item, Future):
+                self._future = item
+            elif isinstance(item, tuple):
+                self.progress.emit(*item)
+                if self._cancel_requested: self._resume = (None, JobCancelled())
+        self._timer.start(0)
+
+    def _finish(self, result):
+        self._job = None; self._future = None; self.result = result
+        self._span.__exit__(None, None, None); self._span = None
+        self.finished.emit()
+
+class JobPanel(QtWidgets.QWidget):
+    """ Progress bar, cancel button and log view shared by the importer tabs. """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setValue(0)
+        self.cancel_button = QtWidgets.QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.log_view = QtWidgets.QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        progress_row = QtWidgets.QHBoxLayout()
+        progress_row.addWidget(self.progress_bar)
+        progress_row.addWidget(self.cancel_button)
+        layout.addLayout(progress_row)
+        layout.addWidget(QtWidgets.QLabel("Log:"))
+        layout.addWidget(self.log_view)
+        self.sink = LogSink(self.log_view, self)
+        self.runner = JobRunner(self)
+        self.runner.progress.connect(self._on_progress)
+        self.runner.finished.connect(self._on_finished)
+        self.cancel_button.clicked.connect(self.cancel)
+
+    def log(self, message):
+        self.sink.write(message)
+
+    def clear(self):
+        self.sink.clear()
+
+    def run(self, job):
+        """ Starts a job generator. Returns False (and warns) when another job is still running in this panel. """
+        if self.runner.is_running():
+            rt.messageBox("Please wait for the current job to finish or cancel it.", title="Warning")
+            return False
+        self.progress_bar.setRange(0, 0)
+        self.cancel_button.setEnabled(True)
+        self.runner.start(job)
+        return True
+
+    def cancel(self):
+        self.cancel_button.setEnabled(False)
+        self.log("Cancelling...")
+        self.runner.cancel()
+
+    def _on_progress(self, done, total):
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+
+    def _on_finished(self):
+        result = self.runner.result
+        self.cancel_button.setEnabled(False)
+        self.progress_bar.setRange(0, 1)
+        if result is JobCancelled:
+            self.progress_bar.setValue(0); self.log("--- CANCELLED ---")
+        else:
+            self.progress_bar.setValue(1)
+            if isinstance(result, Exception): self.log(f"!!! ERROR: {result}")
+        self.sink.flush()
+
+class LazyTab(QtWidgets.QWidget):
+    """ A tab page that builds its tab widget the first time it is shown, so opening the window only builds the
+        current tab. """
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.widget = None
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure(self):
+        """ Returns the tab widget, building it now if it has not been shown yet. """
+        if self.widget is None:
+            with span(f"build {self.factory.__name__}"): self.widget = self.factory()
+            self.layout().addWidget(self.widget)
+        return self.widget
+
+    def showEvent(self, event):
+        self.ensure()
+        super().showEvent(event)
+
+    def log_message(self, message):
+        self.ensure().log_message(message)
+
 class MaterialTab(QtWidgets.QWidget):
     """ The UI tab for creating materials from GSG folders. """
     def __init__(self, parent=None):
@@ -104,21 +317,52 @@ class MaterialTab(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
         self.folder_path_label = QtWidgets.QLabel("Please select a GSG material folder...")
         browse_button = QtWidgets.QPushButton("Browse Folder...")
+        archive_button = QtWidgets.QPushButton("Browse Archive...")
+        archive_button.setToolTip("Use a zipped GSG pack as it is; only the files a material needs are extracted.")
+        browse_row = QtWidgets.QHBoxLayout()
+        browse_row.addWidget(browse_button)
+        browse_row.addWidget(archive_button)
         create_button = QtWidgets.QPushButton("Create Octane Material")
         create_button.setStyleSheet(BUTTON_STYLE)
-        self.log_box = QtWidgets.QTextEdit()
-        self.log_box.setReadOnly(True)
+        library_button = QtWidgets.QPushButton("Build Library")
+        library_button.setStyleSheet(BUTTON_STYLE)
+        library_button.setToolTip("Build every GSG material found below the selected folder.")
+        self.chunk_size_box = QtWidgets.QSpinBox()
+        self.chunk_size_box.setRange(1, 5000)
+        self.chunk_size_box.setValue(LIBRARY_CHUNK_SIZE)
+        self.dry_run_box = QtWidgets.QCheckBox("Dry run (generate code only)")
+        self.proxy_box = QtWidgets.QCheckBox("Use proxy textures:")
+        self.proxy_tier_box = QtWidgets.QComboBox()
+        self.proxy_tier_box.addItems(list(PROXY_TIERS))
+        self.proxy_tier_box.setCurrentText("1K")
+        restore_button = QtWidgets.QPushButton("Restore Full Resolution")
+        restore_button.setToolTip("Point every proxy texture in the scene back at its full-resolution map.")
+        proxy_options = QtWidgets.QHBoxLayout()
+        proxy_options.addWidget(self.proxy_box)
+        proxy_options.addWidget(self.proxy_tier_box)
+        proxy_options.addStretch()
+        proxy_options.addWidget(restore_button)
+        library_options = QtWidgets.QHBoxLayout()
+        library_options.addWidget(QtWidgets.QLabel("Materials per batch:"))
+        library_options.addWidget(self.chunk_size_box)
+        library_options.addWidget(self.dry_run_box)
+        library_options.addStretch()
+        self.job_panel = JobPanel()
         layout.addWidget(self.folder_path_label)
-        layout.addWidget(browse_button)
+        layout.addLayout(browse_row)
         layout.addWidget(create_button)
-        layout.addWidget(QtWidgets.QLabel("Log:"))
-        layout.addWidget(self.log_box)
+        layout.addWidget(library_button)
+        layout.addLayout(library_options)
+        layout.addLayout(proxy_options)
+        layout.addWidget(self.job_panel)
         browse_button.clicked.connect(self.browse_folder)
+        archive_button.clicked.connect(self.browse_archive)
         create_button.clicked.connect(self.run_creation_process)
+        library_button.clicked.connect(self.run_library_process)
+        restore_button.clicked.connect(self.run_restore_process)
 
     def log_message(self, message):
-        self.log_box.append(message)
-        print(message)
+        self.job_panel.log(message)
 
     def browse_folder(self):
         folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Select GSG Asset Folder")
@@ -127,36 +371,70 @@ class MaterialTab(QtWidgets.QWidget):
             self.folder_path_label.setText(folder)
             self.log_message(f"Folder selected: {folder}")
 
+    def browse_archive(self):
+        archive, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select GSG Pack", "", "Zip Archives (*.zip)")
+        if archive:
+            self.selected_folder = archive
+            self.folder_path_label.setText(archive)
+            self.log_message(f"Archive selected: {archive}")
+
     def run_creation_process(self):
         if not self.selected_folder:
             rt.messageBox("Please select a folder first!", title="Warning")
             return
-        self.log_box.clear()
-        create_octane_material(self.selected_folder, self.log_message)
+        self.job_panel.clear()
+        self.job_panel.run(iter_create_octane_material(self.selected_folder, self.log_message, proxy_tier=self.proxy_tier()))
+
+    def run_library_process(self):
+        if not self.selected_folder:
+            rt.messageBox("Please select a folder first!", title="Warning")
+            return
+        self.job_panel.clear()
+        self.job_panel.run(self._library_job(self.chunk_size_box.value(), self.dry_run_box.isChecked(), self.proxy_tier()))
+
+    def _library_job(self, chunk_size, dry_run, proxy_tier):
+        result = yield from iter_build_material_library(self.selected_folder, self.log_message, chunk_size=chunk_size, dry_run=dry_run, proxy_tier=proxy_tier)
+        if dry_run and result:
+            self.log_message(f"Dry run produced {len(result)} script(s), {sum(len(c) for c in result)} characters.")
+        return result
+
+    def proxy_tier(self):
+        return self.proxy_tier_box.currentText() if self.proxy_box.isChecked() else None
+
+    def run_restore_process(self):
+        self.job_panel.clear()
+        restore_full_resolution_textures(self.log_message)
 
 class HDRITab(QtWidgets.QWidget):
     """ The UI tab for creating HDRI environments. """
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_file = ""
+        self.analysis = None  # (file, stats, preview) of the last analyzed HDRI
         layout = QtWidgets.QVBoxLayout(self)
         self.file_path_label = QtWidgets.QLabel("Please select an HDRI file (.hdr, .exr)...")
         browse_button = QtWidgets.QPushButton("Browse File...")
         create_button = QtWidgets.QPushButton("Create HDRI Environment")
         create_button.setStyleSheet(BUTTON_STYLE)
-        self.log_box = QtWidgets.QTextEdit()
-        self.log_box.setReadOnly(True)
+        self.auto_exposure_box = QtWidgets.QCheckBox("Auto exposure (set power from the HDRI luminance)")
+        self.auto_exposure_box.setChecked(True)
+        self.preview_label = QtWidgets.QLabel()
+        self.preview_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.info_label = QtWidgets.QLabel()
+        self.info_label.setWordWrap(True)
+        self.job_panel = JobPanel()
         layout.addWidget(self.file_path_label)
         layout.addWidget(browse_button)
+        layout.addWidget(self.preview_label)
+        layout.addWidget(self.info_label)
+        layout.addWidget(self.auto_exposure_box)
         layout.addWidget(create_button)
-        layout.addWidget(QtWidgets.QLabel("Log:"))
-        layout.addWidget(self.log_box)
+        layout.addWidget(self.job_panel)
         browse_button.clicked.connect(self.browse_file)
         create_button.clicked.connect(self.run_creation_process)
 
     def log_message(self, message):
-        self.log_box.append(message)
-        print(message)
+        self.job_panel.log(message)
 
     def browse_file(self):
         file, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select HDRI File", "", "HDRI Files (*.hdr *.exr)")
@@ -164,13 +442,35 @@ class HDRITab(QtWidgets.QWidget):
             self.selected_file = file
             self.file_path_label.setText(file)
             self.log_message(f"File selected: {file}")
-            
+            self.job_panel.run(self._analysis_job(file))
+
+    def _analysis_job(self, file_path):
+        """ Analyzes file_path unless it is the HDRI already shown, and updates the preview and info labels. """
+        if self.analysis and self.analysis[0] == file_path: return self.analysis
+        self.analysis = None; self.preview_label.clear(); self.info_label.clear()
+        result = yield from iter_analyze_hdri(file_path, self.log_message)
+        if not result: return None
+        stats, preview = result
+        self.analysis = (file_path, stats, preview)
+        image = QtGui.QImage(preview.tobytes(), preview.shape[1], preview.shape[0], 3 * preview.shape[1], QtGui.QImage.Format.Format_RGB888)
+        self.preview_label.setPixmap(QtGui.QPixmap.fromImage(image).scaledToWidth(min(preview.shape[1], 480), QtCore.Qt.TransformationMode.SmoothTransformation))
+        sun = stats.get("sun")
+        sun_text = f"sun at {sun['azimuth']:.0f}° azimuth, {sun['elevation']:.0f}° elevation (suggested rotation {suggest_rotation(stats, HDRI_SUN_AZIMUTH)}°)" if sun else "no dominant sun"
+        self.info_label.setText(f"{stats['width']} x {stats['height']}, average luminance {stats['average_luminance']:.3g}, peak {stats['peak_luminance']:.3g}, {sun_text}. Suggested power: {suggest_power(stats, HDRI_TARGET_KEY)}")
+        return self.analysis
+
     def run_creation_process(self):
         if not self.selected_file:
             rt.messageBox("Please select a file first!", title="Warning")
             return
-        self.log_box.clear()
-        create_octane_hdri(self.selected_file, self.log_message)
+        self.job_panel.run(self._creation_job(self.selected_file, self.auto_exposure_box.isChecked()))
+
+    def _creation_job(self, file_path, auto_exposure):
+        power = 1.0
+        if auto_exposure:
+            analysis = yield from self._analysis_job(file_path)
+            if analysis: power = suggest_power(analysis[1], HDRI_TARGET_KEY)
+        yield from iter_create_octane_hdri(file_path, self.log_message, power=power)
 
 class FBXTab(QtWidgets.QWidget):
     """ The UI tab for importing FBX files from a folder. """
@@ -182,19 +482,28 @@ class FBXTab(QtWidgets.QWidget):
         browse_button = QtWidgets.QPushButton("Browse Folder...")
         import_button = QtWidgets.QPushButton("Import All FBX Files")
         import_button.setStyleSheet(BUTTON_STYLE)
-        self.log_box = QtWidgets.QTextEdit()
-        self.log_box.setReadOnly(True)
+        self.recursive_box = QtWidgets.QCheckBox("Include subfolders")
+        self.cache_box = QtWidgets.QCheckBox("Use import cache")
+        self.cache_box.setChecked(True)
+        self.cache_box.setToolTip("Merge previously translated FBX files from a native .max cache instead of importing them again.")
+        clear_cache_button = QtWidgets.QPushButton("Clear Cache")
+        fbx_options = QtWidgets.QHBoxLayout()
+        fbx_options.addWidget(self.recursive_box)
+        fbx_options.addWidget(self.cache_box)
+        fbx_options.addStretch()
+        fbx_options.addWidget(clear_cache_button)
+        self.job_panel = JobPanel()
         layout.addWidget(self.folder_path_label)
         layout.addWidget(browse_button)
         layout.addWidget(import_button)
-        layout.addWidget(QtWidgets.QLabel("Log:"))
-        layout.addWidget(self.log_box)
+        layout.addLayout(fbx_options)
+        layout.addWidget(self.job_panel)
         browse_button.clicked.connect(self.browse_folder)
         import_button.clicked.connect(self.run_import_process)
+        clear_cache_button.clicked.connect(lambda: clear_fbx_cache(self.log_message))
 
     def log_message(self, message):
-        self.log_box.append(message)
-        print(message)
+        self.job_panel.log(message)
 
     def browse_folder(self):
         folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Select FBX Folder")
@@ -207,32 +516,35 @@ class FBXTab(QtWidgets.QWidget):
         if not self.selected_folder:
             rt.messageBox("Please select a folder first!", title="Warning")
             return
-        self.log_box.clear()
-        import_fbx_files(self.selected_folder, self.log_message)
+        self.job_panel.clear()
+        self.job_panel.run(iter_import_fbx_files(self.selected_folder, self.log_message, recursive=self.recursive_box.isChecked(), use_cache=self.cache_box.isChecked()))
 
 class TextureTab(QtWidgets.QWidget):
-    """ The UI tab for importing standalone textures as nodes. """
+    """ The UI tab for importing standalone textures as nodes, grouped into texture sets. """
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_files = []
         layout = QtWidgets.QVBoxLayout(self)
         self.files_label = QtWidgets.QLabel("Select one or more texture files to import as nodes...")
         browse_button = QtWidgets.QPushButton("Browse Texture Files...")
+        browse_folder_button = QtWidgets.QPushButton("Add Texture Folder...")
         import_button = QtWidgets.QPushButton("Import Textures as Nodes")
         import_button.setStyleSheet(BUTTON_STYLE)
-        self.log_box = QtWidgets.QTextEdit()
-        self.log_box.setReadOnly(True)
+        self.materials_box = QtWidgets.QCheckBox("Create a material per texture set")
+        self.materials_box.setToolTip("Files sharing a name before the map suffix (Oak_01_BaseColor, Oak_01_Roughness, ...) form a texture set; its maps are wired into an Octane material.")
+        self.job_panel = JobPanel()
         layout.addWidget(self.files_label)
         layout.addWidget(browse_button)
+        layout.addWidget(browse_folder_button)
+        layout.addWidget(self.materials_box)
         layout.addWidget(import_button)
-        layout.addWidget(QtWidgets.QLabel("Log:"))
-        layout.addWidget(self.log_box)
+        layout.addWidget(self.job_panel)
         browse_button.clicked.connect(self.browse_files)
+        browse_folder_button.clicked.connect(self.browse_folder)
         import_button.clicked.connect(self.run_import_process)
 
     def log_message(self, message):
-        self.log_box.append(message)
-        print(message)
+        self.job_panel.log(message)
 
     def browse_files(self):
         files, _ = QtWidgets.QFileDialog.getOpenFileNames(self, "Select Texture Files", "", "Image Files (*.jpg *.png *.tif *.tiff *.exr *.hdr)")
@@ -241,142 +553,309 @@ class TextureTab(QtWidgets.QWidget):
             self.files_label.setText(f"{len(files)} file(s) selected.")
             for f in files: self.log_message(f"Selected: {os.path.basename(f)}")
 
+    def browse_folder(self):
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Texture Folder")
+        if folder: self.job_panel.run(self._add_folder_job(folder))
+
+    def _add_folder_job(self, folder):
+        files = yield submit_work(get_asset_index().files, folder, TEXTURE_EXTENSIONS)
+        self.selected_files = self.selected_files + [f for f in files if f not in self.selected_files]
+        self.files_label.setText(f"{len(self.selected_files)} file(s) selected.")
+        self.log_message(f"Added {len(files)} texture(s) from: {folder}")
+
     def run_import_process(self):
         if not self.selected_files:
             rt.messageBox("Please select one or more files first!", title="Warning")
             return
-        self.log_box.clear()
-        import_textures_as_nodes(self.selected_files, self.log_message)
+        self.job_panel.clear()
+        self.job_panel.run(iter_import_textures_as_nodes(self.selected_files, self.log_message, self.materials_box.isChecked()))
+
+class _ThumbnailTask(QtCore.QRunnable):
+    def __init__(self, loader, source_path):
+        super().__init__()
+        self.loader = loader; self.source_path = source_path
+
+    def run(self):
+        try: image = self.loader.cache.load_or_create(self.source_path)
+        except Exception: image = QtGui.QImage()
+        self.loader.ready.emit(self.source_path, image)
+
+class ThumbnailLoader(QtCore.QObject):
+    """ Makes thumbnails on a QThreadPool. Each source is requested once at a time, and the most recent requests run
+        first, so the items currently on screen are served before the ones scrolled past. """
+    ready = QtCore.Signal(str, QtGui.QImage)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(THUMBNAIL_THREADS)
+        self._pending = set(); self._priority = 0
+        # ready is emitted from pool threads; queued to this object's (the UI) thread, only the UI thread touches _pending.
+        self.ready.connect(self._on_ready, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def _on_ready(self, source_path, image):
+        self._pending.discard(source_path)
+
+    def request(self, source_path):
+        if source_path in self._pending: return
+        self._pending.add(source_path); self._priority += 1
+        self.pool.start(_ThumbnailTask(self, source_path), self._priority)
+
+    def pending(self):
+        return len(self._pending)
+
+class AssetListModel(QtCore.QAbstractListModel):
+    """ The asset browser items. Thumbnails come from the memory cache; missing ones are requested from the loader
+        when the view first asks for them, i.e. only for the items that are painted. """
+    ItemRole = QtCore.Qt.ItemDataRole.UserRole
+
+    def __init__(self, cache, loader, parent=None):
+        super().__init__(parent)
+        self.cache = cache; self.loader = loader
+        self.items = []; self._rows_by_thumbnail = {}; self._failed = set()
+        self._placeholders = {kind: self._placeholder(label) for kind, label in (("material", "MAT"), ("hdri", "HDRI"), ("fbx", "FBX"))}
+        loader.ready.connect(self._on_thumbnail)
+
+    @staticmethod
+    def _placeholder(label):
+        image = QtGui.QImage(THUMBNAIL_SIZE, THUMBNAIL_SIZE, QtGui.QImage.Format.Format_RGB32)
+        image.fill(QtGui.QColor("#3a3a3a"))
+        painter = QtGui.QPainter(image)
+        painter.setPen(QtGui.QColor("#9a9a9a")); painter.drawText(image.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, label)
+        painter.end()
+        return image
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self.items = items; self._rows_by_thumbnail = {}
+        for row, item in enumerate(items):
+            if item["thumbnail"]: self._rows_by_thumbnail.setdefault(item["thumbnail"], []).append(row)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        item = self.items[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole: return item["name"]
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole: return f"{item['name']}\n{item['path']}"
+        if role == self.ItemRole: return item
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            source_path = item["thumbnail"]
+            if source_path and source_path not in self._failed:
+                image = self.cache.get(source_path)
+                if image is not None: return image
+                self.loader.request(source_path)
+            return self._placeholders[item["kind"]]
+        return None
+
+    def _on_thumbnail(self, source_path, image):
+        if image.isNull(): self._failed.add(source_path)
+        else: self.cache.put(source_path, image)
+        for row in self._rows_by_thumbnail.get(source_path, ()):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.DecorationRole])
+
+class AssetFilterModel(QtCore.QSortFilterProxyModel):
+    """ Filters the asset browser by kind and by a case-insensitive name fragment. """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.kind = None; self.text = ""
+
+    def set_filter(self, kind, text):
+        self.kind = kind; self.text = text.lower().strip()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        item = self.sourceModel().items[source_row]
+        return (self.kind is None or item["kind"] == self.kind) and self.text in item["name"].lower()
+
+class BrowserTab(QtWidgets.QWidget):
+    """ The UI tab for browsing a whole GSG library as a thumbnail grid and creating the selected assets. """
+    KINDS = {"All Assets": None, "Materials": "material", "HDRIs": "hdri", "FBX Models": "fbx"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.selected_folder = ""
+        layout = QtWidgets.QVBoxLayout(self)
+        self.folder_path_label = QtWidgets.QLabel("Please select a GSG library folder...")
+        browse_button = QtWidgets.QPushButton("Browse Library...")
+        archive_button = QtWidgets.QPushButton("Open Archive...")
+        archive_button.setToolTip("Browse a zipped GSG pack without unpacking it.")
+        browse_row = QtWidgets.QHBoxLayout()
+        browse_row.addWidget(browse_button)
+        browse_row.addWidget(archive_button)
+        self.search_edit = QtWidgets.QLineEdit()
+        self.search_edit.setPlaceholderText("Filter by name...")
+        self.kind_box = QtWidgets.QComboBox()
+        self.kind_box.addItems(list(self.KINDS))
+        filter_row = QtWidgets.QHBoxLayout()
+        filter_row.addWidget(self.search_edit)
+        filter_row.addWidget(self.kind_box)
+        self.cache = get_thumbnail_cache()
+        self.loader = ThumbnailLoader(self.cache, self)
+        self.model = AssetListModel(self.cache, self.loader, self)
+        self.filter_model = AssetFilterModel(self)
+        self.filter_model.setSourceModel(self.model)
+        self.view = QtWidgets.QListView()
+        self.view.setViewMode(QtWidgets.QListView.ViewMode.IconMode)
+        self.view.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.view.setMovement(QtWidgets.QListView.Movement.Static)
+        self.view.setUniformItemSizes(True)
+        self.view.setIconSize(QtCore.QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.view.setGridSize(QtCore.QSize(BROWSER_GRID_SIZE, BROWSER_GRID_SIZE + 20))
+        self.view.setTextElideMode(QtCore.Qt.TextElideMode.ElideMiddle)
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.view.setModel(self.filter_model)
+        self.count_label = QtWidgets.QLabel()
+        create_button = QtWidgets.QPushButton("Create Selected")
+        create_button.setStyleSheet(BUTTON_STYLE)
+        create_button.setToolTip("Create the selected materials, set the first selected HDRI as environment and import the selected FBX files.")
+        self.job_panel = JobPanel()
+        self.job_panel.log_view.setMaximumHeight(120)
+        layout.addWidget(self.folder_path_label)
+        layout.addLayout(browse_row)
+        layout.addLayout(filter_row)
+        layout.addWidget(self.view, 1)
+        layout.addWidget(self.count_label)
+        layout.addWidget(create_button)
+        layout.addWidget(self.job_panel)
+        browse_button.clicked.connect(self.browse_folder)
+        archive_button.clicked.connect(self.browse_archive)
+        self.search_edit.textChanged.connect(self.apply_filter)
+        self.kind_box.currentTextChanged.connect(self.apply_filter)
+        self.view.doubleClicked.connect(lambda index: self.run_creation_process([index]))
+        create_button.clicked.connect(lambda: self.run_creation_process(self.view.selectionModel().selectedIndexes()))
+
+    def log_message(self, message):
+        self.job_panel.log(message)
+
+    def browse_folder(self):
+        folder = QtWidgets.QFileDialog.getExistingDirectory(self, "Select GSG Library Folder", self.selected_folder)
+        if folder: self.open_folder(folder)
+
+    def browse_archive(self):
+        archive, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select GSG Pack", os.path.dirname(self.selected_folder), "Zip Archives (*.zip)")
+        if archive: self.open_folder(archive)
+
+    def open_folder(self, folder):
+        self.selected_folder = folder
+        self.folder_path_label.setText(folder)
+        self.job_panel.clear()
+        self.job_panel.run(self._scan_job(folder))
+
+    def _scan_job(self, folder):
+        start_time = time.perf_counter()
+        items = yield submit_work(list_browser_assets, folder, self.log_message)
+        yield submit_work(get_asset_index().set_setting, "browser_root", folder)
+        self.model.set_items(items)
+        self.apply_filter()
+        self.log_message(f"Found {len(items)} asset(s) in {time.perf_counter() - start_time:.2f}s.")
+        return len(items)
+
+    def apply_filter(self):
+        self.filter_model.set_filter(self.KINDS[self.kind_box.currentText()], self.search_edit.text())
+        self.count_label.setText(f"Showing {self.filter_model.rowCount()} of {self.model.rowCount()} asset(s).")
+
+    def run_creation_process(self, indexes):
+        items = [index.data(AssetListModel.ItemRole) for index in indexes]
+        if not items:
+            rt.messageBox("Please select one or more assets first!", title="Warning")
+            return
+        self.job_panel.clear()
+        self.job_panel.run(self._creation_job(items))
+
+    def _creation_job(self, items):
+        materials = [i["path"] for i in items if i["kind"] == "material"]
+        hdris = [i["path"] for i in items if i["kind"] == "hdri"]
+        fbx_files = [i["path"] for i in items if i["kind"] == "fbx"]
+        if materials: yield from iter_create_octane_materials(materials, self.log_message)
+        if hdris:
+            if len(hdris) > 1: self.log_message(f"!!! WARNING: {len(hdris)} HDRIs selected; only '{os.path.basename(hdris[0])}' is used as the environment.")
+            analysis = yield from iter_analyze_hdri(hdris[0], self.log_message)
+            yield from iter_create_octane_hdri(hdris[0], self.log_message, power=suggest_power(analysis[0], HDRI_TARGET_KEY) if analysis else 1.0)
+        if fbx_files: yield from iter_import_fbx_file_list(fbx_files, self.log_message)
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-# +                    SECTION 3: CORE LOGIC FUNCTIONS                +
+# +                     SECTION 3: THUMBNAIL CACHE                    +
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
-def create_octane_material(folder_path, status_callback):
-    status_callback("--- Starting Octane Material Creation ---")
-    try:
-        if "octane" not in str(rt.classOf(rt.renderers.current)).lower():
-            rt.messageBox("Octane is not the active renderer.", title="Renderer Error")
-            status_callback("!!! ERROR: Octane is not the active renderer.")
-            return False
-
-        gsgm_file_path = next((os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.lower().endswith('.gsgm')), None)
-        if not gsgm_file_path:
-            rt.messageBox("No .gsgm file found.", title="Error"); return False
-        
-        with open(gsgm_file_path, 'r', encoding='utf-8') as f: data = json.load(f)
-        material_name = data.get('name', os.path.basename(folder_path))
-        params = data.get('params', {}).get('standard_surface', {})
-        status_callback(f"Found material '{material_name}' with {len(params)} parameters.")
-        
-        maps = {}
-        all_files = os.listdir(folder_path)
-        keywords = {"albedo": ["albedo", "basecolor", "diffuse", "_col"], "roughness": ["roughness", "_rgh"], "normal": ["normal", "_nrm", "_nor"], "metallic": ["metallic", "metalness", "_met"], "displacement": ["displacement", "displace", "height", "_disp"], "scattering_weight": ["scatteringweight"], "scattering_distance": ["scatteringdistancescale"]}
-        for map_type, keys in keywords.items():
-            for filename in all_files:
-                if any(k in filename.lower() for k in keys) and any(filename.lower().endswith(ext) for ext in ['.jpg', '.png', '.jpeg', '.tif', '.exr']):
-                    maps[map_type] = os.path.join(folder_path, filename); break
-        
-        param_blocks = []
-        param_map = {'base_color': ('baseColor_color', 'albedo', True), 'specular_roughness': ('roughness_value', 'roughness', False), 'metallic': ('metallic_value', 'metallic', False), 'transmission': ('transmission_value', None, False), 'transmission_color': ('transmissionColor_color', None, True), 'specular_IOR': ('ior_value', None, False), 'scattering_weight': ('scattering_color', 'scattering_weight', True), 'scatteringdistancescale': ('radius_value', 'scattering_distance', False)}
-        for json_key, (mat_prop, map_key, is_color) in param_map.items():
-            if json_key in params and (not map_key or not maps.get(map_key)):
-                value = params[json_key]
-                if is_color and isinstance(value, dict): param_blocks.append(f'mtl.{mat_prop} = color {value.get("r",0)*255} {value.get("g",0)*255} {value.get("b",0)*255}')
-                elif not is_color: param_blocks.append(f'mtl.{mat_prop} = {value}')
-        final_param_code = "\n".join(param_blocks)
-        
-        def tex_block(tex_path, slot, is_linear=False):
-            if not tex_path: return ""
-            sanitized_path = tex_path.replace("\\", "/"); var_name = slot.replace("_tex", "Tex"); gamma_line = f"{var_name}.gamma = 1.0" if is_linear else ""
-            input_prop_name = slot.replace("_tex", "") + "_input_type"
-            if slot == "displacement": return f'if doesFileExist "{sanitized_path}" do (local dN=Texture_displacement();local dT=RGB_image filename:"{sanitized_path}";dT.gamma=1.0;dN.texture_tex=dT;mtl.displacement=dN)'
-            return f'if doesFileExist "{sanitized_path}" do (local {var_name}=RGB_image filename:"{sanitized_path}";{gamma_line};mtl.{input_prop_name}=2;mtl.{slot}={var_name})'
-
-        tex_code_blocks = [tex_block(maps.get("albedo"), "baseColor_tex"), tex_block(maps.get("roughness"), "roughness_tex", True), tex_block(maps.get("metallic"), "metallic_tex", True), tex_block(maps.get("normal"), "normal_tex", True), tex_block(maps.get("displacement"), "displacement"), tex_block(maps.get("scattering_weight"), "scattering_tex", False), tex_block(maps.get("scattering_distance"), "radius_tex", True)]
-        final_tex_code = "\n".join(tex_code_blocks)
-        mat_lib_path = os.path.join(folder_path, f"{material_name}.mat").replace("\\", "/")
-        
-        mxs_command = f'''
-        (
-            local mtl = Std_Surface_Mtl name:"{material_name}"
-            {final_param_code}
-            {final_tex_code}
-            local activeView = sme.GetView sme.activeView; if (activeView != undefined) do (activeView.CreateNode mtl [200, 200]);
-            local lib = materialLibrary(); append lib mtl; saveTempMaterialLibrary lib "{mat_lib_path}";
-            "OK"
-        )
-        '''
-        status_callback("Executing generated MaxScript...")
-        result = rt.execute(mxs_command)
-        if result != "OK": raise Exception("MaxScript execution failed. Check Listener for errors.")
-        status_callback(f"-> Octane material '{material_name}' created successfully.")
-
-    except Exception as e:
-        error_message = f"An error occurred: {e}"
-        status_callback(f"!!! SCRIPT ERROR: {error_message}")
-        rt.messageBox(error_message, title="Script Error")
-        return False
-    status_callback("--- PROCESS COMPLETE! ---"); return True
-
-def create_octane_hdri(file_path, status_callback):
-    status_callback("--- Creating Octane HDRI Environment ---")
-    try:
-        sanitized_path = file_path.replace("\\", "/")
-        mxs_command = f'''
-        (
-            -- Create the nodes
-            local tex = RGB_image filename:"{sanitized_path}"
-            local env = Texture_environment()
-            
-            -- Configure the environment node
-            env.power = 1.0
-            env.importance_sampling = true
-            env.texture_input_type = 2
-            env.texture_tex = tex
-            
-            -- Assign to the scene environment (your original logic)
-            environmentMap = env
-            
-            -- NEW: Place the created nodes in the active Slate view
-            local activeView = sme.GetView sme.activeView
-            if (activeView != undefined) do
-            (
-                activeView.CreateNode tex [200, 150]
-                activeView.CreateNode env [450, 200]
-            )
-            
-            "OK"
-        )
-        '''
-        result = rt.execute(mxs_command)
-        if result != "OK": raise Exception("MaxScript failed.")
-        status_callback(f"SUCCESS: Environment set and nodes created for '{os.path.basename(file_path)}'")
-    except Exception as e:
-        status_callback(f"!!! ERROR: Could not create HDRI environment. {e}")
-
-def import_fbx_files(folder_path, status_callback):
-    status_callback(f"--- Importing FBX files from: {folder_path} ---"); fbx_found = False
-    for filename in os.listdir(folder_path):
-        if filename.lower().endswith('.fbx'):
-            fbx_found = True; full_path = os.path.join(folder_path, filename); status_callback(f"-> Importing '{filename}'...")
-            try: rt.importFile(full_path, rt.name("noPrompt"))
-            except Exception as e: status_callback(f"!!! ERROR: Failed to import '{filename}'. {e}")
-    if not fbx_found: status_callback("No .fbx files found.")
-    else: status_callback("--- FBX Import Complete ---")
-
-def import_textures_as_nodes(file_paths, status_callback):
-    status_callback(f"--- Importing {len(file_paths)} textures as nodes ---")
-    try:
-        for i, file_path in enumerate(file_paths):
-            sanitized_path = file_path.replace("\\", "/"); file_name = os.path.basename(sanitized_path)
-            pos_x = 200; pos_y = i * 150
-            status_callback(f"-> Creating node for '{file_name}'...")
-            mxs_command = f'(local activeView = sme.GetView sme.activeView; if (activeView != undefined) then (local texNode = RGB_image filename:"{sanitized_path}"; texNode.name = "{file_name}"; activeView.CreateNode texNode [ {pos_x}, {pos_y} ]; "OK") else ("FAIL"))'
-            result = rt.execute(mxs_command)
-            if result != "OK": status_callback(f"!!! WARNING: Could not get active SME view. Is the Slate Material Editor open?"); break
-        status_callback("--- Texture Import Complete ---")
-    except Exception as e: status_callback(f"!!! ERROR: An error occurred during import. {e}")
+@traced()
+def make_thumbnail(source_path, size=THUMBNAIL_SIZE):
+    """ Returns a QImage of source_path scaled to fit size x size, or a null QImage when it cannot be read. Image files
+        are decoded at reduced size where the format allows it (JPEG); HDRIs use the tonemapped analysis preview. """
+    if os.path.splitext(source_path)[1].lower() in HDRI_EXTENSIONS:
+        if importlib.util.find_spec("numpy") is None: return QtGui.QImage()
+        try: _, preview, _ = analyze_hdri_cached(source_path)
+        except Exception: return QtGui.QImage()
+        image = QtGui.QImage(preview.tobytes(), preview.shape[1], preview.shape[0], 3 * preview.shape[1], QtGui.QImage.Format.Format_RGB888).copy()
+        return image.scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+    reader = QtGui.QImageReader(source_path)
+    source_size = reader.size()
+    if source_size.isValid(): reader.setScaledSize(source_size.scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull() and max(image.width(), image.height()) > size:
+        image = image.scaled(size, size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+    return image
+
+class ThumbnailCache:
+    """ Two-level thumbnail cache: an in-memory LRU of QImages keyed by source path, used from the UI thread only, and
+        JPEG files on disk keyed by the source path, size and mtime (size and CRC-32 for archive members), read and
+        written by the generator threads.
+        The disk folder is kept under a size budget with LRU eviction. """
+    def __init__(self, cache_dir=None, memory_items=THUMBNAIL_MEMORY_ITEMS, budget_mb=THUMBNAIL_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(THUMBNAIL_DIR_NAME)
+        self.memory_items = memory_items
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._memory = OrderedDict()
+        self._stores = 0; self._lock = threading.Lock()
+
+    def get(self, source_path):
+        """ Returns the thumbnail of source_path from memory (marking it recently used), or None. """
+        image = self._memory.get(source_path)
+        if image is not None: self._memory.move_to_end(source_path)
+        return image
+
+    def put(self, source_path, image):
+        self._memory[source_path] = image; self._memory.move_to_end(source_path)
+        while len(self._memory) > self.memory_items: self._memory.popitem(last=False)
+
+    def memory_bytes(self):
+        return sum(image.sizeInBytes() for image in self._memory.values())
+
+    def disk_path(self, source_path):
+        info = archive_member_info(source_path)
+        if info: stamp = f"{info.file_size}|{info.CRC:08x}"
+        else: st = os.stat(source_path); stamp = f"{st.st_size}|{st.st_mtime_ns}"
+        key = hashlib.sha1(f"{os.path.normcase(os.path.abspath(source_path))}|{stamp}|{THUMBNAIL_SIZE}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.jpg")
+
+    def load_or_create(self, source_path):
+        """ Generator thread: returns the thumbnail from disk, or makes and stores it. Returns a null QImage on failure. """
+        try: path = self.disk_path(source_path)
+        except OSError: return QtGui.QImage()
+        image = QtGui.QImage(path)
+        if not image.isNull():
+            os.utime(path); return image
+        # A member of an archive is extracted (once, into the archive cache) to be decoded.
+        image = make_thumbnail(localize_paths([source_path], mirror=False).get(source_path, source_path))
+        if image.isNull(): return image
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        if image.save(temp_path, "JPG", 85): os.replace(temp_path, path)
+        with self._lock:
+            self._stores += 1; trim = self._stores % 200 == 0
+        if trim: enforce_cache_budget(self.cache_dir, self.budget_bytes)
+        return image
+
+_thumbnail_cache = globals().get("_thumbnail_cache")  # Kept across reloads of this module, like the window
+
+def get_thumbnail_cache():
+    """ Returns the shared ThumbnailCache. """
+    global _thumbnail_cache
+    if _thumbnail_cache is None: _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # +                   SECTION 4: MAIN APPLICATION WINDOW              +
@@ -397,12 +876,36 @@ class AssetManagerUI(QtWidgets.QMainWindow):
         
         self._create_menus()
         self._create_tabs()
+        self.warm_runner = JobRunner(self)
 
     def _create_menus(self):
         help_menu = self.menuBar().addMenu("Help")
         about_action = help_menu.addAction("About")
         about_action.triggered.connect(self.open_about_dialog)
 
+        trace_menu = self.menuBar().addMenu("Tracing")
+        self.trace_action = trace_menu.addAction("Record Performance Trace")
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(GSGTrace.is_enabled())
+        self.trace_action.toggled.connect(self.toggle_tracing)
+        export_action = trace_menu.addAction("Export Trace...")
+        export_action.triggered.connect(self.export_trace)
+
+        mirror_menu = self.menuBar().addMenu("Mirror")
+        self.mirror_action = mirror_menu.addAction("Mirror Network Assets Locally")
+        self.mirror_action.setCheckable(True)
+        self.mirror_action.setToolTip("Copy maps, HDRIs and FBX files from network shares to a local cache and load them from there.")
+        self.mirror_action.toggled.connect(self.toggle_mirror)
+        # The setting lives in the asset index, which is opened after the window is shown; read it when the menu opens.
+        mirror_menu.aboutToShow.connect(lambda: self.mirror_action.setChecked(mirror_enabled()))
+        localize_action = mirror_menu.addAction("Copy Scene Textures to Mirror")
+        localize_action.triggered.connect(lambda: self.current_job_panel().run(iter_localize_scene_textures(self.tabs.currentWidget().log_message)))
+        restore_action = mirror_menu.addAction("Repath Scene to Network Share")
+        restore_action.triggered.connect(lambda: restore_network_textures(self.tabs.currentWidget().log_message))
+        mirror_menu.addSeparator()
+        clear_action = mirror_menu.addAction("Clear Mirror Cache")
+        clear_action.triggered.connect(lambda: clear_mirror_cache(self.tabs.currentWidget().log_message))
+
         links_menu = self.menuBar().addMenu("Links")
         for name, url in LINKS.items():
             action = links_menu.addAction(name)
@@ -412,11 +915,57 @@ class AssetManagerUI(QtWidgets.QMainWindow):
         self.tabs = QtWidgets.QTabWidget()
         self.setCentralWidget(self.tabs)
         
-        self.tabs.addTab(MaterialTab(), "Materials")
-        self.tabs.addTab(HDRITab(), "HDRI")
-        self.tabs.addTab(TextureTab(), "Import Textures")
-        self.tabs.addTab(FBXTab(), "Import FBX")
-        
+        self.browser_page = LazyTab(BrowserTab)
+        self.tabs.addTab(self.browser_page, "Browser")
+        self.tabs.addTab(LazyTab(MaterialTab), "Materials")
+        self.tabs.addTab(LazyTab(HDRITab), "HDRI")
+        self.tabs.addTab(LazyTab(TextureTab), "Import Textures")
+        self.tabs.addTab(LazyTab(FBXTab), "Import FBX")
+
+    def warm_start(self):
+        """ Opens the asset index and caches on a worker thread once the window is up, then reopens the last browsed
+            library in the Browser tab. """
+        if self.warm_runner.is_running(): return
+        get_thumbnail_cache()
+        self.warm_runner.start(self._warm_start_job())
+
+    def _warm_start_job(self):
+        # The log of the tab on screen; its LogSink takes lines from the worker thread.
+        log = self.current_job_panel().log
+        start_time = time.perf_counter()
+        root_folder = yield submit_work(warm_start, log)
+        log(f"Caches ready in {time.perf_counter() - start_time:.2f}s.")
+        browser = self.browser_page.ensure()
+        if root_folder and not browser.selected_folder and not browser.job_panel.runner.is_running(): browser.open_folder(root_folder)
+
+    def current_job_panel(self):
+        return self.tabs.currentWidget().ensure().job_panel
+
+    def toggle_mirror(self, checked):
+        if checked == mirror_enabled(): return
+        set_mirror_enabled(checked)
+        self.tabs.currentWidget().log_message("Network assets will be mirrored locally." if checked else "Network assets will be loaded from the share.")
+
+    def toggle_tracing(self, checked):
+        """ Starts a new recording, or stops the current one and logs its summary to the current tab. """
+        if checked:
+            GSGTrace.enable(); self.tabs.currentWidget().log_message("--- Performance trace recording started ---")
+        else:
+            GSGTrace.disable(); self.log_trace_summary()
+
+    def log_trace_summary(self):
+        log = self.tabs.currentWidget().log_message
+        log("--- Performance trace summary ---")
+        for line in GSGTrace.summary_lines(): log(line)
+
+    def export_trace(self):
+        default_path = os.path.join(get_cache_dir(TRACE_DIR_NAME), time.strftime("gsg_trace_%Y%m%d_%H%M%S.json"))
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Chrome Trace", default_path, "Chrome Trace (*.json)")
+        if not file_path: return
+        event_count = GSGTrace.export_chrome_trace(file_path)
+        self.log_trace_summary()
+        self.tabs.currentWidget().log_message(f"Exported {event_count} trace event(s) to '{file_path}'. Open it in chrome://tracing or ui.perfetto.dev.")
+
     def open_about_dialog(self):
         dialog = AboutDialog(self)
         dialog.exec()
@@ -424,22 +973,31 @@ class AssetManagerUI(QtWidgets.QMainWindow):
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 # +                        SECTION 5: SCRIPT EXECUTION                +
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-_main_window_instance = None
+# The launcher reloads this module on every start; the window survives the reload and is shown again.
+_main_window_instance = globals().get("_main_window_instance")
 
-def main():
+def main(new_window=False):
+    """ Shows the importer window. It is created once per 3ds Max session and only hidden when closed, so later
+        launches show it again with its tabs, logs and browser state. new_window=True replaces it (e.g. after
+        editing the script). Returns the window. """
     global _main_window_instance
-    
-    
-    try:
-        if _main_window_instance:
-            _main_window_instance.close()
-            _main_window_instance.deleteLater()
-    except:
-        pass
-        
-    
-    _main_window_instance = AssetManagerUI()
-    _main_window_instance.show()
+    with span("main"):
+        window = _main_window_instance
+        if window is not None:
+            try:
+                if new_window: window.close(); window.deleteLater(); window = None
+                else: window.isVisible()
+            except RuntimeError:
+                window = None  # Already deleted on the Qt side
+        if window is None:
+            window = _main_window_instance = AssetManagerUI()
+            window.show()
+            QtCore.QTimer.singleShot(0, window.warm_start)
+        else:
+            window.setWindowState(window.windowState() & ~QtCore.Qt.WindowState.WindowMinimized)
+            window.show()
+        window.raise_(); window.activateWindow()
+    return window
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
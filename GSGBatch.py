@@ -0,0 +1,219 @@
+#
+#   GSG Asset Importer unofficial for Octane - headless batch builds
+#   Builds a whole GSG library into a .mat material library with several 3ds Max batch workers (3dsmaxbatch.exe),
+#   without the UI. The scheduler parses the library through the asset index, splits the materials into shards,
+#   runs one worker process per shard (several at a time, retrying failed shards), merges the shard libraries and
+#   writes a JSON report next to the library. A batch build is always a full build; it writes the library manifest,
+#   so later builds from the importer only add what changed.
+#
+#   Usage: python GSGBatch.py <library_folder> [--output GSG_Library.mat] [--workers 4] [--shard-size 250]
+#                             [--retries 2] [--timeout 3600] [--maxbatch "C:/Program Files/Autodesk/3ds Max 2025/3dsmaxbatch.exe"]
+#                             [--worker-command "python benchmarks/batch_worker.py {job}"] [--proxy-tier 1K] [--keep-work]
+#
+#   Worker protocol: every job is a JSON file ({"type": "build" | "merge", ..., "result": <path>}). The worker is
+#   started with the job path (3dsmaxbatch: -mxsString job:<path>) and writes the result JSON atomically to the
+#   "result" path; a job without a result file with "status": "ok" has failed, whatever the exit code.
+#
+#   License: MIT License (see LICENSE)
+#
+
+import os
+import sys
+import json
+import time
+import shlex
+import shutil
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))  # 3dsmaxbatch does not add the script folder
+import GSGCore
+
+# Materials per shard: small enough to balance the workers and make a retry cheap, large enough that the 3ds Max
+# start-up of every worker stays a small part of its run
+SHARD_SIZE = 250
+MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+RETRIES = 2
+SHARD_TIMEOUT_S = 3600
+MAXBATCH_EXE = "3dsmaxbatch.exe"
+BATCH_DIR_NAME = "batch"
+# Log lines kept in a worker's result file
+RESULT_LOG_LINES = 200
+
+
+# --- worker side ---
+
+def _write_json(path, data):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f: json.dump(data, f, indent=1)
+    os.replace(temp_path, path)
+
+
+def run_job_file(job_path):
+    """ Runs one job file inside a worker process and writes its result file. Returns the process exit code. """
+    with open(job_path, 'r', encoding='utf-8') as f: job = json.load(f)
+    log = []
+    def status_callback(message):
+        log.append(str(message)); print(message, flush=True)
+    start_time = time.perf_counter()
+    result = {"status": "error", "job": job["type"], "pid": os.getpid()}
+    try:
+        if not GSGCore.activate_octane_renderer(): raise RuntimeError("Octane is not installed in this 3ds Max.")
+        if job["type"] == "build":
+            chunks = GSGCore.library_chunks(job["materials"], job.get("chunk_size", GSGCore.LIBRARY_CHUNK_SIZE))
+            result["built_indexes"] = GSGCore.run_job(GSGCore.iter_execute_library_chunks(chunks, job["output"], status_callback))
+            result["built"] = len(result["built_indexes"]); result["materials"] = len(job["materials"])
+        elif job["type"] == "merge":
+            result["built"] = GSGCore.merge_material_libraries(job["libraries"], job["output"], status_callback)
+        else:
+            raise ValueError(f"Unknown job type '{job['type']}'.")
+        result["status"] = "ok"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"; status_callback(f"!!! ERROR: {e}")
+    result["seconds"] = time.perf_counter() - start_time; result["log"] = log[-RESULT_LOG_LINES:]
+    _write_json(job["result"], result)
+    return 0 if result["status"] == "ok" else 1
+
+
+def _max_job_argument():
+    """ The job path passed to 3dsmaxbatch with -mxsString job:<path>, or None outside 3ds Max. """
+    if GSGCore.rt is None: return None
+    try: job_path = GSGCore.rt.GetDictValue(GSGCore.rt.maxOps.mxsCmdLineArgs, GSGCore.rt.name("job"))
+    except Exception: return None
+    return str(job_path) if job_path else None
+
+
+# --- scheduler side ---
+
+def maxbatch_command(maxbatch_exe=MAXBATCH_EXE):
+    """ The worker command template for 3dsmaxbatch; {job} and {log} are replaced per job. """
+    return [maxbatch_exe, os.path.abspath(__file__), "-mxsString", "job:{job}", "-listenerlog", "{log}"]
+
+
+def split_shards(materials, shard_size=SHARD_SIZE, workers=1):
+    """ Splits the materials into consecutive shards of at most shard_size. The shard count is rounded up to a multiple
+        of workers and the shards differ by at most one material, so the workers finish their last shards together. """
+    if not materials: return []
+    shard_count = -(-len(materials) // max(1, int(shard_size)))
+    shard_count = min(len(materials), -(-shard_count // workers) * workers)
+    bounds = [len(materials) * i // shard_count for i in range(shard_count + 1)]
+    return [materials[bounds[i]:bounds[i + 1]] for i in range(shard_count)]
+
+
+def run_worker_job(job, job_path, command, retries=RETRIES, timeout=SHARD_TIMEOUT_S, status_callback=print):
+    """ Writes job to job_path and runs the worker command on it until it succeeds, at most retries + 1 times.
+        Returns the last result dict, with the number of attempts. """
+    _write_json(job_path, job)
+    log_path = os.path.splitext(job_path)[0] + ".log"
+    label = os.path.splitext(os.path.basename(job_path))[0]
+    for attempt in range(1, retries + 2):
+        if os.path.exists(job["result"]): os.remove(job["result"])
+        args = [part.replace("{job}", job_path).replace("{log}", log_path) for part in command]
+        start_time = time.perf_counter()
+        try:
+            with open(log_path, 'a', encoding='utf-8') as log_file:
+                process = subprocess.run(args, stdout=log_file, stderr=subprocess.STDOUT, timeout=timeout)
+            returncode = process.returncode
+        except subprocess.TimeoutExpired:
+            returncode = "timeout"
+        except OSError as e:
+            returncode = f"could not start: {e}"
+        try:
+            with open(job["result"], 'r', encoding='utf-8') as f: result = json.load(f)
+        except (OSError, ValueError):
+            result = {"status": "error", "error": f"no result (exit code {returncode})"}
+        if result["status"] == "ok" and job["type"] == "build" and not os.path.isfile(job["output"]):
+            result = {"status": "error", "error": "the worker did not save the shard library"}
+        result["attempts"] = attempt; result["wall"] = time.perf_counter() - start_time
+        if result["status"] == "ok": return result
+        status_callback(f"!!! WARNING: {label} attempt {attempt} failed: {result.get('error')}" + (" - retrying." if attempt <= retries else "."))
+    return result
+
+
+def run_batch(root_folder, output_path=None, workers=MAX_WORKERS, shard_size=SHARD_SIZE, retries=RETRIES, timeout=SHARD_TIMEOUT_S,
+              command=None, chunk_size=GSGCore.LIBRARY_CHUNK_SIZE, proxy_tier=None, work_dir=None, keep_work=False, status_callback=print):
+    """ Builds every GSG material below root_folder (a folder or an archive) into output_path with parallel batch workers.
+        Returns the report, which is also saved as <output>.report.json. """
+    start_time = time.perf_counter()
+    log_lock = threading.Lock(); callback = status_callback
+    def status_callback(message):
+        with log_lock: callback(message)  # Shards report from several threads
+    output_path = os.path.abspath(output_path or GSGCore.default_library_path(root_folder))
+    command = command or maxbatch_command()
+    work_dir = work_dir or GSGCore.get_cache_dir(BATCH_DIR_NAME, time.strftime("%Y%m%d_%H%M%S") + f"_{os.getpid()}")
+    os.makedirs(work_dir, exist_ok=True)
+    status_callback(f"--- Batch build of {root_folder} into {output_path} ---")
+    materials = GSGCore.list_materials(root_folder, status_callback)
+    planned = GSGCore.AssetManifest().plan([GSGCore.material_asset(m, proxy_tier) for m in materials])
+    materials = GSGCore.use_local_maps(materials, status_callback, mirror=False)
+    if proxy_tier: materials = GSGCore.use_proxy_maps(materials, proxy_tier, status_callback)
+    workers = max(1, min(int(workers), len(materials) or 1))
+    shards = split_shards(materials, shard_size, workers)
+    status_callback(f"{len(materials)} material(s) in {len(shards)} shard(s) of up to {max(map(len, shards), default=0)}, {workers} worker(s).")
+
+    def run_shard(index):
+        job_path = os.path.join(work_dir, f"shard_{index:04d}.json")
+        job = {"type": "build", "materials": shards[index], "chunk_size": chunk_size,
+               "output": os.path.join(work_dir, f"shard_{index:04d}.mat"), "result": os.path.join(work_dir, f"shard_{index:04d}.result.json")}
+        result = run_worker_job(job, job_path, command, retries, timeout, status_callback)
+        status_callback(f"-> Shard {index + 1}/{len(shards)}: " + (f"{result['built']}/{len(shards[index])} material(s) in {result['wall']:.1f}s." if result["status"] == "ok" else f"FAILED ({result.get('error')})."))
+        return dict(shard=index, materials=len(shards[index]), output=job["output"], **{k: result.get(k) for k in ("status", "built", "built_indexes", "attempts", "wall", "error")})
+
+    with ThreadPoolExecutor(max_workers=workers) as pool: shard_results = list(pool.map(run_shard, range(len(shards))))
+    build_time = time.perf_counter() - start_time
+    done = [r for r in shard_results if r["status"] == "ok"]
+    report = {"library": output_path, "root": os.path.abspath(root_folder), "materials": len(materials), "shards": shard_results,
+              "failed_shards": [r["shard"] for r in shard_results if r["status"] != "ok"], "workers": workers, "shard_size": shard_size,
+              "built": sum(r["built"] or 0 for r in done), "build_seconds": build_time, "merged": None, "status": "error"}
+    if len(done) == 1:
+        shutil.copyfile(done[0]["output"], output_path); report["merged"] = done[0]["built"]
+    elif done:
+        merge_job = {"type": "merge", "libraries": [r["output"] for r in done], "output": output_path, "result": os.path.join(work_dir, "merge.result.json")}
+        merge = run_worker_job(merge_job, os.path.join(work_dir, "merge.json"), command, retries, timeout, status_callback)
+        if merge["status"] == "ok": report["merged"] = merge["built"]
+        else: status_callback(f"!!! ERROR: Merging the shard libraries failed: {merge.get('error')}")
+    if report["merged"] is not None and not report["failed_shards"]: report["status"] = "ok"
+    if report["status"] == "ok":
+        manifest = GSGCore.AssetManifest(); first = 0
+        for r, shard in zip(shard_results, shards):
+            for i in r["built_indexes"] or []: manifest.record(planned[first + i])
+            first += len(shard)
+        manifest.save(GSGCore.library_manifest_path(output_path))
+    for r in shard_results: r.pop("built_indexes", None)
+    report["seconds"] = time.perf_counter() - start_time
+    report["materials_per_second"] = report["built"] / max(build_time, 1e-6)
+    _write_json(os.path.splitext(output_path)[0] + ".report.json", report)
+    status_callback(f"Built {report['built']}/{len(materials)} material(s) in {report['seconds']:.1f}s ({report['materials_per_second']:.1f} materials/s); "
+                    + (f"{len(report['failed_shards'])} shard(s) failed, kept in {work_dir}." if report["failed_shards"] else "all shards succeeded."))
+    if report["status"] == "ok" and not keep_work: shutil.rmtree(work_dir, ignore_errors=True)
+    status_callback("--- BATCH BUILD COMPLETE ---" if report["status"] == "ok" else "--- BATCH BUILD FAILED ---")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a GSG library into a .mat material library with parallel 3ds Max batch workers.")
+    parser.add_argument("library_folder")
+    parser.add_argument("--output", help=f"material library to write (default: <library_folder>/{GSGCore.LIBRARY_FILE_NAME})")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--retries", type=int, default=RETRIES, help="extra attempts for a failed shard")
+    parser.add_argument("--timeout", type=float, default=SHARD_TIMEOUT_S, help="seconds before a worker is stopped")
+    parser.add_argument("--chunk-size", type=int, default=GSGCore.LIBRARY_CHUNK_SIZE, help="materials per rt.execute call in a worker")
+    parser.add_argument("--proxy-tier", choices=list(GSGCore.PROXY_TIERS), help="build against downscaled proxy textures")
+    parser.add_argument("--maxbatch", default=MAXBATCH_EXE, help="path of 3dsmaxbatch.exe")
+    parser.add_argument("--worker-command", help="worker command instead of 3dsmaxbatch; {job} and {log} are replaced per job")
+    parser.add_argument("--keep-work", action="store_true", help="keep the job, shard and log files")
+    args = parser.parse_args(argv)
+    command = shlex.split(args.worker_command) if args.worker_command else maxbatch_command(args.maxbatch)
+    report = run_batch(args.library_folder, args.output, args.workers, args.shard_size, args.retries, args.timeout, command,
+                       args.chunk_size, args.proxy_tier, keep_work=args.keep_work)
+    return 0 if report["status"] == "ok" else 1
+
+
+if __name__ == "__main__":
+    job_path = _max_job_argument()
+    if job_path: run_job_file(job_path)
+    else: sys.exit(main())
@@ -0,0 +1,1937 @@
+#
+#   GSG Asset Importer unofficial for Octane - core logic
+#   Asset discovery, the index and caches, background jobs and the 3ds Max operations behind the importer tabs.
+#   No Qt imports, so it loads quickly and can be scripted and benchmarked without a UI; pymxs is optional outside
+#   3ds Max. The shared index, caches and worker pool live here for the whole 3ds Max session: the launcher
+#   reloads GSGAssetImporter on every start, but not this module.
+#
+#   License: MIT License (see LICENSE)
+#
+
+import os
+import re
+import math
+import json
+import time
+import hashlib
+import functools
+import sys
+import shutil
+import sqlite3
+import threading
+import zipfile
+import importlib.util
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+try:
+    from pymxs import runtime as rt
+except ImportError:
+    rt = None  # Outside 3ds Max (benchmarks and tooling); callers provide their own runtime.
+from GSGMaxScript import ScriptBuilder, mxs_path, mxs_string, tag_code, COLOR_GAMMA, LINEAR_GAMMA, TAG_APPDATA_ID, RECORD_APPDATA_ID
+from GSGHDRI import ANALYSIS_VERSION, analyze_hdri, suggest_power, suggest_rotation
+from GSGTrace import span, traced, count
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                        SECTION 1: CONSTANTS                       +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+# Texture maps detected in a GSG folder, keyed by the material slot they feed. Keywords are matched against whole
+# filename tokens; the last matching token decides and priority breaks ties between keywords ending on the same token.
+MAP_KEYWORDS = {
+    "albedo": {"keywords": ["albedo", "basecolor", "diffuse", "diff", "col", "color", "colour"], "priority": 10},
+    "roughness": {"keywords": ["roughness", "rough", "rgh"], "priority": 30},
+    "normal": {"keywords": ["normal", "normalgl", "normalmap", "nrm", "nor"], "priority": 30},
+    "metallic": {"keywords": ["metallic", "metalness", "metal", "met"], "priority": 30},
+    "displacement": {"keywords": ["displacement", "displace", "height", "disp"], "priority": 20},
+    "scattering_weight": {"keywords": ["scatteringweight"], "priority": 40},
+    "scattering_distance": {"keywords": ["scatteringdistancescale", "scatteringdistance"], "priority": 40},
+}
+MAP_EXTENSIONS = ['.jpg', '.png', '.jpeg', '.tif', '.exr']
+# Resolution tier (in K) preferred when a folder ships 1K/2K/4K variants of a map; None picks the largest
+PREFERRED_MAP_RESOLUTION = None
+TEXTURE_EXTENSIONS = ['.jpg', '.png', '.tif', '.tiff', '.exr', '.hdr']
+
+# GSG standard_surface parameters: json key -> (Std_Surface_Mtl property, map that replaces it, is a color)
+MATERIAL_PARAMS = {'base_color': ('baseColor_color', 'albedo', True), 'specular_roughness': ('roughness_value', 'roughness', False), 'metallic': ('metallic_value', 'metallic', False), 'transmission': ('transmission_value', None, False), 'transmission_color': ('transmissionColor_color', None, True), 'specular_IOR': ('ior_value', None, False), 'scattering_weight': ('scattering_color', 'scattering_weight', True), 'scatteringdistancescale': ('radius_value', 'scattering_distance', False)}
+# Detected maps: (map slot, Std_Surface_Mtl texture property, bitmap gamma); displacement goes through a Texture_displacement
+MATERIAL_MAP_SLOTS = [("albedo", "baseColor_tex", COLOR_GAMMA), ("roughness", "roughness_tex", LINEAR_GAMMA), ("metallic", "metallic_tex", LINEAR_GAMMA), ("normal", "normal_tex", LINEAR_GAMMA), ("displacement", "displacement", LINEAR_GAMMA), ("scattering_weight", "scattering_tex", COLOR_GAMMA), ("scattering_distance", "radius_tex", LINEAR_GAMMA)]
+
+# Slate Material Editor grid of imported texture sets: one cell per set, its bitmap nodes stacked in a column (one row
+# each) and its material in a second column
+NODE_GRID_ORIGIN = (200, 100)
+NODE_GRID_ROW = 110
+NODE_GRID_COLUMN = 260
+NODE_GRID_GAP = 80
+
+# Library builds submit this many materials per rt.execute call
+LIBRARY_CHUNK_SIZE = 200
+LIBRARY_FILE_NAME = "GSG_Library.mat"
+
+# Per-user cache folder (under %LOCALAPPDATA%) and the asset index stored in it
+CACHE_DIR_NAME = "GSGAssetImporter"
+INDEX_FILE_NAME = "asset_index.sqlite"
+MAP_RULES_FILE_NAME = "map_rules.json"
+
+# Background jobs: worker threads for filesystem work (discovery, parsing, hashing)
+JOB_WORKER_THREADS = 8
+
+# Downscaled texture proxies for interactive work: tier name -> longest side in pixels
+PROXY_TIERS = {"512": 512, "1K": 1024, "2K": 2048}
+PROXY_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.tif', '.tiff']
+PROXY_CACHE_BUDGET_MB = 4096
+PROXY_DIR_NAME = "proxies"
+# FBX import cache: translated FBX files are kept as .max scenes and merged on later imports. The cache key covers the
+# FBX content and these FBXImporterGetParam settings (plus system units and the 3ds Max version).
+FBX_CACHE_DIR_NAME = "fbx_cache"
+FBX_CACHE_BUDGET_MB = 8192
+FBX_SETTINGS_PARAMS = ["Mode", "Animation", "BakeAnimationLayers", "Cameras", "Lights", "Skin", "Shape", "SmoothingGroups",
+                       "GenerateLightmapUVs", "ConvertUnit", "ScaleConversion", "ScaleFactor", "UpAxis", "AxisConversion"]
+
+# HDRI analysis: statistics and previews are cached per file. Auto exposure sets the environment power so the
+# log-average luminance becomes HDRI_TARGET_KEY; the rotation suggestion moves the sun to HDRI_SUN_AZIMUTH degrees
+# from the center of the image.
+HDRI_CACHE_DIR_NAME = "hdri"
+HDRI_CACHE_BUDGET_MB = 256
+HDRI_TARGET_KEY = 0.5
+HDRI_SUN_AZIMUTH = 45.0
+HDRI_EXTENSIONS = ['.hdr', '.exr']
+
+# Bytes hashed at each end of a file by file_digest()
+DIGEST_SAMPLE_BYTES = 64 * 1024
+
+# Local mirror of assets on network shares (opt-in)
+MIRROR_DIR_NAME = "mirror"
+MIRROR_CACHE_BUDGET_MB = 32768
+MIRROR_COPY_THREADS = 4
+MIRROR_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Members of zipped asset packs, extracted on demand
+ARCHIVE_DIR_NAME = "archives"
+ARCHIVE_CACHE_BUDGET_MB = 16384
+ARCHIVE_EXTRACT_THREADS = 4
+
+# Manifest written next to a material library: <library>.manifest.json
+MANIFEST_SUFFIX = ".manifest.json"
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                 SECTION 2: TEXTURE MAP CLASSIFICATION             +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+_CAMEL_SPLIT = re.compile(r"(?<=[a-z])(?=[A-Z])|(?<=[A-Za-z])(?=[0-9])")
+_RESOLUTION_TOKEN = re.compile(r"^(\d{1,2})k$|^(512|1024|2048|4096|8192|16384)$")
+# Tokens that may follow the map suffix besides the resolution: color space, normal map convention, bit depth, version,
+# variant and plain numbers ('Oak_BaseColor_4K_sRGB', 'Brick_Normal_OpenGL', 'Wood_COL_VAR1', 'tex_albedo_01')
+_SUFFIX_TRAILING_TOKEN = re.compile(r"^(?:srgb|linear|acescg|gl|dx|ogl|opengl|directx|\d+bits?|\d+f|v\d+|var\d+|\d+)$")
+# Last tokens of maps without a material slot: their name never falls back to a map word further left ('Rough_Concrete_AO')
+_UNMAPPED_SUFFIXES = {"ao", "occlusion", "ambientocclusion", "cavity", "preview", "thumb", "thumbnail", "opacity", "mask", "alpha", "id", "specular", "spec", "gloss", "glossiness", "bump", "emissive", "emission", "sheen", "translucency"}
+
+class MapClassifier:
+    """ Sorts texture filenames into material map slots.
+        Every filename is tokenized once and its tokens are looked up in a keyword index built from the rules, so a
+        folder is classified in a single linear pass. When several files land in the same slot, the resolution closest
+        to preferred_resolution wins, then the MAP_EXTENSIONS order, then the name, so the result never depends on
+        directory listing order. """
+    # Bumped when the matching rules change, so classifications cached with the old rules are redone
+    RULES_VERSION = 3
+
+    def __init__(self, rules=None, preferred_resolution=PREFERRED_MAP_RESOLUTION, extensions=MAP_EXTENSIONS):
+        self.preferred_resolution = preferred_resolution
+        self.extensions = [e.lower() for e in extensions]
+        self._keywords = {}
+        for map_type, rule in (rules or MAP_KEYWORDS).items():
+            self.add_rule(map_type, rule["keywords"], rule.get("priority", 0))
+
+    def add_rule(self, map_type, keywords, priority=0):
+        """ Registers keywords for a map slot. A keyword claimed by several slots keeps the highest priority one. """
+        for keyword in keywords:
+            keyword = _TOKEN_SPLIT.sub("", keyword.lower())
+            if keyword and (keyword not in self._keywords or self._keywords[keyword][1] <= priority):
+                self._keywords[keyword] = (map_type, priority)
+
+    def signature(self):
+        """ A stable fingerprint of the rules and preferences, used to invalidate cached classifications. """
+        payload = json.dumps([self.RULES_VERSION, sorted(self._keywords.items()), self.preferred_resolution, self.extensions])
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def tokenize(filename):
+        """ Splits a filename stem into lower-case tokens on separators and camelCase boundaries ('Wood_BaseColor_4K' -> wood, base, color, 4k). """
+        stem = os.path.splitext(os.path.basename(filename))[0]
+        return [t for t in _TOKEN_SPLIT.split(_CAMEL_SPLIT.sub(" ", stem).lower()) if t]
+
+    @staticmethod
+    def resolution_of(tokens):
+        """ Returns the resolution tier in K (0.5, 1, 2, 4, ...) named by the tokens, or None. """
+        for token in reversed(tokens):
+            match = _RESOLUTION_TOKEN.match(token)
+            if match: return int(match.group(1)) if match.group(1) else int(match.group(2)) / 1024
+        return None
+
+    @staticmethod
+    def suffix_end(tokens):
+        """ Index of the token the map suffix ends on: the last one that is no resolution, color space, bit depth, version
+            or number. Such tokens can be split by tokenize ('sRGB' -> s, rgb; 'VAR1' -> var, 1), so pairs are tried first. """
+        end = len(tokens) - 1
+        while end >= 0:
+            if end >= 1 and _SUFFIX_TRAILING_TOKEN.match(tokens[end - 1] + tokens[end]): end -= 2
+            elif _RESOLUTION_TOKEN.match(tokens[end]) or _SUFFIX_TRAILING_TOKEN.match(tokens[end]): end -= 1
+            else: break
+        return end
+
+    def _keyword_ending(self, tokens, end):
+        """ The best keyword ending on tokens[end] as (map_type, priority, first token), or None. Single tokens plus
+            the pairs and triples ending there, so 'base_color' and 'BaseColor' both hit 'basecolor'; priority decides
+            between keywords, then the longer keyword. """
+        best = None
+        for start in range(max(0, end - 2), end + 1):
+            hit = self._keywords.get("".join(tokens[start:end + 1]))
+            if hit and (best is None or (hit[1], -start) > (best[1], -best[2])): best = (hit[0], hit[1], start)
+        return best
+
+    def _match(self, tokens):
+        """ Returns the map keyword of the tokens as (map_type, priority, first token), or None.
+            A keyword in suffix position wins, so words of the asset name do not take a slot ('Brushed_Metal_Albedo' is
+            albedo). Without one the right-most keyword counts ('Oak_Roughness_Detail'), unless the name ends on a map
+            without a slot ('Rough_Concrete_AO' and 'Gold_Metal_Preview' are no maps). """
+        end = self.suffix_end(tokens)
+        if end < 0: return None
+        best = self._keyword_ending(tokens, end)
+        if best or tokens[end] in _UNMAPPED_SUFFIXES: return best
+        for end in range(end - 1, -1, -1):
+            best = self._keyword_ending(tokens, end)
+            if best: return best
+        return None
+
+    def classify(self, filename):
+        """ Returns (map_type, resolution) for one filename; map_type is None for unsupported or unrecognized files. """
+        return self.split_name(filename)[1:]
+
+    def split_name(self, filename):
+        """ Returns (stem, map_type, resolution) for one filename. The stem is the tuple of tokens before the map
+            suffix, without resolution tokens ('Oak_01_BaseColor_4K.jpg' -> ('oak', '01')); for a file without a
+            suffix it is every token but the resolution and map_type is None. """
+        tokens = self.tokenize(filename)
+        resolution = self.resolution_of(tokens)
+        best = self._match(tokens) if filename.lower().endswith(tuple(self.extensions)) else None
+        stem = tuple(t for t in (tokens[:best[2]] if best else tokens) if not _RESOLUTION_TOKEN.match(t))
+        return stem, (best[0] if best else None), resolution
+
+    def _rank(self, filename, resolution):
+        preferred = self.preferred_resolution
+        if resolution is None: tier = (1, 0)
+        elif preferred is None: tier = (0, -resolution)
+        elif resolution == preferred: tier = (0, 0)
+        elif resolution < preferred: tier = (2, preferred - resolution)
+        else: tier = (3, resolution - preferred)
+        extension = os.path.splitext(filename)[1].lower()
+        return (tier, self.extensions.index(extension) if extension in self.extensions else len(self.extensions), len(filename), filename.lower())
+
+    @traced("classify_maps")
+    def classify_folder(self, folder_path, filenames):
+        """ Classifies all files of a folder in one pass and returns the texture set as
+            {"maps": {slot: path}, "resolutions": {slot: tier}, "unclassified": [filename, ...]}. """
+        best = {}; unclassified = []
+        for filename in filenames:
+            map_type, resolution = self.classify(filename)
+            if map_type is None:
+                unclassified.append(filename); continue
+            rank = self._rank(filename, resolution)
+            if map_type not in best or rank < best[map_type][0]: best[map_type] = (rank, filename, resolution)
+        return {
+            "maps": {map_type: os.path.join(folder_path, filename) for map_type, (_, filename, _) in best.items()},
+            "resolutions": {map_type: resolution for map_type, (_, _, resolution) in best.items()},
+            "unclassified": unclassified,
+        }
+
+def _texture_set_name(filename, stem, folder):
+    """ The stem as written in filename ('Oak_01' for 'Oak_01_BaseColor_4K.jpg'), or the folder name for an empty stem. """
+    if not stem: return os.path.basename(folder) or "Texture Set"
+    match = re.match(r"[^A-Za-z0-9]*".join(map(re.escape, stem)), filename, re.IGNORECASE)
+    return match.group(0) if match else "_".join(stem)
+
+@traced()
+def group_texture_sets(file_paths):
+    """ Groups texture files into texture sets: the files of one folder whose names share the stem before the map
+        keyword ('Oak_01_BaseColor_4K.jpg', 'Oak_01_Roughness_4K.jpg'). A file that is not a map joins the set whose
+        stem starts its name (an AO or preview map, say) or becomes a set of its own. Returns the sets sorted by
+        folder and name as {"name", "folder", "maps": {slot: path}, "files": [(path, slot or None), ...]}, with the
+        best ranked file of every slot in maps. """
+    classifier = get_map_classifier()
+    sets = {}; loose = []; slot_order = {slot: i for i, slot in enumerate(MAP_KEYWORDS)}
+    for path in dict.fromkeys(file_paths):
+        folder, filename = os.path.split(str(path).replace("\\", "/"))
+        stem, map_type, resolution = classifier.split_name(filename)
+        key = (os.path.normcase(folder), stem)
+        if map_type is None: loose.append((key, path, folder, filename)); continue
+        texture_set = sets.setdefault(key, {"name": _texture_set_name(filename, stem, folder), "folder": folder, "files": [], "ranks": {}})
+        texture_set["files"].append((path, map_type))
+        rank = classifier._rank(filename, resolution)
+        if map_type not in texture_set["ranks"] or rank < texture_set["ranks"][map_type][0]: texture_set["ranks"][map_type] = (rank, path)
+    for (folder_key, stem), path, folder, filename in loose:
+        owner = next((sets[(folder_key, stem[:n])] for n in range(len(stem), 0, -1) if (folder_key, stem[:n]) in sets), None)
+        if owner is None: owner = sets.setdefault((folder_key, stem), {"name": _texture_set_name(filename, stem, folder), "folder": folder, "files": [], "ranks": {}})
+        owner["files"].append((path, None))
+    result = []
+    for texture_set in sets.values():
+        ranks = texture_set.pop("ranks")
+        texture_set["maps"] = {slot: path for slot, (_, path) in ranks.items()}
+        texture_set["files"].sort(key=lambda f: (slot_order.get(f[1], len(slot_order)), os.path.basename(f[0]).lower()))
+        result.append(texture_set)
+    count("texture_sets", len(result))
+    return sorted(result, key=lambda s: (s["folder"].lower(), s["name"].lower()))
+
+def layout_texture_sets(texture_sets, with_materials=False):
+    """ Returns the top left corner of a grid cell for every texture set. A cell is one NODE_GRID_ROW per file high
+        (plus NODE_GRID_GAP) and one NODE_GRID_COLUMN wide, two with a material; the column count keeps the grid
+        about as wide as it is high. """
+    if not texture_sets: return []
+    width = NODE_GRID_COLUMN * (2 if with_materials else 1) + NODE_GRID_GAP
+    heights = [max(1, len(s["files"])) * NODE_GRID_ROW + NODE_GRID_GAP for s in texture_sets]
+    row_heights = lambda columns: [max(heights[first:first + columns]) for first in range(0, len(heights), columns)]
+    columns = max(1, min(len(heights), round(math.sqrt(sum(heights) / width))))
+    # A row is as high as its tallest cell, so one correction step brings the grid back to about square.
+    columns = max(1, min(len(heights), round(columns * math.sqrt(sum(row_heights(columns)) / (columns * width)))))
+    positions = []; y = NODE_GRID_ORIGIN[1]
+    for first, row_height in zip(range(0, len(heights), columns), row_heights(columns)):
+        positions += [(NODE_GRID_ORIGIN[0] + i * width, y) for i in range(len(heights[first:first + columns]))]
+        y += row_height
+    return positions
+
+# Guards the creation of the shared classifier, index, caches and worker pool, which warm_start() opens on a worker thread
+_shared_lock = threading.RLock()
+_map_classifier = None
+
+def get_map_classifier():
+    """ Returns the shared MapClassifier, built from MAP_KEYWORDS plus the optional user rules in the cache folder.
+        User rules use the MAP_KEYWORDS layout, e.g. {"albedo": {"keywords": ["farbe"], "priority": 15}}. """
+    global _map_classifier
+    with _shared_lock:
+        if _map_classifier is None:
+            classifier = MapClassifier()
+            rules_path = os.path.join(get_cache_dir(), MAP_RULES_FILE_NAME)
+            if os.path.isfile(rules_path):
+                try:
+                    with open(rules_path, 'r', encoding='utf-8') as f: user_rules = json.load(f)
+                    for map_type, rule in user_rules.items(): classifier.add_rule(map_type, rule["keywords"], rule.get("priority", 0))
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    print(f"!!! WARNING: Ignoring invalid map rules in '{rules_path}'. {e}")
+            _map_classifier = classifier
+    return _map_classifier
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                     SECTION 3: ASSET LIBRARY INDEX                +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def get_cache_dir(*parts):
+    """ Returns (and creates) a folder inside the per-user GSG Importer cache. """
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, CACHE_DIR_NAME, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _index_key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+def _subtree_args(root_key):
+    """ Query arguments matching root_key and every key below it; substr() avoids LIKE wildcards in '_' path names. """
+    prefix = root_key.rstrip(os.sep) + os.sep
+    return (root_key, len(prefix), prefix)
+
+@traced("scan_folder")
+def _scan_folder(folder_path, known_mtime_ns=None):
+    """ Lists one folder with a single scandir pass. Returns None when the folder's mtime still matches known_mtime_ns. """
+    folder_mtime_ns = os.stat(folder_path).st_mtime_ns
+    count("folders_checked")
+    if folder_mtime_ns == known_mtime_ns: return None
+    files = []; subfolders = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False): subfolders.append(entry.path)
+            elif entry.is_file():
+                st = entry.stat()
+                files.append((entry.name, st.st_size, st.st_mtime_ns))
+    files.sort(); subfolders.sort()
+    count("folders_scanned"); count("files_scanned", len(files))
+    gsgm = next((name for name, _, _ in files if name.lower().endswith('.gsgm')), None)
+    material = None
+    if gsgm:
+        material = _parse_gsgm(os.path.join(folder_path, gsgm), folder_path)
+        material["maps"] = detect_material_maps(folder_path, [name for name, _, _ in files])
+    return {"mtime_ns": folder_mtime_ns, "files": files, "subfolders": subfolders, "gsgm": gsgm, "material": material}
+
+class AssetIndex:
+    """ A persistent SQLite index of GSG asset folders, their parsed .gsgm data, detected maps and file stats.
+        Refreshes only rescan folders whose mtime changed since the last visit. """
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_cache_dir(), INDEX_FILE_NAME)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS folders (key TEXT PRIMARY KEY, path TEXT, mtime_ns INTEGER, subfolders TEXT,
+                gsgm TEXT, gsgm_size INTEGER, gsgm_mtime_ns INTEGER, name TEXT, params TEXT, maps TEXT);
+            CREATE TABLE IF NOT EXISTS files (folder TEXT, name TEXT, size INTEGER, mtime_ns INTEGER, PRIMARY KEY (folder, name));
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        self._reclassify_if_rules_changed()
+
+    def _reclassify_if_rules_changed(self):
+        """ Re-detects the stored maps from the indexed file lists when the classifier rules changed, without touching the disk. """
+        classifier = get_map_classifier(); signature = classifier.signature()
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key='classifier'").fetchone()
+            if row and row[0] == signature: return
+            for key, path in self._db.execute("SELECT key, path FROM folders WHERE gsgm IS NOT NULL").fetchall():
+                names = [name for (name,) in self._db.execute("SELECT name FROM files WHERE folder=?", (key,))]
+                self._db.execute("UPDATE folders SET maps=? WHERE key=?", (json.dumps(classifier.classify_folder(path, names)["maps"]), key))
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('classifier', ?)", (signature,))
+            self._db.commit()
+
+    def close(self):
+        with self._lock: self._db.close()
+
+    def setting(self, name, default=None):
+        """ Returns a value remembered with set_setting(), e.g. the last browsed library folder. """
+        with self._lock: row = self._db.execute("SELECT value FROM meta WHERE key=?", (f"setting:{name}",)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_setting(self, name, value):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (f"setting:{name}", json.dumps(value)))
+            self._db.commit()
+
+    def _store(self, key, folder_path, scan):
+        material = scan["material"] or {}
+        gsgm_size, gsgm_mtime_ns = next(((size, mtime) for name, size, mtime in scan["files"] if name == scan["gsgm"]), (None, None))
+        self._db.execute("INSERT OR REPLACE INTO folders VALUES (?,?,?,?,?,?,?,?,?,?)", (
+            key, folder_path, scan["mtime_ns"], json.dumps(scan["subfolders"]), scan["gsgm"], gsgm_size, gsgm_mtime_ns,
+            material.get("name"), json.dumps(material.get("params")), json.dumps(material.get("maps"))))
+        self._db.execute("DELETE FROM files WHERE folder=?", (key,))
+        self._db.executemany("INSERT INTO files VALUES (?,?,?,?)", [(key, name, size, mtime) for name, size, mtime in scan["files"]])
+
+    def _revalidate_gsgm(self, key, row):
+        """ A .gsgm edited in place does not touch the folder mtime, so its own stat is checked as well. """
+        folder_path, gsgm, gsgm_size, gsgm_mtime_ns = row
+        if not gsgm: return False
+        gsgm_path = os.path.join(folder_path, gsgm)
+        try: st = os.stat(gsgm_path)
+        except OSError: return False
+        if (st.st_size, st.st_mtime_ns) == (gsgm_size, gsgm_mtime_ns): return False
+        material = _parse_gsgm(gsgm_path, folder_path)
+        self._db.execute("UPDATE folders SET gsgm_size=?, gsgm_mtime_ns=?, name=?, params=? WHERE key=?", (st.st_size, st.st_mtime_ns, material["name"], json.dumps(material["params"]), key))
+        return True
+
+    @traced("index_refresh")
+    def refresh(self, root_folder, status_callback=None, max_workers=None):
+        """ Brings the index for root_folder up to date, one directory level at a time, scanning changed folders in parallel.
+            Returns counters for the folders visited, rescanned and removed. """
+        start_time = time.perf_counter()
+        stats = {"folders": 0, "rescanned": 0, "removed": 0, "seconds": 0.0}
+        root_key = _index_key(root_folder)
+        seen = set(); level = [os.path.abspath(root_folder)]
+        with self._lock, ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while level:
+                keys = [_index_key(p) for p in level]
+                rows = {k: self._db.execute("SELECT mtime_ns, subfolders, path, gsgm, gsgm_size, gsgm_mtime_ns FROM folders WHERE key=?", (k,)).fetchone() for k in keys}
+                futures = [pool.submit(_scan_folder, p, rows[k][0] if rows[k] else None) for p, k in zip(level, keys)]
+                next_level = []
+                for folder_path, key, future in zip(level, keys, futures):
+                    try: scan = future.result()
+                    except OSError: continue
+                    except (ValueError, UnicodeDecodeError) as e:
+                        if status_callback: status_callback(f"!!! WARNING: Skipped '{folder_path}'. {e}")
+                        continue
+                    seen.add(key); stats["folders"] += 1
+                    if scan is None:
+                        subfolders = json.loads(rows[key][1])
+                        if self._revalidate_gsgm(key, rows[key][2:]): stats["rescanned"] += 1
+                    else:
+                        self._store(key, folder_path, scan); subfolders = scan["subfolders"]; stats["rescanned"] += 1
+                    next_level.extend(subfolders)
+                level = next_level
+            stale = [k for (k,) in self._db.execute("SELECT key FROM folders WHERE key=? OR substr(key, 1, ?)=?", _subtree_args(root_key)) if k not in seen]
+            for key in stale:
+                self._db.execute("DELETE FROM folders WHERE key=?", (key,)); self._db.execute("DELETE FROM files WHERE folder=?", (key,))
+            stats["removed"] = len(stale)
+            self._db.commit()
+        stats["seconds"] = time.perf_counter() - start_time
+        if status_callback: status_callback(f"Index refreshed: {stats['folders']} folder(s), {stats['rescanned']} rescanned, {stats['removed']} removed in {stats['seconds']:.2f}s.")
+        return stats
+
+    def _refresh_folder(self, folder_path):
+        """ Revalidates a single folder (one stat when unchanged) without walking below it. """
+        key = _index_key(folder_path)
+        with self._lock:
+            row = self._db.execute("SELECT mtime_ns, path, gsgm, gsgm_size, gsgm_mtime_ns FROM folders WHERE key=?", (key,)).fetchone()
+            scan = _scan_folder(os.path.abspath(folder_path), row[0] if row else None)
+            if scan is not None: self._store(key, os.path.abspath(folder_path), scan)
+            else: self._revalidate_gsgm(key, row[1:])
+            self._db.commit()
+        return key
+
+    def material(self, folder_path, refresh=True):
+        """ Returns the parsed material record of a GSG folder, or None when the folder has no .gsgm file. """
+        key = self._refresh_folder(folder_path) if refresh else _index_key(folder_path)
+        with self._lock:
+            row = self._db.execute("SELECT path, gsgm, name, params, maps FROM folders WHERE key=?", (key,)).fetchone()
+        if not row or not row[1]: return None
+        return {"folder": row[0], "name": row[2], "params": json.loads(row[3]) or {}, "maps": json.loads(row[4]) or {}, "gsgm": os.path.join(row[0], row[1])}
+
+    def materials(self, root_folder, refresh=True, status_callback=None, max_workers=None):
+        """ Returns the material records of every GSG folder below root_folder, sorted by path. """
+        if refresh: self.refresh(root_folder, status_callback, max_workers)
+        root_key = _index_key(root_folder)
+        with self._lock:
+            rows = self._db.execute("SELECT path, gsgm, name, params, maps FROM folders WHERE gsgm IS NOT NULL AND (key=? OR substr(key, 1, ?)=?) ORDER BY key", _subtree_args(root_key)).fetchall()
+        return [{"folder": path, "name": name, "params": json.loads(params) or {}, "maps": json.loads(maps) or {}, "gsgm": os.path.join(path, gsgm)} for path, gsgm, name, params, maps in rows]
+
+    def files(self, folder_path, extensions=None, refresh=True):
+        """ Returns the full paths of the files in one folder, optionally filtered by lower-case extension. """
+        key = self._refresh_folder(folder_path) if refresh else _index_key(folder_path)
+        with self._lock:
+            row = self._db.execute("SELECT path FROM folders WHERE key=?", (key,)).fetchone()
+            names = [name for (name,) in self._db.execute("SELECT name FROM files WHERE folder=? ORDER BY name", (key,))]
+        if not row: return []
+        return [os.path.join(row[0], name) for name in names if not extensions or name.lower().endswith(tuple(extensions))]
+
+    def files_below(self, root_folder, extensions=None, status_callback=None):
+        """ Refreshes root_folder and returns the full paths of all files below it, sorted by path. """
+        self.refresh(root_folder, status_callback)
+        with self._lock:
+            rows = self._db.execute("SELECT folders.path, files.name FROM files JOIN folders ON files.folder = folders.key WHERE folders.key=? OR substr(folders.key, 1, ?)=? ORDER BY folders.key, files.name",
+                                    _subtree_args(_index_key(root_folder))).fetchall()
+        return [os.path.join(path, name) for path, name in rows if not extensions or name.lower().endswith(tuple(extensions))]
+
+_asset_index = None
+
+def get_asset_index():
+    """ Returns the shared AssetIndex, opening it on first use. """
+    global _asset_index
+    with _shared_lock:
+        if _asset_index is None: _asset_index = AssetIndex()
+    return _asset_index
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                   SECTION 4: TEXTURE PROXY CACHE                  +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@traced()
+def file_digest(file_path, full=False):
+    """ Returns a content hash of a file. By default only the size and the first and last 64 KB are hashed, which
+        identifies GSG maps reliably without reading multi-gigabyte files; full=True hashes the whole content. """
+    sha = hashlib.sha1()
+    size = os.path.getsize(file_path)
+    sha.update(str(size).encode("ascii"))
+    with open(file_path, 'rb') as f:
+        if full or size <= 2 * DIGEST_SAMPLE_BYTES:
+            for block in iter(lambda: f.read(1024 * 1024), b""): sha.update(block)
+            count("bytes_hashed", size)
+        else:
+            sha.update(f.read(DIGEST_SAMPLE_BYTES)); f.seek(-DIGEST_SAMPLE_BYTES, os.SEEK_END); sha.update(f.read(DIGEST_SAMPLE_BYTES))
+            count("bytes_hashed", 2 * DIGEST_SAMPLE_BYTES)
+    return sha.hexdigest()
+
+def enforce_cache_budget(cache_dir, budget_bytes, keep=()):
+    """ Deletes the least recently used files (oldest mtime first) until cache_dir fits in budget_bytes.
+        Cache hits touch their file, so the mtime doubles as the LRU clock. Returns (files removed, bytes freed). """
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and entry.path not in keep:
+                st = entry.stat(); entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries) + sum(os.path.getsize(p) for p in keep if os.path.isfile(p))
+    removed = 0; freed = 0
+    for _, size, path in sorted(entries):
+        if total <= budget_bytes: break
+        try: os.remove(path)
+        except OSError: continue
+        total -= size; removed += 1; freed += size
+    return removed, freed
+
+def _process_pool(max_workers=None):
+    """ A spawn-based process pool that also works inside 3ds Max, where sys.executable is 3dsmax.exe and not Python. """
+    context = multiprocessing.get_context("spawn")
+    if not os.path.basename(sys.executable).lower().startswith("python"):
+        context.set_executable(os.path.join(sys.exec_prefix, "python.exe"))
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+
+def _generate_proxy(source_path, proxy_path, size):
+    """ Process pool worker: writes a copy of source_path downscaled to fit size x size. Returns (bytes read, bytes written),
+        or (bytes read, 0) when the source is already small enough to be used as is. """
+    from PIL import Image
+    bytes_read = os.path.getsize(source_path)
+    with Image.open(source_path) as image:
+        if max(image.size) <= size: return bytes_read, 0
+        image_format = image.format
+        if image_format == "JPEG": image.draft("RGB", (size, size))  # Let the decoder skip full-resolution DCT blocks.
+        if image.mode.startswith("I;16"): image = image.convert("I")
+        image.thumbnail((size, size), Image.LANCZOS)
+        temp_path = proxy_path + ".tmp"
+        image.save(temp_path, format=image_format, **({"quality": 90} if image_format == "JPEG" else {}))
+    os.replace(temp_path, proxy_path)
+    return bytes_read, os.path.getsize(proxy_path)
+
+class ProxyCache:
+    """ A content-addressed cache of downscaled texture proxies, generated in a process pool and kept under a size budget
+        with LRU eviction. A proxy is keyed by the sampled digest plus the mtime of its source, so an edit that keeps
+        the size and both ends of a map still makes a new proxy. sources.json maps every proxy file back to its
+        full-resolution source, also after the proxy was evicted, since scenes may still point at it.
+        full_resolution.json lists the keys of maps already at or below a tier, which need no proxy. """
+    def __init__(self, cache_dir=None, budget_mb=PROXY_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(PROXY_DIR_NAME)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._sources_path = os.path.join(self.cache_dir, "sources.json")
+        self._full_resolution_path = os.path.join(self.cache_dir, "full_resolution.json")
+        try:
+            with open(self._sources_path, 'r', encoding='utf-8') as f: self.sources = json.load(f)
+        except (OSError, ValueError):
+            self.sources = {}
+        try:
+            with open(self._full_resolution_path, 'r', encoding='utf-8') as f: self.full_resolution = set(json.load(f))
+        except (OSError, ValueError):
+            self.full_resolution = set()
+
+    def _save_sources(self):
+        for path, data in ((self._sources_path, self.sources), (self._full_resolution_path, sorted(self.full_resolution))):
+            temp_path = path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f: json.dump(data, f)
+            os.replace(temp_path, path)
+
+    def source_of(self, proxy_path):
+        """ Returns the full-resolution source of a proxy file, or None when the path is not a proxy. """
+        if os.path.normcase(os.path.dirname(os.path.abspath(proxy_path))) != os.path.normcase(os.path.abspath(self.cache_dir)): return None
+        return self.sources.get(os.path.basename(proxy_path))
+
+    def ensure(self, source_paths, tier, status_callback=None, max_workers=None):
+        """ Returns {source: proxy path} for the given maps at a PROXY_TIERS tier, generating missing proxies in parallel.
+            Maps that cannot be downscaled (EXR/HDR, already small, unreadable) map to themselves; maps known to be
+            already small count as hits without being opened again. """
+        size = PROXY_TIERS[tier]
+        result = {}; pending = {}; hits = 0; skipped = 0
+        for source in dict.fromkeys(source_paths):
+            extension = os.path.splitext(source)[1].lower()
+            if extension not in PROXY_EXTENSIONS:
+                result[source] = source; skipped += 1; continue
+            try: key = f"{file_digest(source)}_{os.stat(source).st_mtime_ns:x}_{tier}"
+            except OSError:
+                result[source] = source; skipped += 1; continue
+            proxy_path = os.path.join(self.cache_dir, key + extension)
+            if key in self.full_resolution:
+                result[source] = source; hits += 1
+            elif os.path.isfile(proxy_path):
+                os.utime(proxy_path); result[source] = proxy_path; hits += 1
+            else:
+                pending[source] = proxy_path
+        generated = 0; bytes_read = 0; start_time = time.perf_counter()
+        if pending and importlib.util.find_spec("PIL") is None:
+            if status_callback: status_callback("!!! WARNING: Pillow is not installed; using full-resolution maps.")
+            for source in pending: result[source] = source
+            skipped += len(pending); pending = {}
+        if pending:
+            with _process_pool(max_workers) as pool:
+                futures = {pool.submit(_generate_proxy, source, proxy_path, size): source for source, proxy_path in pending.items()}
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        read, written = future.result()
+                        bytes_read += read
+                        if written: result[source] = pending[source]; generated += 1
+                        else: result[source] = source; skipped += 1; self.full_resolution.add(os.path.splitext(os.path.basename(pending[source]))[0])
+                    except Exception as e:
+                        result[source] = source; skipped += 1
+                        if status_callback: status_callback(f"!!! WARNING: No proxy for '{os.path.basename(source)}'. {e}")
+        for source, proxy_path in pending.items():
+            if result.get(source) == proxy_path: self.sources[os.path.basename(proxy_path)] = source
+        removed, freed = enforce_cache_budget(self.cache_dir, self.budget_bytes, keep={p for p in result.values() if p.startswith(self.cache_dir)} | {self._sources_path, self._full_resolution_path})
+        self._save_sources()
+        if status_callback:
+            elapsed = time.perf_counter() - start_time; lookups = hits + len(pending)
+            status_callback(f"Proxy cache ({tier}): {hits} hit(s), {generated} generated, {skipped} full-resolution, hit rate {hits / max(lookups, 1):.0%}.")
+            if pending: status_callback(f"Generated {generated} proxies in {elapsed:.2f}s ({generated / max(elapsed, 1e-6):.1f} maps/s, {bytes_read / max(elapsed, 1e-6) / 1e6:.1f} MB/s read).")
+            if removed: status_callback(f"Evicted {removed} proxy file(s) ({freed / 1e6:.1f} MB) to stay within the cache budget.")
+        return result
+
+_proxy_cache = None
+
+def get_proxy_cache():
+    """ Returns the shared ProxyCache. """
+    global _proxy_cache
+    with _shared_lock:
+        if _proxy_cache is None: _proxy_cache = ProxyCache()
+    return _proxy_cache
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                     SECTION 5: FBX IMPORT CACHE                   +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+class FBXImportCache:
+    """ Keeps the objects of every translated FBX as a native .max file, keyed by the FBX content hash plus the
+        importer settings, so later imports merge the .max file instead of running the FBX translator again.
+        index.json records the source of each entry; the folder is kept under a size budget with LRU eviction. """
+    def __init__(self, cache_dir=None, budget_mb=FBX_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(FBX_CACHE_DIR_NAME)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._index_path = os.path.join(self.cache_dir, "index.json")
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f: self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def cache_key(fbx_digest, settings_signature):
+        return hashlib.sha1(f"{fbx_digest}|{settings_signature}".encode("utf-8")).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.max")
+
+    def lookup(self, key):
+        """ Returns the cached .max file for key (marking it recently used), or None. """
+        path = self.path_for(key)
+        if not os.path.isfile(path): return None
+        os.utime(path)
+        return path
+
+    def store(self, key, source_path, object_count):
+        """ Records a cached scene in memory; save() evicts and writes the index once per batch. """
+        self.entries[key] = {"source": source_path, "objects": object_count, "created": time.time()}
+
+    def save(self):
+        """ Evicts old scenes down to the budget and writes index.json. Returns the number of files removed. """
+        removed, _ = enforce_cache_budget(self.cache_dir, self.budget_bytes, keep={self._index_path})
+        self.entries = {key: entry for key, entry in self.entries.items() if os.path.isfile(self.path_for(key))}
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f: json.dump(self.entries, f, indent=1)
+        os.replace(temp_path, self._index_path)
+        return removed
+
+    def clear(self):
+        """ Deletes every cached scene. Returns the number of files removed. """
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".max"): continue
+            try: os.remove(os.path.join(self.cache_dir, name)); removed += 1
+            except OSError: pass
+        self.entries = {}; self.save()
+        return removed
+
+_fbx_cache = None
+
+def get_fbx_cache():
+    """ Returns the shared FBXImportCache. """
+    global _fbx_cache
+    with _shared_lock:
+        if _fbx_cache is None: _fbx_cache = FBXImportCache()
+    return _fbx_cache
+
+def fbx_settings_signature():
+    """ Fingerprints everything that changes the result of an FBX import: the importer settings, the system units and the 3ds Max version. """
+    params = ", ".join(mxs_string(p) for p in FBX_SETTINGS_PARAMS)
+    mxs_command = f'''
+    (
+        local s = (maxVersion()) as string + "|" + (units.SystemType as string) + "|" + (units.SystemScale as string)
+        for p in #({params}) do (local v = try (FBXImporterGetParam p) catch (undefined); s += "|" + p + "=" + (v as string))
+        s
+    )
+    '''
+    return str(execute_maxscript(mxs_command, "FBXImporterGetParam"))
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                   SECTION 6: HDRI ANALYSIS CACHE                  +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+class HDRIAnalysisCache:
+    """ Keeps the GSGHDRI statistics (<key>.json) and tonemapped preview (<key>.npy) of every analyzed HDRI, keyed by
+        the sampled file digest plus the mtime of the file, so an HDRI is only streamed once and an edit in place (a
+        re-grade that keeps the size and both ends) is analyzed again. The folder is kept under a size budget with LRU
+        eviction. """
+    def __init__(self, cache_dir=None, budget_mb=HDRI_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(HDRI_CACHE_DIR_NAME)
+        self.budget_bytes = budget_mb * 1024 * 1024
+
+    @staticmethod
+    def cache_key(file_path):
+        return hashlib.sha1(f"{file_digest(file_path)}|{os.stat(file_path).st_mtime_ns}|{ANALYSIS_VERSION}".encode("utf-8")).hexdigest()
+
+    def lookup(self, key):
+        """ Returns the cached (stats, preview) for key (marking them recently used), or None. """
+        import numpy as np
+        stats_path = os.path.join(self.cache_dir, f"{key}.json"); preview_path = os.path.join(self.cache_dir, f"{key}.npy")
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as f: stats = json.load(f)
+            preview = np.load(preview_path)
+        except (OSError, ValueError):
+            return None
+        os.utime(stats_path); os.utime(preview_path)
+        return stats, preview
+
+    def store(self, key, source_path, stats, preview):
+        import numpy as np
+        np.save(os.path.join(self.cache_dir, f"{key}.npy"), preview)
+        temp_path = os.path.join(self.cache_dir, f"{key}.json.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f: json.dump(dict(stats, source=source_path), f, indent=1)
+        os.replace(temp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        enforce_cache_budget(self.cache_dir, self.budget_bytes)
+
+_hdri_cache = None
+
+def get_hdri_cache():
+    """ Returns the shared HDRIAnalysisCache. """
+    global _hdri_cache
+    with _shared_lock:
+        if _hdri_cache is None: _hdri_cache = HDRIAnalysisCache()
+    return _hdri_cache
+
+@traced()
+def analyze_hdri_cached(file_path):
+    """ Returns (stats, preview, from cache) for an HDRI, streaming the file only when it is not cached yet. """
+    cache = get_hdri_cache(); key = cache.cache_key(file_path)
+    cached = cache.lookup(key)
+    if cached: return cached[0], cached[1], True
+    with span("analyze_hdri", path=file_path): stats, preview = analyze_hdri(file_path)
+    count("hdri_pixels_analyzed", stats["width"] * stats["height"])
+    cache.store(key, file_path, stats, preview)
+    return stats, preview, False
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                  SECTION 7: NETWORK MIRROR CACHE                  +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@functools.lru_cache(maxsize=None)
+def _is_remote_drive(drive):
+    import ctypes
+    return ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == 4  # DRIVE_REMOTE
+
+def is_network_path(path):
+    """ True for UNC paths (//server/share/...) and, on Windows, for files on mapped network drives. """
+    path = str(path)
+    if path.startswith(("\\\\", "//")): return True
+    drive = os.path.splitdrive(path)[0]
+    return sys.platform == "win32" and bool(drive) and _is_remote_drive(drive.upper())
+
+def _copy_chunked(source_path, part_path, size):
+    """ Copies source_path to part_path in MIRROR_CHUNK_BYTES chunks, continuing an interrupted copy from the end of an
+        existing part file. Returns (bytes copied, full file_digest of the source); the digest is hashed from the blocks
+        as they are read when the copy starts from scratch, and is None for a resumed copy. """
+    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    if offset > size: os.remove(part_path); offset = 0
+    copied = 0; sha = hashlib.sha1(str(size).encode("ascii")) if offset == 0 else None
+    with open(source_path, 'rb') as source, open(part_path, 'ab') as part:
+        source.seek(offset)
+        for block in iter(lambda: source.read(MIRROR_CHUNK_BYTES), b""):
+            part.write(block); copied += len(block)
+            if sha: sha.update(block)
+    count("mirror_bytes_copied", copied)
+    return copied, (sha.hexdigest() if sha else None)
+
+class MirrorCache:
+    """ Local copies of assets stored on a network share, so 3ds Max loads and renders them from a local disk. A copy
+        is named <hash of the source path>_<file name> and is used while its source keeps the size and mtime recorded
+        in index.json; otherwise it is copied again. Copies are made in chunks to a .part file, so an interrupted copy
+        resumes where it stopped, and are checked against a hash of the whole source content before use. The folder is kept under a
+        size budget with LRU eviction. """
+    def __init__(self, cache_dir=None, budget_mb=MIRROR_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(MIRROR_DIR_NAME)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._index_path = os.path.join(self.cache_dir, "index.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f: self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+        # Totals for the session: hits, copies, bytes copied from the share and bytes served locally instead
+        self.stats = {"hits": 0, "copies": 0, "bytes_copied": 0, "bytes_saved": 0}
+
+    def path_for(self, source_path):
+        name_hash = hashlib.sha1(_index_key(source_path).encode("utf-8")).hexdigest()[:16]
+        file_name = os.path.basename(source_path.replace("\\", "/"))
+        return os.path.join(self.cache_dir, f"{name_hash}_{file_name}")
+
+    def source_of(self, local_path):
+        """ Returns the network source of a mirrored file, or None when the path is not in the mirror. """
+        if os.path.normcase(os.path.dirname(os.path.abspath(local_path))) != os.path.normcase(os.path.abspath(self.cache_dir)): return None
+        entry = self.entries.get(os.path.basename(local_path))
+        return entry["source"] if entry else None
+
+    def _mirror(self, source_path, local_path, st):
+        """ Copies one file (resuming a previous attempt) and verifies it. Returns the bytes copied. """
+        part_path = f"{local_path}.{st.st_size}_{st.st_mtime_ns}.part"
+        copied, digest = _copy_chunked(source_path, part_path, st.st_size)
+        # A resumed copy read only the tail in this session, so the source is hashed in full once more.
+        if digest is None: digest = file_digest(source_path, full=True)
+        if os.path.getsize(part_path) != st.st_size or file_digest(part_path, full=True) != digest:
+            # A part left by an older version of the file, or a torn copy: start over once.
+            os.remove(part_path); more, digest = _copy_chunked(source_path, part_path, st.st_size); copied += more
+            if file_digest(part_path, full=True) != digest: os.remove(part_path); raise OSError("the copy does not match the source")
+        if os.stat(source_path).st_mtime_ns != st.st_mtime_ns: os.remove(part_path); raise OSError("the source changed while it was copied")
+        os.replace(part_path, local_path)
+        with self._lock: self.entries[os.path.basename(local_path)] = {"source": source_path, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "digest": digest}
+        return copied
+
+    @traced("mirror_ensure")
+    def ensure(self, source_paths, status_callback=None, max_workers=None):
+        """ Returns {source: local copy} for the given files, copying missing and outdated ones in parallel. Files that
+            cannot be read or copied map to themselves. """
+        result = {}; pending = {}; hits = 0; hit_bytes = 0
+        for source in dict.fromkeys(source_paths):
+            local_path = self.path_for(source)
+            try: st = os.stat(source)
+            except OSError: result[source] = source; continue
+            entry = self.entries.get(os.path.basename(local_path))
+            if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns and os.path.isfile(local_path) and os.path.getsize(local_path) == st.st_size:
+                os.utime(local_path); result[source] = local_path; hits += 1; hit_bytes += st.st_size
+            else:
+                pending[source] = (local_path, st)
+        copied_files = 0; copied_bytes = 0; start_time = time.perf_counter()
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers or MIRROR_COPY_THREADS, thread_name_prefix="GSGMirror") as pool:
+                futures = {pool.submit(self._mirror, source, local_path, st): source for source, (local_path, st) in pending.items()}
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        copied_bytes += future.result(); result[source] = pending[source][0]; copied_files += 1
+                    except Exception as e:
+                        result[source] = source
+                        if status_callback: status_callback(f"!!! WARNING: Could not mirror '{os.path.basename(source)}', using the share. {e}")
+        count("mirror_hits", hits); count("mirror_misses", len(pending))
+        with self._lock:
+            self.stats["hits"] += hits; self.stats["copies"] += copied_files; self.stats["bytes_copied"] += copied_bytes; self.stats["bytes_saved"] += hit_bytes
+            removed, freed = enforce_cache_budget(self.cache_dir, self.budget_bytes, keep={p for p in result.values() if p.startswith(self.cache_dir)} | {self._index_path})
+            self._save()
+        if status_callback and (hits or pending):
+            elapsed = time.perf_counter() - start_time
+            status_callback(f"Mirror cache: {hits} hit(s) ({hit_bytes / 1e6:.1f} MB not read from the share), {copied_files} of {len(pending)} file(s) copied"
+                            + (f" ({copied_bytes / 1e6:.1f} MB at {copied_bytes / max(elapsed, 1e-6) / 1e6:.1f} MB/s)." if pending else "."))
+            if removed: status_callback(f"Evicted {removed} mirrored file(s) ({freed / 1e6:.1f} MB) to stay within the cache budget.")
+        return result
+
+    def _save(self):
+        # Entries of evicted or cleared copies are kept: scenes may still point at them, and source_of() leads back to
+        # the share. A copy is only used while its file exists, so a stale entry just means copying again.
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f: json.dump(self.entries, f)
+        os.replace(temp_path, self._index_path)
+
+    def clear(self):
+        """ Deletes every mirrored file, keeping their sources for restore_network_textures. Returns the number of files removed. """
+        removed = 0
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name == os.path.basename(self._index_path): continue
+                try: os.remove(os.path.join(self.cache_dir, name)); removed += 1
+                except OSError: pass
+            self._save()
+        return removed
+
+_mirror_cache = None
+
+def get_mirror_cache():
+    """ Returns the shared MirrorCache. """
+    global _mirror_cache
+    with _shared_lock:
+        if _mirror_cache is None: _mirror_cache = MirrorCache()
+    return _mirror_cache
+
+def mirror_enabled():
+    """ Whether assets on network shares are mirrored locally (an opt-in setting kept in the asset index). """
+    return bool(get_asset_index().setting("mirror_network_assets", False))
+
+def set_mirror_enabled(enabled):
+    get_asset_index().set_setting("mirror_network_assets", bool(enabled))
+
+def mirror_paths(file_paths, status_callback=None):
+    """ Returns {path: local copy} for the network paths among file_paths when mirroring is on, else {}. """
+    network_paths = [path for path in dict.fromkeys(file_paths) if is_network_path(path)]
+    if not network_paths or not mirror_enabled(): return {}
+    return get_mirror_cache().ensure(network_paths, status_callback)
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                      SECTION 8: ASSET ARCHIVES                    +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#
+#   Zipped asset packs are read in place. A path inside a .zip file is written as if the archive were a folder
+#   (D:/Packs/Wood.zip/Oak_01/Oak_01_Albedo.jpg) and is accepted wherever a folder or file path is. Listing, .gsgm
+#   parsing and map classification only read the central directory and the .gsgm member; a member is extracted to
+#   the archive cache the first time 3ds Max, a proxy or a thumbnail needs the actual file.
+
+def split_archive_path(path):
+    """ Returns (archive file, member path) for a path inside a .zip file, with "" as the member path of the archive
+        itself, or None for any other path. """
+    normalized = str(path).replace("\\", "/")
+    lower = normalized.lower(); start = 0
+    while True:
+        end = lower.find(".zip", start) + 4
+        if end < 4: return None
+        if (end == len(lower) or lower[end] == "/") and os.path.isfile(normalized[:end]): return normalized[:end], normalized[end:].strip("/")
+        start = end
+
+class AssetArchive:
+    """ An open .zip asset pack. Opening it reads only the central directory, which lists every member with its size
+        and CRC-32; members are streamed or extracted on demand, also from several threads at once. """
+    def __init__(self, archive_path):
+        self.path = archive_path.replace("\\", "/")
+        st = os.stat(archive_path); self.signature = (st.st_size, st.st_mtime_ns)
+        with span("read central directory", path=archive_path): self._zip = zipfile.ZipFile(archive_path)
+        self.members = {info.filename.strip("/"): info for info in self._zip.infolist() if not info.is_dir()}
+        self.folders = {}  # folder -> names of the files directly inside it
+        for name in sorted(self.members):
+            folder, _, file_name = name.rpartition("/")
+            self.folders.setdefault(folder, []).append(file_name)
+        count("archive_members_listed", len(self.members))
+
+    def member_path(self, name):
+        return f"{self.path}/{name}" if name else self.path
+
+    def open(self, name):
+        return self._zip.open(self.members[name])
+
+    def files(self, folder="", extensions=None, recursive=False):
+        """ Returns the paths of the members in folder (or below it), sorted, optionally filtered by lower-case extension. """
+        prefix = f"{folder}/" if folder else ""
+        names = [name for name in self.members if name.startswith(prefix) and (recursive or "/" not in name[len(prefix):])]
+        return [self.member_path(name) for name in sorted(names) if not extensions or name.lower().endswith(tuple(extensions))]
+
+    def material_folders(self, folder=""):
+        """ The folders at or below folder that hold a .gsgm file, sorted. """
+        return sorted(f for f, names in self.folders.items() if (not folder or f == folder or f.startswith(f"{folder}/")) and any(n.lower().endswith('.gsgm') for n in names))
+
+    @traced("archive_material")
+    def material(self, folder):
+        """ Returns the material record of a GSG folder in the archive, or None when it has no .gsgm file. The .gsgm
+            is parsed straight from the archive and the maps are classified from the member names. """
+        names = self.folders.get(folder, [])
+        gsgm = next((name for name in names if name.lower().endswith('.gsgm')), None)
+        if not gsgm: return None
+        prefix = f"{folder}/" if folder else ""
+        with self.open(prefix + gsgm) as f: material = _gsgm_record(json.load(f), self.member_path(folder))
+        count("bytes_read", self.members[prefix + gsgm].file_size)
+        material["maps"] = {slot: self.member_path(prefix + os.path.basename(path)) for slot, path in detect_material_maps("", names).items()}
+        material["gsgm"] = self.member_path(prefix + gsgm)
+        return material
+
+_archives = {}
+
+def get_archive(archive_path):
+    """ Returns the open AssetArchive of a .zip file, kept for the session and reopened when the file changes. """
+    st = os.stat(archive_path); key = _index_key(archive_path)
+    with _shared_lock:
+        archive = _archives.get(key)
+        if archive is None or archive.signature != (st.st_size, st.st_mtime_ns): archive = _archives[key] = AssetArchive(archive_path)
+    return archive
+
+def archive_member_info(path):
+    """ Returns the ZipInfo (size, CRC-32, ...) of a path inside an archive, or None when it is not an archive member. """
+    split = split_archive_path(path)
+    if not split: return None
+    try: return get_archive(split[0]).members.get(split[1])
+    except (OSError, zipfile.BadZipFile): return None
+
+class ArchiveCache:
+    """ Members extracted from asset archives. A member is stored as <CRC-32>_<size>_<file name>, whichever pack and
+        folder it comes from, so a map shipped in several packs is extracted once, and a hit is found from the central
+        directory alone. zipfile checks the CRC-32 of every member it extracts. The folder is kept under a size budget
+        with LRU eviction. """
+    def __init__(self, cache_dir=None, budget_mb=ARCHIVE_CACHE_BUDGET_MB):
+        self.cache_dir = cache_dir or get_cache_dir(ARCHIVE_DIR_NAME)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        # Totals for the session: hits, members extracted and bytes extracted
+        self.stats = {"hits": 0, "extracted": 0, "bytes_extracted": 0}
+
+    def path_for(self, info):
+        return os.path.join(self.cache_dir, f"{info.CRC:08x}_{info.file_size}_{os.path.basename(info.filename)}")
+
+    def _extract(self, archive, name, local_path):
+        temp_path = f"{local_path}.{threading.get_ident()}.tmp"
+        try:
+            with archive.open(name) as source, open(temp_path, 'wb') as target: shutil.copyfileobj(source, target, MIRROR_CHUNK_BYTES)
+        except BaseException:
+            if os.path.isfile(temp_path): os.remove(temp_path)
+            raise
+        os.replace(temp_path, local_path)
+        count("archive_bytes_extracted", archive.members[name].file_size)
+        return archive.members[name].file_size
+
+    @traced("archive_extract")
+    def ensure(self, member_paths, status_callback=None, max_workers=None):
+        """ Returns {member path: extracted file} for the given archive members, extracting missing ones in parallel.
+            Members that cannot be found or extracted map to themselves. """
+        result = {}; pending = {}; hits = 0
+        for path in dict.fromkeys(member_paths):
+            split = split_archive_path(path)
+            try: archive = get_archive(split[0]); info = archive.members[split[1]]
+            except (TypeError, KeyError, OSError, zipfile.BadZipFile):
+                result[path] = path
+                if status_callback: status_callback(f"!!! WARNING: '{path}' is not in its archive.")
+                continue
+            local_path = self.path_for(info)
+            if local_path in pending: pending[local_path][2].append(path); continue
+            if os.path.isfile(local_path) and os.path.getsize(local_path) == info.file_size:
+                os.utime(local_path); result[path] = local_path; hits += 1
+            else:
+                pending[local_path] = (archive, split[1], [path])
+        extracted = 0; extracted_bytes = 0; start_time = time.perf_counter()
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers or ARCHIVE_EXTRACT_THREADS, thread_name_prefix="GSGArchive") as pool:
+                futures = {pool.submit(self._extract, archive, name, local_path): local_path for local_path, (archive, name, _) in pending.items()}
+                for future in as_completed(futures):
+                    local_path = futures[future]; paths = pending[local_path][2]
+                    try:
+                        extracted_bytes += future.result(); extracted += 1
+                        result.update((path, local_path) for path in paths)
+                    except Exception as e:
+                        result.update((path, path) for path in paths)
+                        if status_callback: status_callback(f"!!! WARNING: Could not extract '{paths[0]}'. {e}")
+        count("archive_hits", hits); count("archive_misses", len(pending))
+        with self._lock:
+            self.stats["hits"] += hits; self.stats["extracted"] += extracted; self.stats["bytes_extracted"] += extracted_bytes
+            removed, freed = enforce_cache_budget(self.cache_dir, self.budget_bytes, keep={p for p in result.values() if p.startswith(self.cache_dir)})
+        if status_callback and (hits or pending):
+            elapsed = time.perf_counter() - start_time
+            status_callback(f"Archive cache: {hits} hit(s), {extracted} of {len(pending)} member(s) extracted"
+                            + (f" ({extracted_bytes / 1e6:.1f} MB at {extracted_bytes / max(elapsed, 1e-6) / 1e6:.1f} MB/s)." if pending else "."))
+            if removed: status_callback(f"Evicted {removed} extracted file(s) ({freed / 1e6:.1f} MB) to stay within the cache budget.")
+        return result
+
+    def clear(self):
+        """ Deletes every extracted member. Returns the number of files removed. """
+        removed = 0
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                try: os.remove(os.path.join(self.cache_dir, name)); removed += 1
+                except OSError: pass
+        return removed
+
+_archive_cache = None
+
+def get_archive_cache():
+    """ Returns the shared ArchiveCache. """
+    global _archive_cache
+    with _shared_lock:
+        if _archive_cache is None: _archive_cache = ArchiveCache()
+    return _archive_cache
+
+def localize_paths(file_paths, status_callback=None, mirror=True):
+    """ Returns {path: local file} for the archive members among file_paths, extracted on demand, and (with mirror)
+        for the files on network shares when mirroring is on. Other paths are left out. """
+    members = [path for path in dict.fromkeys(file_paths) if split_archive_path(path)]
+    local = get_archive_cache().ensure(members, status_callback) if members else {}
+    if mirror: local.update(mirror_paths([path for path in file_paths if path not in local], status_callback))
+    return local
+
+def use_local_maps(materials, status_callback, mirror=True):
+    """ Returns copies of the material records with every map inside an archive swapped for its extracted file and
+        (with mirror) every map on a network share for its local mirror. """
+    local = localize_paths([path for material in materials for path in material["maps"].values() if path], status_callback, mirror)
+    if not local: return materials
+    return [dict(material, maps={slot: local.get(path, path) for slot, path in material["maps"].items()}) for material in materials]
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                      SECTION 9: ASSET MANIFEST                    +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#
+#   Re-imports are incremental. A manifest records, per asset, a fingerprint of the source files it was built from,
+#   and a re-run only builds what is new or changed. The scene manifest lives on the assets themselves: every
+#   material, HDRI environment, texture node and FBX object the importer creates carries its asset key and entry in
+#   AppData (see tag_code), so it is saved, merged, undone and deleted with them. A material library keeps its
+#   manifest in <library>.manifest.json and its materials carry their asset key.
+
+class AssetManifest:
+    """ Asset key -> {"name", "fingerprint", "files", "updated"}, where files maps each source file to its
+        [size, mtime_ns, digest]. A file whose size and mtime are unchanged keeps its recorded digest, so checking
+        thousands of assets costs one os.stat per file and only edited files are read. Archive members are recorded
+        as [size, CRC-32, digest] from the central directory and are not read at all. """
+    VERSION = 1
+
+    def __init__(self, assets=None):
+        self.assets = assets or {}
+
+    @classmethod
+    def from_json(cls, text):
+        """ Returns the manifest stored in text, or an empty one for missing, invalid or outdated data. """
+        try: data = json.loads(text) if text else {}
+        except ValueError: data = {}
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION: return cls()
+        return cls(data.get("assets") or {})
+
+    def to_json(self):
+        return json.dumps({"version": self.VERSION, "assets": self.assets}, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, file_path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f: return cls.from_json(f.read())
+        except OSError:
+            return cls()
+
+    def save(self, file_path):
+        temp_path = file_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f: f.write(self.to_json())
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def asset_key(kind, source_path):
+        return f"{kind}:{_index_key(source_path)}"
+
+    def fingerprint(self, key, source_files, settings=None, full=False):
+        """ Returns (fingerprint, files) for the asset key built from source_files with settings (any JSON value).
+            full=True hashes whole files instead of file_digest's samples. Missing files are recorded as None. """
+        known = self.assets.get(key, {}).get("files") or {}
+        files = {}
+        for path in source_files:
+            if split_archive_path(path):
+                info = archive_member_info(path)
+                files[path] = [info.file_size, info.CRC, f"crc32:{info.CRC:08x}:{info.file_size}"] if info else None; continue
+            try: st = os.stat(path)
+            except OSError: files[path] = None; continue
+            previous = known.get(path)
+            if previous and previous[0] == st.st_size and previous[1] == st.st_mtime_ns: files[path] = previous
+            else: files[path] = [st.st_size, st.st_mtime_ns, file_digest(path, full=full)]; count("manifest_files_hashed")
+        content = json.dumps([sorted([_index_key(path), record[2] if record else None] for path, record in files.items()), settings], sort_keys=True)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest(), files
+
+    def status(self, key, fingerprint):
+        """ 'new', 'changed' or 'unchanged' compared with what the manifest recorded for key. """
+        entry = self.assets.get(key)
+        if entry is None: return "new"
+        return "unchanged" if entry.get("fingerprint") == fingerprint else "changed"
+
+    @traced("manifest_plan")
+    def plan(self, assets, full=False, max_workers=None):
+        """ Fingerprints assets, a list of (key, name, source_files, settings), on worker threads and returns one dict
+            per asset with key, name, status, fingerprint, files and stale (unchanged, but the file times moved). """
+        def plan_one(asset):
+            key, name, source_files, settings = asset
+            fingerprint, files = self.fingerprint(key, source_files, settings, full)
+            status = self.status(key, fingerprint)
+            stale = status == "unchanged" and files != self.assets[key].get("files")
+            return {"key": key, "name": name, "status": status, "fingerprint": fingerprint, "files": files, "stale": stale}
+        with ThreadPoolExecutor(max_workers=max_workers or JOB_WORKER_THREADS) as pool:
+            return list(pool.map(plan_one, assets))
+
+    @staticmethod
+    def entry(planned):
+        """ The manifest entry of a plan() result, as recorded once the asset is built. """
+        return {"name": planned["name"], "fingerprint": planned["fingerprint"], "files": planned["files"], "updated": time.time()}
+
+    @classmethod
+    def entry_json(cls, planned):
+        return json.dumps(cls.entry(planned), separators=(",", ":"))
+
+    def record(self, planned):
+        self.assets[planned["key"]] = self.entry(planned)
+
+    def remove(self, key):
+        self.assets.pop(key, None)
+
+def material_asset(material, proxy_tier=None):
+    """ The plan() input of a material record: its .gsgm file and maps, with the slot of each map and the proxy tier as settings. """
+    maps = {slot: path for slot, path in material["maps"].items() if path}
+    return AssetManifest.asset_key("material", material["folder"]), material["name"], [material["gsgm"]] + sorted(set(maps.values())), {"maps": maps, "proxy_tier": proxy_tier}
+
+def texture_set_asset(texture_set):
+    """ The plan() input of the material of a group_texture_sets() set: its maps, with the slot of each map as settings. """
+    maps = texture_set["maps"]
+    return AssetManifest.asset_key("texture_set", os.path.join(texture_set["folder"], texture_set["name"])), texture_set["name"], sorted(set(maps.values())), {"maps": maps}
+
+def library_manifest_path(library_path):
+    return os.path.splitext(library_path)[0] + MANIFEST_SUFFIX
+
+def _tagged_loops(class_names, objects, body):
+    """ MaxScript running body for every tagged instance of class_names (and scene object), held in 'm' with its key in 'k'. """
+    sources = [f"for c in #({', '.join(class_names)}) do for m in getClassInstances c"] if class_names else []
+    if objects: sources.append("for m in objects")
+    return "\n".join(f"{source} do (local k = getAppData m {TAG_APPDATA_ID}; if k != undefined do ({body}))" for source in sources)
+
+def load_scene_manifest(class_names=(), objects=False):
+    """ Returns the manifest of the importer assets in the scene that are instances of class_names (and, with
+        objects, the tagged scene objects), read in one rt.execute. """
+    mxs_command = f"(\nlocal found = #()\n{_tagged_loops(class_names, objects, f'append found #(k, getAppData m {RECORD_APPDATA_ID})')}\nfound\n)"
+    assets = {}
+    for key, entry in execute_maxscript(mxs_command, "read scene manifest") or []:
+        try: assets[str(key)] = json.loads(str(entry)) if entry else {}
+        except ValueError: assets[str(key)] = {}
+    return AssetManifest(assets)
+
+def update_scene_records(planned, class_names=(), objects=False):
+    """ Stores the current manifest entries of planned assets on the tagged scene assets, in one rt.execute; used
+        for unchanged assets whose file times moved, so their files are not hashed again on the next run. """
+    if not planned: return
+    puts = "\n".join(f"PutDictValue records {mxs_string(p['key'])} {mxs_string(AssetManifest.entry_json(p))}" for p in planned)
+    body = f"if HasDictValue records k do setAppData m {RECORD_APPDATA_ID} (GetDictValue records k)"
+    execute_maxscript(f"(\nlocal records = Dictionary #string\n{puts}\n{_tagged_loops(class_names, objects, body)}\nOK\n)", "update scene manifest")
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                     SECTION 10: BACKGROUND JOBS                   +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+#
+#   Long operations are written as job generators. A job runs on the thread that drives it (the UI thread in
+#   3ds Max, since pymxs is not thread safe) and yields:
+#     - a concurrent.futures.Future from submit_work() to run filesystem work (discovery, parsing, hashing) on a
+#       worker thread; the driver resumes the job with the future's result, or throws its exception into it,
+#     - a (done, total) tuple to report progress; this is also the point where a cancel request takes effect.
+#   JobRunner drives jobs in time slices from the Qt event loop; run_job() drives them to completion, blocking.
+#   status_callback may be called from worker threads, so callbacks must be thread safe (JobPanel.log is).
+
+class JobCancelled(BaseException):
+    """ Thrown into a job when it is cancelled. Derives from BaseException so the jobs' 'except Exception' error
+        handlers let it through. """
+
+_worker_pool = None
+
+def get_worker_pool():
+    """ Returns the shared thread pool used for job filesystem work. """
+    global _worker_pool
+    with _shared_lock:
+        if _worker_pool is None: _worker_pool = ThreadPoolExecutor(max_workers=JOB_WORKER_THREADS, thread_name_prefix="GSGWorker")
+    return _worker_pool
+
+def submit_work(fn, *args, **kwargs):
+    """ Runs fn on the worker pool; yield the returned future from a job to wait for its result. """
+    return get_worker_pool().submit(fn, *args, **kwargs)
+
+def run_job(job):
+    """ Drives a job generator to completion on the calling thread and returns its return value. """
+    value = None; error = None
+    with span(f"job {getattr(job, '__name__', 'job')}"):
+        while True:
+            try:
+                item = job.throw(error) if error is not None else job.send(value)
+            except StopIteration as stop:
+                return stop.value
+            value = None; error = None
+            if isinstance(item, Future):
+                try: value = item.result()
+                except Exception as e: error = e
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                   SECTION 11: CORE LOGIC FUNCTIONS                +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+def execute_maxscript(mxs_command, label):
+    """ Runs MaxScript through rt.execute, traced as a span named after label and counted in mxs_chars_executed. """
+    with span(f"rt.execute {label}", chars=len(mxs_command)):
+        count("mxs_executions"); count("mxs_chars_executed", len(mxs_command))
+        return rt.execute(mxs_command)
+
+def detect_material_maps(folder_path, all_files):
+    """ Maps each MAP_KEYWORDS slot to the best matching texture file in the folder. """
+    return get_map_classifier().classify_folder(folder_path, all_files)["maps"]
+
+def _gsgm_record(data, folder_path):
+    return {"folder": folder_path, "name": data.get('name', os.path.basename(folder_path)), "params": data.get('params', {}).get('standard_surface', {})}
+
+@traced("parse_gsgm")
+def _parse_gsgm(gsgm_file_path, folder_path):
+    with open(gsgm_file_path, 'rb') as f: raw = f.read()
+    count("bytes_read", len(raw))
+    return _gsgm_record(json.loads(raw), folder_path)
+
+def read_gsg_material(folder_path):
+    """ Returns the parsed .gsgm data and detected maps of a GSG folder from the asset index, or None when it has no .gsgm file.
+        The folder may be inside an archive; an archive (or archive folder) holding a single material stands for it. """
+    split = split_archive_path(folder_path)
+    if not split: return get_asset_index().material(folder_path)
+    archive = get_archive(split[0])
+    material = archive.material(split[1])
+    if material: return material
+    folders = archive.material_folders(split[1])
+    return archive.material(folders[0]) if len(folders) == 1 else None
+
+def list_materials(root_folder, status_callback=None, max_workers=None):
+    """ Returns the material records of every GSG folder below root_folder, sorted by path; root_folder may be an
+        archive or a folder inside one. """
+    split = split_archive_path(root_folder)
+    if not split: return get_asset_index().materials(root_folder, status_callback=status_callback, max_workers=max_workers)
+    archive = get_archive(split[0])
+    return [archive.material(folder) for folder in archive.material_folders(split[1])]
+
+def default_library_path(root_folder):
+    """ LIBRARY_FILE_NAME inside root_folder, or <archive name>.mat next to an archive (which cannot be written to). """
+    split = split_archive_path(root_folder)
+    return os.path.splitext(split[0])[0] + ".mat" if split else os.path.join(root_folder, LIBRARY_FILE_NAME)
+
+def list_files(folder_path, extensions=None, recursive=False):
+    """ Returns the files in folder_path (or, with recursive, below it) sorted by path, optionally filtered by
+        lower-case extension; folder_path may be an archive or a folder inside one. """
+    split = split_archive_path(folder_path)
+    if split: return get_archive(split[0]).files(split[1], extensions, recursive)
+    index = get_asset_index()
+    return index.files_below(folder_path, extensions) if recursive else index.files(folder_path, extensions)
+
+def add_material_ops(builder, material, var="mtl", key=None, record=None):
+    """ Adds the operations creating the Std_Surface_Mtl of a parsed GSG material, held in the MaxScript local var,
+        tagged with the asset key (and manifest entry) when given. """
+    params = material["params"]; maps = material["maps"]
+    mtl = builder.create(var, "Std_Surface_Mtl", material["name"])
+    if key: builder.tag(mtl, key, record)
+    for json_key, (mat_prop, map_key, is_color) in MATERIAL_PARAMS.items():
+        if json_key in params and (not map_key or not maps.get(map_key)):
+            value = params[json_key]
+            if not is_color or isinstance(value, dict): builder.set(mtl, mat_prop, value)
+    for map_key, slot, gamma in MATERIAL_MAP_SLOTS:
+        if not maps.get(map_key): continue
+        bitmap = builder.bitmap(maps[map_key], gamma)
+        if map_key == "displacement": builder.raw(f"if {bitmap.expression} != undefined do (local dN = Texture_displacement(); dN.texture_tex = {bitmap.expression}; {var}.displacement = dN)")
+        else: builder.connect(mtl, slot, bitmap, slot.replace("_tex", "") + "_input_type")
+    return mtl
+
+@traced()
+def use_proxy_maps(materials, proxy_tier, status_callback, max_workers=None):
+    """ Returns copies of the material records with every map swapped for its proxy at proxy_tier. """
+    sources = [path for material in materials for path in material["maps"].values()]
+    proxies = get_proxy_cache().ensure(sources, proxy_tier, status_callback, max_workers)
+    return [dict(material, maps={slot: proxies.get(path, path) for slot, path in material["maps"].items()}) for material in materials]
+
+def create_octane_material(folder_path, status_callback, proxy_tier=None):
+    return run_job(iter_create_octane_material(folder_path, status_callback, proxy_tier))
+
+def iter_create_octane_material(folder_path, status_callback, proxy_tier=None):
+    """ Job version of create_octane_material; see iter_sync_materials. Returns whether the material is up to date. """
+    stats = yield from iter_sync_materials([folder_path], status_callback, proxy_tier)
+    return bool(stats) and not stats["failed"]
+
+def iter_create_octane_materials(folder_paths, status_callback, proxy_tier=None):
+    """ Job that creates or updates the Octane material of every GSG folder in folder_paths; see iter_sync_materials. """
+    stats = yield from iter_sync_materials(folder_paths, status_callback, proxy_tier)
+    return stats["created"] + stats["updated"] if stats else 0
+
+def iter_sync_materials(folder_paths, status_callback, proxy_tier=None):
+    """ Job that brings the Octane materials of the GSG folders in the scene up to date with their .gsgm files and
+        maps. New materials are created and placed in the active SME view; changed ones are rebuilt and replace the
+        old material wherever it is used (replaceInstances), and unchanged ones are skipped. <name>.mat is saved
+        next to every material built outside an archive. Maps inside an archive are extracted on demand and maps on a
+        network share are loaded from the mirror cache when it is on. Materials go to 3ds Max in batches of LIBRARY_CHUNK_SIZE per rt.execute.
+        Returns the created, updated, skipped and failed counts, or None when nothing could be built. """
+    status_callback("--- Starting Octane Material Creation ---")
+    stats = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+    try:
+        if "octane" not in str(rt.classOf(rt.renderers.current)).lower():
+            rt.messageBox("Octane is not the active renderer.", title="Renderer Error")
+            status_callback("!!! ERROR: Octane is not the active renderer.")
+            return None
+
+        materials = yield submit_work(lambda: [m for m in map(read_gsg_material, folder_paths) if m])
+        if not materials:
+            rt.messageBox("No .gsgm file found.", title="Error"); return None
+        if len(materials) == 1: status_callback(f"Found material '{materials[0]['name']}' with {len(materials[0]['params'])} parameters.")
+        manifest = load_scene_manifest(["Std_Surface_Mtl"])
+        planned = yield submit_work(manifest.plan, [material_asset(m, proxy_tier) for m in materials])
+        todo = [i for i, p in enumerate(planned) if p["status"] != "unchanged"]
+        stats["skipped"] = len(materials) - len(todo)
+        update_scene_records([p for p in planned if p["stale"]], ["Std_Surface_Mtl"])
+        if stats["skipped"]: status_callback(f"{stats['skipped']} material(s) unchanged since the last import, {len(todo)} to build.")
+        build = [materials[i] for i in todo]
+        if build: build = yield submit_work(use_local_maps, build, status_callback, mirror=False)
+        if proxy_tier and build: build = yield submit_work(use_proxy_maps, build, proxy_tier, status_callback)
+        if build: build = yield submit_work(use_local_maps, build, status_callback)
+
+        for first in range(0, len(todo), LIBRARY_CHUNK_SIZE):
+            batch = list(enumerate(zip(todo[first:first + LIBRARY_CHUNK_SIZE], build[first:first + LIBRARY_CHUNK_SIZE]), first))
+            with span("codegen_material", materials=len(batch)):
+                builder = ScriptBuilder()
+                builder.raw("local gsgDone = #()")
+                for position, (i, material) in batch:
+                    label = f"building '{material['name']}'"
+                    builder.begin(label)
+                    mtl = add_material_ops(builder, material, key=planned[i]["key"], record=AssetManifest.entry_json(planned[i]))
+                    if planned[i]["status"] == "changed":
+                        old = builder.find_tagged("old", "Std_Surface_Mtl", planned[i]["key"])
+                        builder.raw(f"if old != undefined do (replaceInstances old mtl; deleteAppData old {TAG_APPDATA_ID}; deleteAppData old {RECORD_APPDATA_ID})")
+                    else:
+                        builder.place(mtl, 200, 200 + 150 * position)
+                    if not split_archive_path(material["folder"]):
+                        mat_lib_path = os.path.join(material["folder"], f"{material['name']}.mat")
+                        builder.raw(f"local lib = materialLibrary(); append lib mtl; saveTempMaterialLibrary lib {mxs_path(mat_lib_path)}")
+                    builder.raw(f"append gsgDone {i}")
+                    builder.end(label)
+                mxs_command = builder.build("gsgDone")
+            status_callback("Executing generated MaxScript...")
+            done = {int(i) for i in execute_maxscript(mxs_command, "material + saveTempMaterialLibrary") or []}
+            for _, (i, material) in batch:
+                if i not in done:
+                    stats["failed"] += 1; status_callback(f"!!! ERROR: Building '{material['name']}' failed. Check Listener for details."); continue
+                action = "updated" if planned[i]["status"] == "changed" else "created"
+                stats[action] += 1; status_callback(f"-> Octane material '{material['name']}' {action} successfully.")
+            yield (min(first + LIBRARY_CHUNK_SIZE, len(todo)), len(todo))
+        # Updated maps may keep their file names; drop the cached pixels so the changed files are read again.
+        if stats["updated"]: execute_maxscript("freeSceneBitmaps(); OK", "freeSceneBitmaps")
+
+    except Exception as e:
+        error_message = f"An error occurred: {e}"
+        status_callback(f"!!! SCRIPT ERROR: {error_message}")
+        rt.messageBox(error_message, title="Script Error")
+        return None
+    if len(materials) > 1: status_callback(f"--- {stats['created']} created, {stats['updated']} updated, {stats['skipped']} unchanged, {stats['failed']} failed ---")
+    status_callback("--- PROCESS COMPLETE! ---"); return stats
+
+@traced("codegen_library")
+def library_chunks(materials, chunk_size):
+    """ Returns one ScriptBuilder script per chunk of materials; each script evaluates to the indexes (into materials)
+        of the materials it built. The materials are tagged with their asset key. """
+    chunks = []
+    for first in range(0, len(materials), chunk_size):
+        builder = ScriptBuilder()
+        builder.raw("local gsgDone = #()")
+        for i, material in enumerate(materials[first:first + chunk_size], first):
+            builder.begin(f"building '{material['name']}'")
+            add_material_ops(builder, material, key=AssetManifest.asset_key("material", material["folder"]))
+            builder.raw(f"append ::gsgLibraryBuild mtl; append gsgDone {i}")
+            builder.end(f"building '{material['name']}'")
+        chunks.append(builder.build("gsgDone"))
+    return chunks
+
+def build_material_library(root_folder, status_callback, chunk_size=LIBRARY_CHUNK_SIZE, dry_run=False, max_workers=None, library_path=None, proxy_tier=None):
+    """ Builds every GSG material found below root_folder into one material library.
+        Folders are discovered and parsed through the asset index (in parallel on worker threads) and the materials are submitted to 3ds Max in chunks of
+        chunk_size per rt.execute call. With dry_run the generated scripts are returned instead of executed.
+        With proxy_tier the materials are built against downscaled proxies (see restore_full_resolution_textures).
+        When the library exists with its manifest, only new and changed materials are built into it and removed ones are deleted.
+        root_folder may be an archive; its library defaults to <archive name>.mat next to it and its maps are extracted. """
+    return run_job(iter_build_material_library(root_folder, status_callback, chunk_size, dry_run, max_workers, library_path, proxy_tier))
+
+def iter_build_material_library(root_folder, status_callback, chunk_size=LIBRARY_CHUNK_SIZE, dry_run=False, max_workers=None, library_path=None, proxy_tier=None):
+    """ Job version of build_material_library; it can be cancelled between batches. """
+    status_callback(f"--- Building GSG material library from: {root_folder} ---")
+    library_path = (library_path or default_library_path(root_folder)).replace("\\", "/")
+    chunk_size = max(1, int(chunk_size))
+    try:
+        if not dry_run and "octane" not in str(rt.classOf(rt.renderers.current)).lower():
+            rt.messageBox("Octane is not the active renderer.", title="Renderer Error")
+            status_callback("!!! ERROR: Octane is not the active renderer.")
+            return False
+
+        start_time = time.perf_counter()
+        # Changed folders are rescanned and parsed in parallel by the index; unchanged ones come straight from it.
+        materials = yield submit_work(list_materials, root_folder, status_callback, max_workers)
+        parse_time = time.perf_counter() - start_time
+        if not materials:
+            status_callback("No GSG material folders found."); return [] if dry_run else False
+        status_callback(f"Loaded {len(materials)} material(s) in {parse_time:.2f}s ({len(materials) / max(parse_time, 1e-6):.0f} materials/s).")
+
+        manifest_path = library_manifest_path(library_path)
+        manifest = AssetManifest.load(manifest_path) if os.path.isfile(library_path) else AssetManifest()
+        planned = yield submit_work(manifest.plan, [material_asset(m, proxy_tier) for m in materials], max_workers=max_workers)
+        todo = [i for i, p in enumerate(planned) if p["status"] != "unchanged"]
+        keys = {p["key"] for p in planned}
+        removed = [key for key in manifest.assets if key not in keys]
+        if manifest.assets:
+            status_callback(f"Library manifest: {len(todo)} new or changed, {len(materials) - len(todo)} unchanged, {len(removed)} removed material(s).")
+            if not todo and not removed and not dry_run:
+                status_callback(f"-> '{library_path}' is up to date."); status_callback("--- LIBRARY BUILD COMPLETE! ---"); return True
+        build = [materials[i] for i in todo]
+        if build and not dry_run: build = yield submit_work(use_local_maps, build, status_callback, mirror=False)
+        if proxy_tier and build: build = yield submit_work(use_proxy_maps, build, proxy_tier, status_callback)
+
+        chunks = yield submit_work(library_chunks, build, chunk_size)
+        if dry_run:
+            status_callback(f"Dry run: generated {len(chunks)} script chunk(s) for {len(build)} material(s).")
+            return chunks
+
+        drop = [planned[i]["key"] for i in todo if planned[i]["status"] == "changed"] + removed
+        built = yield from iter_execute_library_chunks(chunks, library_path, status_callback, drop if manifest.assets else None)
+        for i, p in enumerate(planned):
+            if p["status"] == "unchanged": manifest.record(p)
+        for position in built: manifest.record(planned[todo[position]])
+        # A changed material that failed was dropped from the library, so it must be built again next time.
+        for position in set(range(len(todo))) - set(built): manifest.remove(planned[todo[position]]["key"])
+        for key in removed: manifest.remove(key)
+        manifest.save(manifest_path)
+        total_time = time.perf_counter() - start_time
+        if len(built) < len(build): status_callback(f"!!! WARNING: {len(build) - len(built)} material(s) failed. Check Listener for details.")
+        status_callback(f"-> Saved {len(built)} material(s) to '{library_path}' in {total_time:.2f}s ({len(built) / max(total_time, 1e-6):.1f} materials/s).")
+    except Exception as e:
+        error_message = f"An error occurred: {e}"
+        status_callback(f"!!! SCRIPT ERROR: {error_message}")
+        rt.messageBox(error_message, title="Script Error")
+        return False
+    status_callback("--- LIBRARY BUILD COMPLETE! ---"); return True
+
+def iter_execute_library_chunks(chunks, library_path, status_callback, update=None):
+    """ Job that runs the library_chunks scripts into a new material library and saves it to library_path. With
+        update (a list of asset keys), the existing library is loaded instead and its materials tagged with those keys
+        are deleted first. Returns the indexes of the materials built; raises when the library cannot be saved. """
+    if update is None:
+        execute_maxscript("global gsgLibraryBuild = materialLibrary(); OK", "library setup")
+    else:
+        keys = ", ".join(mxs_string(key) for key in update)
+        mxs_command = f"""
+        global gsgLibraryBuild = loadTempMaterialLibrary {mxs_path(library_path)}
+        (
+            if gsgLibraryBuild == undefined do gsgLibraryBuild = materialLibrary()
+            local drop = Dictionary #string
+            for k in #({keys}) do PutDictValue drop k true
+            for i = gsgLibraryBuild.count to 1 by -1 do (local k = getAppData gsgLibraryBuild[i] {TAG_APPDATA_ID}; if k != undefined and HasDictValue drop k do deleteItem gsgLibraryBuild i)
+            gsgLibraryBuild.count
+        )
+        """
+        kept = execute_maxscript(mxs_command, "library setup")
+        status_callback(f"Updating '{library_path}': {kept} material(s) kept, {len(update)} changed or removed.")
+    built = []; exec_start = time.perf_counter()
+    try:
+        for index, chunk in enumerate(chunks):
+            built += [int(i) for i in execute_maxscript(chunk, "library chunk") or []]
+            elapsed = time.perf_counter() - exec_start
+            status_callback(f"-> Batch {index + 1}/{len(chunks)}: {len(built)} material(s) built ({len(built) / max(elapsed, 1e-6):.1f} materials/s).")
+            yield (index + 1, len(chunks))
+    except JobCancelled:
+        execute_maxscript("gsgLibraryBuild = undefined; OK", "library cleanup")
+        status_callback(f"!!! Library build cancelled after {len(built)} material(s); nothing was saved.")
+        raise
+    result = execute_maxscript(f'saveTempMaterialLibrary ::gsgLibraryBuild {mxs_path(library_path)}; gsgLibraryBuild = undefined; "OK"', "saveTempMaterialLibrary")
+    if result != "OK": raise Exception("Saving the material library failed. Check Listener for errors.")
+    return built
+
+def activate_octane_renderer():
+    """ Makes Octane the current renderer if it is installed (a fresh 3ds Max batch session starts with the default
+        renderer). Returns whether Octane is the current renderer. """
+    mxs_command = """
+    (
+        if not (matchPattern ((classOf renderers.current) as string) pattern:"*octane*") do
+            for c in RendererClass.classes where matchPattern (c as string) pattern:"*octane*" do (renderers.current = c(); exit)
+        matchPattern ((classOf renderers.current) as string) pattern:"*octane*"
+    )
+    """
+    return bool(execute_maxscript(mxs_command, "activate Octane"))
+
+def merge_material_libraries(library_paths, output_path, status_callback):
+    """ Appends the materials of every .mat file in library_paths to one library saved as output_path, in one
+        rt.execute. Returns the number of materials in the merged library; raises when it cannot be saved. """
+    paths = ", ".join(mxs_path(p) for p in library_paths)
+    mxs_command = f"""
+    (
+        local merged = materialLibrary()
+        for f in #({paths}) do (
+            local lib = loadTempMaterialLibrary f
+            if lib == undefined then format "GSG: could not load %\n" f else for m in lib do append merged m
+        )
+        if saveTempMaterialLibrary merged {mxs_path(output_path)} then merged.count else -1
+    )
+    """
+    merged = int(execute_maxscript(mxs_command, "merge material libraries"))
+    if merged < 0: raise Exception(f"Saving the merged material library '{output_path}' failed. Check Listener for errors.")
+    status_callback(f"-> Merged {len(library_paths)} librar(ies) into '{output_path}': {merged} material(s).")
+    return merged
+
+def repath_scene_textures(resolve_path, status_callback):
+    """ Points every RGB_image in the scene whose filename resolve_path maps to a new path at that path, in one rt.execute.
+        resolve_path takes a scene filename and returns the replacement or None. Returns the number of nodes changed. """
+    filenames = [str(f) for f in execute_maxscript("for t in getClassInstances RGB_image where t.filename != undefined collect t.filename", "collect texture paths") or []]
+    remap = {}
+    for filename in dict.fromkeys(filenames):
+        target = resolve_path(filename)
+        if target and target != filename: remap[filename.replace("\\", "/")] = target.replace("\\", "/")
+    if not remap:
+        status_callback("No texture nodes needed repathing."); return 0
+    puts = "\n".join(f'PutDictValue remap {mxs_path(old)} {mxs_path(new)}' for old, new in remap.items())
+    mxs_command = f'''
+    (
+        local remap = Dictionary #string
+        {puts}
+        local changed = 0
+        for t in getClassInstances RGB_image where t.filename != undefined do (
+            local key = substituteString t.filename "\\\\" "/"
+            if HasDictValue remap key do (t.filename = GetDictValue remap key; changed += 1)
+        )
+        changed
+    )
+    '''
+    changed = int(execute_maxscript(mxs_command, "repath textures") or 0)
+    status_callback(f"-> Repathed {changed} texture node(s) ({len(remap)} file(s)).")
+    return changed
+
+def restore_full_resolution_textures(status_callback):
+    """ Swaps every proxy texture in the scene back to its full-resolution source, e.g. before a final render. """
+    status_callback("--- Restoring full-resolution textures ---")
+    try:
+        cache = get_proxy_cache()
+        repath_scene_textures(cache.source_of, status_callback)
+    except Exception as e:
+        status_callback(f"!!! ERROR: Could not restore full-resolution textures. {e}"); return False
+    status_callback("--- Restore Complete ---"); return True
+
+def iter_localize_scene_textures(status_callback):
+    """ Job that copies every scene texture stored on a network share to the mirror cache and points the scene at
+        the copies. Returns the number of texture nodes changed. """
+    status_callback("--- Copying scene textures to the local mirror ---")
+    try:
+        filenames = [str(f) for f in execute_maxscript("for t in getClassInstances RGB_image where t.filename != undefined collect t.filename", "collect texture paths") or []]
+        network_paths = [f for f in dict.fromkeys(filenames) if is_network_path(f)]
+        if not network_paths:
+            status_callback("No scene textures are on a network share."); return 0
+        mirrored = yield submit_work(get_mirror_cache().ensure, network_paths, status_callback)
+        changed = repath_scene_textures(lambda f: mirrored.get(f), status_callback)
+    except Exception as e:
+        status_callback(f"!!! ERROR: Could not mirror the scene textures. {e}"); return 0
+    status_callback("--- Mirror Complete ---"); return changed
+
+def restore_network_textures(status_callback):
+    """ Points every mirrored texture in the scene back at its file on the network share. """
+    status_callback("--- Repathing scene textures to the network share ---")
+    try:
+        repath_scene_textures(get_mirror_cache().source_of, status_callback)
+    except Exception as e:
+        status_callback(f"!!! ERROR: Could not repath the scene textures. {e}"); return False
+    status_callback("--- Repath Complete ---"); return True
+
+def clear_mirror_cache(status_callback):
+    cache = get_mirror_cache(); removed = cache.clear()
+    stats = cache.stats
+    status_callback(f"Cleared the mirror cache ({removed} file(s) removed). This session: {stats['hits']} hit(s), {stats['copies']} copied ({stats['bytes_copied'] / 1e6:.1f} MB), {stats['bytes_saved'] / 1e6:.1f} MB served locally.")
+
+def iter_analyze_hdri(file_path, status_callback):
+    """ Job that streams an HDRI on a worker thread (or loads its cached analysis) and logs the results.
+        Returns (stats, preview), or None when the analysis is unavailable or failed. """
+    if importlib.util.find_spec("numpy") is None:
+        status_callback("!!! WARNING: HDRI analysis requires numpy (python -m pip install numpy). Auto exposure is disabled."); return None
+    status_callback(f"--- Analyzing '{os.path.basename(file_path)}' ---")
+    start = time.perf_counter()
+    try:
+        if split_archive_path(file_path): file_path = (yield submit_work(localize_paths, [file_path], status_callback, mirror=False))[file_path]
+        stats, preview, cached = yield submit_work(analyze_hdri_cached, file_path)
+    except Exception as e:
+        status_callback(f"!!! ERROR: Could not analyze HDRI. {e}"); return None
+    source = "cache" if cached else f"{stats['width'] * stats['height'] / (time.perf_counter() - start) / 1e6:.0f} MP/s"
+    status_callback(f"-> {stats['width']} x {stats['height']} analyzed in {time.perf_counter() - start:.2f}s ({source}).")
+    status_callback(f"-> Luminance: average {stats['average_luminance']:.3f}, log average {stats['log_average_luminance']:.3f}, peak {stats['peak_luminance']:.1f}")
+    status_callback(f"-> Suggested power: {suggest_power(stats, HDRI_TARGET_KEY)}")
+    sun = stats.get("sun")
+    if sun:
+        status_callback(f"-> Sun at azimuth {sun['azimuth']:.1f}, elevation {sun['elevation']:.1f} ({sun['energy_fraction']:.0%} of the light); rotate the environment by {suggest_rotation(stats, HDRI_SUN_AZIMUTH)} degrees to put it at {HDRI_SUN_AZIMUTH:g}.")
+    else:
+        status_callback("-> No dominant sun found.")
+    return stats, preview
+
+def create_octane_hdri(file_path, status_callback, power=1.0):
+    return run_job(iter_create_octane_hdri(file_path, status_callback, power))
+
+def iter_create_octane_hdri(file_path, status_callback, power=1.0):
+    """ Job that makes the HDRI the scene environment. The Texture_environment created for it by an earlier run is
+        reused (and its texture reloaded if the file changed) instead of adding another one. A file on a network share
+        or inside an archive is copied to the local caches on a worker thread first. """
+    status_callback("--- Creating Octane HDRI Environment ---")
+    try:
+        key = AssetManifest.asset_key("hdri", file_path)
+        planned = load_scene_manifest(["Texture_environment"]).plan([(key, os.path.basename(file_path), [file_path], None)])[0]
+        local_path = (yield submit_work(localize_paths, [file_path], status_callback)).get(file_path, file_path)
+        builder = ScriptBuilder()
+        tex = builder.bitmap(local_path, LINEAR_GAMMA)
+        env = builder.find_tagged("env", "Texture_environment", key)
+        builder.raw("local isNew = env == undefined; if isNew do env = Texture_environment()")
+        builder.tag(env, key, AssetManifest.entry_json(planned))
+        builder.set(env, "power", power)
+        builder.set(env, "importance_sampling", True)
+        builder.connect(env, "texture_tex", tex, "texture_input_type")
+        builder.raw("environmentMap = env")
+        if planned["status"] == "changed": builder.raw("freeSceneBitmaps()")
+        builder.raw("if isNew do (")
+        builder.place(tex, 200, 150)
+        builder.place(env, 450, 200)
+        builder.raw(")")
+        mxs_command = builder.build('"OK"')
+        result = execute_maxscript(mxs_command, "hdri environment")
+        if result != "OK": raise Exception("MaxScript failed.")
+        if planned["status"] == "new": status_callback(f"SUCCESS: Environment set (power {power:g}) and nodes created for '{os.path.basename(file_path)}'")
+        else: status_callback(f"SUCCESS: Environment updated (power {power:g}) for '{os.path.basename(file_path)}'" + (", texture reloaded." if planned["status"] == "changed" else "."))
+    except Exception as e:
+        status_callback(f"!!! ERROR: Could not create HDRI environment. {e}")
+
+def list_browser_assets(root_folder, status_callback=None):
+    """ Returns the materials, HDRIs and FBX files below root_folder (a folder or an archive) as asset browser items,
+        sorted by path within each kind. An item is a dict with kind, name, path and thumbnail (the image its thumbnail
+        is made from, or None). """
+    items = []
+    for material in list_materials(root_folder, status_callback):
+        maps = material["maps"]
+        thumbnail = maps.get("albedo") or next((path for path in maps.values() if path), None)
+        items.append({"kind": "material", "name": material["name"], "path": material["folder"], "thumbnail": thumbnail})
+    files = list_files(root_folder, HDRI_EXTENSIONS + ['.fbx'], recursive=True)
+    items += [{"kind": "hdri", "name": os.path.basename(f), "path": f, "thumbnail": f} for f in files if not f.lower().endswith('.fbx')]
+    items += [{"kind": "fbx", "name": os.path.basename(f), "path": f, "thumbnail": None} for f in files if f.lower().endswith('.fbx')]
+    return items
+
+def import_fbx_files(folder_path, status_callback, recursive=False, use_cache=True):
+    return run_job(iter_import_fbx_files(folder_path, status_callback, recursive, use_cache))
+
+def _import_fbx_cached(full_path, cache, key, tag=None, replace=False):
+    """ Imports one FBX, through the cache when key is given. tag is (asset key, manifest entry) to store on the
+        imported objects; with replace, the objects already tagged with that asset key are deleted once the import
+        succeeded. Returns 'hit' or 'miss'; raises when 3ds Max reports a failure. """
+    cached_path = cache.lookup(key) if key else None
+    temp_path = cache.path_for(key) + ".tmp.max" if key and not cached_path else None
+    if cached_path: load = f"mergeMAXFile {mxs_path(cached_path)} #autoRenameDups #useSceneMtlDups quiet:true"
+    else: load = f"importFile {mxs_path(full_path)} #noPrompt"
+    old = f"for o in objects where getAppData o {TAG_APPDATA_ID} == {mxs_string(tag[0])} collect o" if tag and replace else "#()"
+    # Objects added by the import are found by node handle; a translated FBX is saved as a native scene for the next time.
+    mxs_command = f'''
+    (
+        local known = #{{}}
+        for o in objects do known[o.inode.handle] = true
+        local old = {old}
+        if not ({load}) then -1 else (
+            local added = for o in objects where not known[o.inode.handle] collect o
+            {f"if added.count > 0 do saveNodes added {mxs_path(temp_path)} quiet:true" if temp_path else ""}
+            delete old
+            {f"for o in added do ({tag_code('o', tag[0], tag[1])})" if tag else ""}
+            added.count
+        )
+    )
+    '''
+    object_count = int(execute_maxscript(mxs_command, "mergeMAXFile" if cached_path else "importFile + saveNodes" if temp_path else "importFile"))
+    if object_count < 0: raise Exception("Merging the cached scene failed." if cached_path else "importFile returned false.")
+    if cached_path: return "hit"
+    if object_count and temp_path and os.path.isfile(temp_path):
+        os.replace(temp_path, cache.path_for(key)); cache.store(key, full_path, object_count)
+    return "miss"
+
+def iter_import_fbx_files(folder_path, status_callback, recursive=False, use_cache=True):
+    """ Job version of import_fbx_files; it can be cancelled between files.
+        Identical FBX files (same content under different names) are imported once. With use_cache each FBX is translated
+        once and merged from the FBX import cache afterwards. FBX files already imported and unchanged since are skipped;
+        changed ones replace the objects of their earlier import. folder_path may be an archive or a folder inside one;
+        only the FBX files that have to be translated are extracted. """
+    status_callback(f"--- Importing FBX files from: {folder_path} ---")
+    fbx_files = yield submit_work(list_files, folder_path, ['.fbx'], recursive)
+    if not fbx_files:
+        status_callback("No .fbx files found."); return
+    yield from iter_import_fbx_file_list(fbx_files, status_callback, use_cache)
+
+def iter_import_fbx_file_list(fbx_files, status_callback, use_cache=True):
+    """ Job that imports the given FBX files; see iter_import_fbx_files. """
+    settings_signature = fbx_settings_signature()
+    manifest = load_scene_manifest(objects=True)
+    status_callback(f"Hashing {len(fbx_files)} FBX file(s)...")
+    planned = yield submit_work(manifest.plan, [(AssetManifest.asset_key("fbx", path), os.path.basename(path), [path], settings_signature) for path in fbx_files], full=True)
+    update_scene_records([p for p in planned if p["stale"]], objects=True)
+    digests = [(p["files"][full_path] or [None] * 3)[2] for full_path, p in zip(fbx_files, planned)]
+    # Content already in the scene from an unchanged file counts as imported, so its copies stay skipped on every run.
+    imported = {}
+    for full_path, p, digest in zip(fbx_files, planned, digests):
+        if p["status"] == "unchanged" and digest: imported.setdefault(digest, full_path)
+    unique = {}; skipped = sum(1 for p in planned if p["status"] == "unchanged")
+    for full_path, p, digest in zip(fbx_files, planned, digests):
+        if p["status"] == "unchanged": continue
+        original = imported.get(digest) or (unique[digest][0] if digest in unique else None)
+        if original: status_callback(f"-> Skipping '{os.path.basename(full_path)}', identical to '{os.path.basename(original)}'.")
+        else: unique[digest] = (full_path, p)
+    if skipped: status_callback(f"{skipped} FBX file(s) unchanged since the last import, {len(unique)} to import.")
+    cache = get_fbx_cache() if use_cache else None
+    # Only files the FBX import cache cannot serve are read by the translator, so only those are extracted or mirrored.
+    translate = [full_path for digest, (full_path, _) in unique.items() if not cache or not os.path.isfile(cache.path_for(FBXImportCache.cache_key(digest, settings_signature)))]
+    local = yield submit_work(localize_paths, translate, status_callback)
+    hits = 0; removed = 0; start_time = time.perf_counter()
+    try:
+        for i, (digest, (full_path, p)) in enumerate(unique.items()):
+            filename = os.path.basename(full_path); status_callback(f"-> {'Re-importing' if p['status'] == 'changed' else 'Importing'} '{filename}'...")
+            try:
+                tag = (p["key"], AssetManifest.entry_json(p))
+                if _import_fbx_cached(local.get(full_path, full_path), cache, FBXImportCache.cache_key(digest, settings_signature) if cache else None, tag, p["status"] == "changed") == "hit":
+                    hits += 1; status_callback("   merged from the FBX import cache.")
+            except Exception as e: status_callback(f"!!! ERROR: Failed to import '{filename}'. {e}")
+            yield (i + 1, len(unique))
+    finally:
+        # Eviction and the index write run once per batch (also when cancelled), not once per translated file.
+        if cache: removed = cache.save()
+    if cache:
+        status_callback(f"FBX import cache: {hits} hit(s), {len(unique) - hits} translated in {time.perf_counter() - start_time:.2f}s." + (f" Evicted {removed} old entr(ies)." if removed else ""))
+    status_callback("--- FBX Import Complete ---")
+
+def clear_fbx_cache(status_callback):
+    removed = get_fbx_cache().clear()
+    status_callback(f"Cleared the FBX import cache ({removed} scene(s) removed).")
+
+def import_textures_as_nodes(file_paths, status_callback, create_materials=False):
+    return run_job(iter_import_textures_as_nodes(file_paths, status_callback, create_materials))
+
+def iter_import_textures_as_nodes(file_paths, status_callback, create_materials=False):
+    """ Job version of import_textures_as_nodes. The files are grouped into texture sets (see group_texture_sets);
+        every set gets its bitmap nodes and, with create_materials, a Std_Surface_Mtl with its maps wired, laid out on
+        a compact grid in the active SME view (see layout_texture_sets). Everything is created in one rt.execute.
+        Textures and materials imported before are skipped, or reloaded and rebuilt if their files changed. Without
+        an SME view the nodes are still created, just not placed. Returns the sets, nodes, materials and failed counts. """
+    status_callback(f"--- Importing {len(file_paths)} textures as nodes ---")
+    stats = {"sets": 0, "nodes": 0, "materials": 0, "failed": 0}
+    try:
+        if not execute_maxscript("(sme.GetView sme.activeView) != undefined", "SME view check"):
+            status_callback("!!! WARNING: Could not get active SME view, so the nodes are created without a layout. Open the Slate Material Editor to have them placed.")
+        texture_sets = yield submit_work(group_texture_sets, file_paths)
+        stats["sets"] = len(texture_sets)
+        status_callback(f"Grouped {len(file_paths)} file(s) into {len(texture_sets)} texture set(s).")
+        class_names = ["RGB_image", "Std_Surface_Mtl"] if create_materials else ["RGB_image"]
+        manifest = load_scene_manifest(class_names)
+        textures = [path for texture_set in texture_sets for path, _ in texture_set["files"]]
+        with_maps = [i for i, texture_set in enumerate(texture_sets) if create_materials and texture_set["maps"]]
+        assets = [(AssetManifest.asset_key("texture", path), os.path.basename(path.replace("\\", "/")), [path], None) for path in textures]
+        planned = yield submit_work(manifest.plan, assets + [texture_set_asset(texture_sets[i]) for i in with_maps])
+        update_scene_records([p for p in planned if p["stale"]], class_names)
+        texture_plans = dict(zip(textures, planned)); material_plans = dict(zip(with_maps, planned[len(textures):]))
+        todo = [p for p in planned if p["status"] != "unchanged"]
+        if len(todo) < len(planned): status_callback(f"{len(planned) - len(todo)} texture(s) and material(s) unchanged since the last import, {len(todo)} to create.")
+        if not todo:
+            status_callback("--- Texture Import Complete ---"); return stats
+        local = yield submit_work(localize_paths, [path for path in textures if texture_plans[path]["status"] != "unchanged"] +
+                                  [path for i in with_maps if material_plans[i]["status"] != "unchanged" for path in texture_sets[i]["maps"].values()], status_callback)
+        gammas = {slot: gamma for slot, _, gamma in MATERIAL_MAP_SLOTS}
+        with span("codegen_texture_sets", sets=len(texture_sets)):
+            builder = ScriptBuilder()
+            builder.raw("local gsgDone = #()")
+            built = {}
+            for i, (texture_set, (x, y)) in enumerate(zip(texture_sets, layout_texture_sets(texture_sets, create_materials))):
+                nodes = [(row, path, slot, texture_plans[path]) for row, (path, slot) in enumerate(texture_set["files"]) if texture_plans[path]["status"] != "unchanged"]
+                material_plan = material_plans.get(i)
+                if material_plan and material_plan["status"] == "unchanged": material_plan = None
+                if not nodes and not material_plan: continue
+                label = f"texture set '{texture_set['name']}'"
+                builder.begin(label)
+                for row, path, slot, p in nodes:
+                    tex_node = builder.bitmap(local.get(path, path), gammas.get(slot, COLOR_GAMMA))
+                    builder.raw(f"if {tex_node.expression} != undefined do ({tex_node.expression}.name = {mxs_string(p['name'])}; {tag_code(tex_node.expression, p['key'], AssetManifest.entry_json(p))})")
+                    if p["status"] == "new": builder.place(tex_node, x, y + row * NODE_GRID_ROW)
+                if material_plan:
+                    material = {"name": texture_set["name"], "params": {}, "maps": {slot: local.get(path, path) for slot, path in texture_set["maps"].items()}}
+                    mtl = add_material_ops(builder, material, key=material_plan["key"], record=AssetManifest.entry_json(material_plan))
+                    if material_plan["status"] == "changed":
+                        old = builder.find_tagged("old", "Std_Surface_Mtl", material_plan["key"])
+                        builder.raw(f"if old != undefined do (replaceInstances old mtl; deleteAppData old {TAG_APPDATA_ID}; deleteAppData old {RECORD_APPDATA_ID})")
+                    else:
+                        builder.place(mtl, x + NODE_GRID_COLUMN, y)
+                builder.raw(f"append gsgDone {i}")
+                builder.end(label)
+                built[i] = (len(nodes), 1 if material_plan else 0)
+            if any(p["status"] == "changed" for p in todo): builder.raw("freeSceneBitmaps()")
+            mxs_command = builder.build("gsgDone")
+        done = {int(i) for i in execute_maxscript(mxs_command, "texture sets") or []}
+        for i, (node_count, material_count) in built.items():
+            if i not in done:
+                stats["failed"] += 1; status_callback(f"!!! ERROR: Creating texture set '{texture_sets[i]['name']}' failed. Check Listener for details."); continue
+            stats["nodes"] += node_count; stats["materials"] += material_count
+        yield (len(texture_sets), len(texture_sets))
+        status_callback(f"-> {stats['nodes']} texture node(s)" + (f" and {stats['materials']} material(s)" if create_materials else "") + f" created in {len(built) - stats['failed']} texture set(s).")
+        status_callback("--- Texture Import Complete ---")
+    except Exception as e: status_callback(f"!!! ERROR: An error occurred during import. {e}")
+    return stats
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# +                         SECTION 12: WARM START                    +
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+@traced()
+def warm_start(status_callback=None):
+    """ Opens the shared classifier, index and caches and loads numpy for HDRI work, so the first job does not pay for
+        it. Runs on a worker thread after the window is shown; what it opens is kept for the session, so later calls
+        return at once. Returns the last browsed library folder (or archive) if it still exists, else None. """
+    for label, opener in (("map rules", get_map_classifier), ("asset index", get_asset_index), ("texture proxy cache", get_proxy_cache),
+                          ("FBX import cache", get_fbx_cache), ("HDRI analysis cache", get_hdri_cache), ("network mirror cache", get_mirror_cache),
+                          ("archive cache", get_archive_cache)):
+        try: opener()
+        except Exception as e:
+            if status_callback: status_callback(f"!!! WARNING: Could not open the {label}. {e}")
+    if importlib.util.find_spec("numpy") is not None:
+        with span("import numpy"): import numpy
+    try: root_folder = get_asset_index().setting("browser_root")
+    except Exception: return None
+    return root_folder if root_folder and (os.path.isdir(root_folder) or split_archive_path(root_folder)) else None
@@ -0,0 +1,233 @@
+#
+#   GSG Asset Importer unofficial for Octane - HDRI analysis
+#   Streams Radiance .hdr (RGBE) and OpenEXR images in blocks of scanlines and reduces them to luminance
+#   statistics, the dominant sun direction and a small tonemapped preview. Only one block of scanlines is held
+#   in memory at a time, so a 16K HDRI is analyzed in a few dozen MB. Requires numpy; EXR files also need the
+#   OpenEXR module. No Qt or pymxs imports, so it can be benchmarked outside 3ds Max.
+#
+#   License: MIT License (see LICENSE)
+#
+
+import os
+import mmap
+import math
+np = None  # numpy, imported on first use by _require_numpy() so importing this module stays cheap
+
+# Bump when the statistics change, so cached analyses are recomputed
+ANALYSIS_VERSION = 1
+# Rec. 709 luminance weights
+LUMINANCE_WEIGHTS = (0.2126, 0.7152, 0.0722)
+# Size of one block of float32 RGB scanlines handed to the accumulator
+BLOCK_BYTES = 16 * 1024 * 1024
+PREVIEW_WIDTH = 512
+# A sun is the set of preview cells brighter than SUN_THRESHOLD x the brightest cell; it must carry at least
+# SUN_MIN_ENERGY of the total light while covering at most SUN_MAX_AREA of the sphere.
+SUN_THRESHOLD = 0.5
+SUN_MIN_ENERGY = 0.05
+SUN_MAX_AREA = 0.01
+LOG_EPSILON = 1e-4
+
+
+def _require_numpy():
+    global np
+    if np is not None: return
+    try: import numpy as np
+    except ImportError: raise RuntimeError("HDRI analysis requires numpy (python -m pip install numpy).") from None
+
+
+# --- Radiance RGBE reader ---
+
+def _read_rgbe_header(mm):
+    """ Parses the text header. Returns (width, height, offset of the first scanline, exposure). """
+    magic_end = mm.find(b"\n")
+    if not (mm[:magic_end].startswith(b"#?RADIANCE") or mm[:magic_end].startswith(b"#?RGBE")): raise ValueError("Not a Radiance HDR file.")
+    pos = magic_end + 1; exposure = 1.0
+    while True:
+        end = mm.find(b"\n", pos)
+        if end < 0: raise ValueError("Truncated HDR header.")
+        line = mm[pos:end].strip(); pos = end + 1
+        if not line: break
+        if line.startswith(b"FORMAT=") and line != b"FORMAT=32-bit_rle_rgbe": raise ValueError(f"Unsupported HDR format '{line[7:].decode(errors='replace')}'.")
+        if line.startswith(b"EXPOSURE="): exposure *= float(line[9:])
+    end = mm.find(b"\n", pos)
+    parts = mm[pos:end].split()
+    if len(parts) != 4 or parts[0] != b"-Y" or parts[2] != b"+X": raise ValueError(f"Unsupported HDR orientation '{mm[pos:end].decode(errors='replace')}'.")
+    return int(parts[3]), int(parts[1]), end + 1, exposure
+
+
+def _read_rgbe_scanline(view, pos, width, row):
+    """ Decodes one scanline starting at pos into row (a bytearray of 4 * width bytes, channel-planar). Returns the new position. """
+    if 8 <= width < 32768 and view[pos] == 2 and view[pos + 1] == 2 and (view[pos + 2] << 8 | view[pos + 3]) == width:
+        pos += 4; x = 0; end = 4 * width
+        while x < end:
+            count = view[pos]
+            if count > 128:
+                count -= 128; row[x:x + count] = bytes((view[pos + 1],)) * count; pos += 2
+            else:
+                row[x:x + count] = view[pos + 1:pos + 1 + count]; pos += 1 + count
+            x += count
+        if x != end: raise ValueError("Corrupt RLE scanline.")
+        return pos
+    # Flat (uncompressed) scanline: interleaved RGBE pixels.
+    flat = np.frombuffer(view[pos:pos + 4 * width], dtype=np.uint8)
+    if len(flat) != 4 * width: raise ValueError("Truncated HDR file.")
+    if width and flat[0] == 1 and flat[1] == 1 and flat[2] == 1: raise ValueError("Old-style RLE HDR files are not supported.")
+    row[:] = flat.reshape(width, 4).T.tobytes()
+    return pos + 4 * width
+
+
+def iter_rgbe_blocks(file_path, block_rows=None):
+    """ Yields (first row, width, height, float32 array of shape (rows, width, 3)) for consecutive blocks of a .hdr file.
+        The file is memory mapped and decoded one scanline at a time. """
+    _require_numpy()
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        width, height, pos, exposure = _read_rgbe_header(mm)
+        block_rows = block_rows or max(1, BLOCK_BYTES // (width * 12))
+        view = memoryview(mm)
+        try:
+            row = bytearray(4 * width)
+            for first in range(0, height, block_rows):
+                rows = min(block_rows, height - first)
+                rgbe = np.empty((rows, 4, width), dtype=np.uint8)
+                for r in range(rows):
+                    pos = _read_rgbe_scanline(view, pos, width, row)
+                    rgbe[r] = np.frombuffer(row, dtype=np.uint8).reshape(4, width)
+                scale = np.ldexp(np.float32(1.0 / exposure), rgbe[:, 3].astype(np.int32) - 136).astype(np.float32)
+                scale[rgbe[:, 3] == 0] = 0.0
+                yield first, width, height, (rgbe[:, :3] * scale[:, None, :]).transpose(0, 2, 1)
+                del rgbe, scale
+        finally:
+            view.release()
+
+
+# --- OpenEXR reader ---
+
+def iter_exr_blocks(file_path, block_rows=None):
+    """ Yields blocks like iter_rgbe_blocks for an .exr file, reading scanline ranges through the OpenEXR module. """
+    _require_numpy()
+    try:
+        import OpenEXR, Imath
+    except ImportError:
+        raise RuntimeError("EXR analysis requires the OpenEXR module (python -m pip install OpenEXR).")
+    exr = OpenEXR.InputFile(file_path)
+    try:
+        header = exr.header(); window = header['dataWindow']
+        width = window.max.x - window.min.x + 1; height = window.max.y - window.min.y + 1
+        names = [c for c in ("R", "G", "B") if c in header['channels']] or [next(iter(header['channels']))]
+        pixel_type = Imath.PixelType(Imath.PixelType.FLOAT)
+        block_rows = block_rows or max(1, BLOCK_BYTES // (width * 12))
+        for first in range(0, height, block_rows):
+            rows = min(block_rows, height - first)
+            planes = exr.channels(names, pixel_type, window.min.y + first, window.min.y + first + rows - 1)
+            planes = [np.frombuffer(p, dtype=np.float32).reshape(rows, width) for p in planes]
+            if len(planes) == 1: planes *= 3
+            yield first, width, height, np.stack(planes, axis=-1)
+    finally:
+        exr.close()
+
+
+def iter_hdri_blocks(file_path, block_rows=None):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".hdr": return iter_rgbe_blocks(file_path, block_rows)
+    if extension == ".exr": return iter_exr_blocks(file_path, block_rows)
+    raise ValueError(f"Unsupported HDRI format '{extension}'.")
+
+
+# --- Statistics ---
+
+class HDRIAccumulator:
+    """ Reduces blocks of scanlines to solid-angle weighted luminance sums, the peak pixel and a box-filtered
+        preview grid. For latitude-longitude (2:1) images every row is weighted by the solid angle it covers. """
+    def __init__(self, width, height, preview_width=PREVIEW_WIDTH):
+        _require_numpy()
+        self.width = width; self.height = height
+        self.panoramic = abs(width / height - 2.0) < 0.05
+        self.preview_width = min(preview_width, width)
+        self.preview_height = max(1, min(height, round(self.preview_width * height / width)))
+        self._col_starts = (np.arange(self.preview_width) * width) // self.preview_width
+        self._col_counts = np.diff(np.append(self._col_starts, width))
+        self._grid = np.zeros((self.preview_height, self.preview_width, 3), dtype=np.float64)
+        self._row_counts = np.zeros(self.preview_height, dtype=np.int64)
+        self._weights = np.float32(LUMINANCE_WEIGHTS)
+        self.sum_weight = 0.0; self.sum_luminance = 0.0; self.sum_log = 0.0
+        self.peak = 0.0; self.peak_xy = (0, 0)
+
+    def add(self, first_row, rgb):
+        rows = rgb.shape[0]
+        y = np.arange(first_row, first_row + rows)
+        weight = np.cos((0.5 - (y + 0.5) / self.height) * math.pi).astype(np.float32) if self.panoramic else np.ones(rows, dtype=np.float32)
+        luminance = rgb @ self._weights
+        self.sum_weight += float(weight.sum()) * self.width
+        self.sum_luminance += float(luminance.sum(axis=1, dtype=np.float64) @ weight)
+        self.sum_log += float(np.log(luminance + LOG_EPSILON).sum(axis=1, dtype=np.float64) @ weight)
+        index = int(np.argmax(luminance))
+        if luminance.flat[index] > self.peak: self.peak = float(luminance.flat[index]); self.peak_xy = (index % self.width, first_row + index // self.width)
+        # Box filter into the preview grid: columns through reduceat, then runs of rows sharing a preview row.
+        preview_rows = (y * self.preview_height) // self.height
+        starts = np.flatnonzero(np.diff(preview_rows, prepend=-1))
+        columns = np.add.reduceat(rgb, self._col_starts, axis=1, dtype=np.float64)
+        self._grid[preview_rows[starts]] += np.add.reduceat(columns, starts, axis=0)
+        self._row_counts[preview_rows[starts]] += np.diff(np.append(starts, rows))
+
+    def grid(self):
+        """ The mean linear RGB of every preview cell. """
+        return self._grid / np.maximum(self._row_counts[:, None, None] * self._col_counts[None, :, None], 1)
+
+    def _sun(self, grid_luminance):
+        if not self.panoramic: return None
+        h, w = grid_luminance.shape
+        latitude = (0.5 - (np.arange(h) + 0.5) / h) * math.pi
+        area = np.repeat((np.cos(latitude) / np.cos(latitude).sum() / w)[:, None], w, axis=1)
+        energy = grid_luminance * area
+        mask = grid_luminance >= SUN_THRESHOLD * grid_luminance.max()
+        fraction = float(energy[mask].sum() / max(energy.sum(), 1e-12))
+        if fraction < SUN_MIN_ENERGY or area[mask].sum() > SUN_MAX_AREA: return None
+        longitude = ((np.arange(w) + 0.5) / w - 0.5) * 2.0 * math.pi
+        lat, lon = np.meshgrid(latitude, longitude, indexing="ij")
+        e = energy * mask
+        direction = np.array([(e * np.cos(lat) * np.cos(lon)).sum(), (e * np.cos(lat) * np.sin(lon)).sum(), (e * np.sin(lat)).sum()])
+        direction /= max(np.linalg.norm(direction), 1e-12)
+        return {"azimuth": round(math.degrees(math.atan2(direction[1], direction[0])), 2), "elevation": round(math.degrees(math.asin(direction[2])), 2), "energy_fraction": round(fraction, 4)}
+
+    def result(self):
+        grid = self.grid()
+        grid_luminance = grid @ np.float64(LUMINANCE_WEIGHTS)
+        stats = {
+            "version": ANALYSIS_VERSION, "width": self.width, "height": self.height, "panoramic": self.panoramic,
+            "average_luminance": self.sum_luminance / max(self.sum_weight, 1e-12),
+            "log_average_luminance": math.exp(self.sum_log / max(self.sum_weight, 1e-12)),
+            "peak_luminance": self.peak, "peak_pixel": list(self.peak_xy),
+        }
+        stats["sun"] = self._sun(grid_luminance)
+        return stats, tonemap_preview(grid, stats["log_average_luminance"])
+
+
+def tonemap_preview(grid, log_average, key=0.18):
+    """ Reinhard tonemap of a linear RGB grid exposed so its log-average luminance maps to key. Returns uint8 (h, w, 3). """
+    _require_numpy()
+    exposed = grid * (key / max(log_average, LOG_EPSILON))
+    display = np.power(exposed / (1.0 + exposed), 1.0 / 2.2)
+    return np.clip(display * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+
+def analyze_hdri(file_path, preview_width=PREVIEW_WIDTH, block_rows=None):
+    """ Streams an HDRI and returns (stats, preview). stats is a JSON-serializable dict; preview an uint8 RGB array. """
+    accumulator = None
+    for first, width, height, rgb in iter_hdri_blocks(file_path, block_rows):
+        if accumulator is None: accumulator = HDRIAccumulator(width, height, preview_width)
+        accumulator.add(first, rgb)
+    if accumulator is None: raise ValueError("Empty HDRI.")
+    return accumulator.result()
+
+
+def suggest_power(stats, target_key):
+    """ The Texture_environment power that brings the log-average luminance to target_key, to 3 significant digits.
+        The log average ignores the sun, so sunny and overcast HDRIs end up with a similar ambient level. """
+    power = min(max(target_key / max(stats["log_average_luminance"], LOG_EPSILON), 0.001), 1000.0)
+    return float(f"{power:.3g}")
+
+
+def suggest_rotation(stats, target_azimuth):
+    """ Degrees to rotate the environment around the up axis so the sun sits at target_azimuth, or None without a sun. """
+    if not stats.get("sun"): return None
+    return round((target_azimuth - stats["sun"]["azimuth"]) % 360.0, 1)
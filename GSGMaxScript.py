@@ -0,0 +1,187 @@
+#
+#   GSG Asset Importer unofficial for Octane - MaxScript code generation
+#   Builds the MaxScript sent to 3ds Max from a list of node operations. Plain Python with no Qt or pymxs
+#   imports, so the generated code can be inspected and tested outside 3ds Max.
+#
+#   License: MIT License (see LICENSE)
+#
+
+import os
+
+# Gamma of color maps; data maps (roughness, normal, ...) and HDRIs are loaded linear
+COLOR_GAMMA = 2.2
+LINEAR_GAMMA = 1.0
+# AppData slots holding the asset key and the manifest entry (JSON) on the materials, environments, texture nodes
+# and objects the importer creates
+TAG_APPDATA_ID = 0x47534731
+RECORD_APPDATA_ID = 0x47534732
+
+
+def mxs_string(value):
+    """ Returns value as a MaxScript string literal with backslashes, quotes and control characters escaped. """
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+    return f'"{text}"'
+
+
+def mxs_path(path):
+    """ Returns a file path as a MaxScript string literal, with forward slashes like the rest of the importer. """
+    return mxs_string(str(path).replace("\\", "/"))
+
+
+def tag_code(target, key, record=None):
+    """ MaxScript storing an asset key (and its manifest entry) in the AppData of target. """
+    code = f"setAppData {target} {TAG_APPDATA_ID} {mxs_string(key)}"
+    return code if record is None else f"{code}; setAppData {target} {RECORD_APPDATA_ID} {mxs_string(record)}"
+
+
+def mxs_value(value):
+    """ Returns a Python value as a MaxScript literal. Dicts with r/g/b keys in 0..1 become colors. """
+    if isinstance(value, bool): return "true" if value else "false"
+    if isinstance(value, (int, float)): return repr(value)
+    if isinstance(value, dict): return f'color {value.get("r", 0) * 255} {value.get("g", 0) * 255} {value.get("b", 0) * 255}'
+    if isinstance(value, Ref): return value.expression
+    return mxs_string(value)
+
+
+class Ref:
+    """ A reference to a MaxScript variable or expression, used as an operation value instead of a literal. """
+    def __init__(self, expression):
+        self.expression = expression
+
+    def __repr__(self):
+        return f"Ref({self.expression!r})"
+
+
+class BitmapRef(Ref):
+    """ A reference to a shared bitmap slot of a ScriptBuilder batch. """
+    def __init__(self, slot):
+        super().__init__(f"gsgBitmaps[{slot}]")
+        self.slot = slot
+
+
+class ScriptBuilder:
+    """ Collects node operations for one batch and emits them as a single MaxScript block.
+
+        Every bitmap request for the same file and gamma shares one RGB_image: within the batch through a slot in
+        the 'gsgBitmaps' array, and across batches by reusing the RGB_image nodes already in the scene. Missing files
+        leave their slot undefined, so connect() skips them like the doesFileExist checks it replaces.
+
+        Operations are kept in self.ops as tuples so the batch can be inspected before build() renders it:
+            ("bitmap", slot, path, gamma)              ("create", var, class_name, name)
+            ("set", target, prop, value)               ("connect", target, prop, slot, input_type_prop)
+            ("begin", label) / ("end", label)          ("place", target, x, y)
+            ("tag", target, key, record)               ("find", var, class_name, key)
+            ("raw", code) """
+    def __init__(self):
+        self.ops = []
+        self._bitmap_slots = {}
+        self.bitmap_requests = 0
+        self._uses_view = False
+        self._tagged_classes = []
+
+    @property
+    def bitmap_count(self):
+        """ Number of distinct bitmaps this batch references. """
+        return len(self._bitmap_slots)
+
+    def bitmap(self, path, gamma=COLOR_GAMMA):
+        """ Requests a shared RGB_image for path and returns a BitmapRef to it. """
+        self.bitmap_requests += 1
+        key = (os.path.normcase(os.path.normpath(path)).replace("\\", "/"), float(gamma))
+        slot = self._bitmap_slots.get(key)
+        if slot is None:
+            slot = self._bitmap_slots[key] = len(self._bitmap_slots) + 1
+            self.ops.append(("bitmap", slot, path, float(gamma)))
+        return BitmapRef(slot)
+
+    def create(self, var, class_name, name=None):
+        self.ops.append(("create", var, class_name, name))
+        return Ref(var)
+
+    def set(self, target, prop, value):
+        self.ops.append(("set", target.expression if isinstance(target, Ref) else target, prop, value))
+
+    def connect(self, target, prop, bitmap_ref, input_type_prop=None):
+        """ Plugs a bitmap into target.prop (switching input_type_prop to texture input) when the file exists. """
+        self.ops.append(("connect", target.expression if isinstance(target, Ref) else target, prop, bitmap_ref.slot, input_type_prop))
+
+    def begin(self, label):
+        """ Opens an error-isolated block: a failure inside is reported to the Listener and the batch continues. """
+        self.ops.append(("begin", label))
+
+    def end(self, label):
+        self.ops.append(("end", label))
+
+    def place(self, target, x, y):
+        """ Shows a node in the active Slate Material Editor view, if there is one. """
+        self._uses_view = True
+        self.ops.append(("place", target.expression if isinstance(target, Ref) else target, x, y))
+
+    def tag(self, target, key, record=None):
+        """ Stores an asset key (and its manifest entry, a string) on target, so a later batch can find it with find_tagged(). """
+        self.ops.append(("tag", target.expression if isinstance(target, Ref) else target, key, record))
+
+    def find_tagged(self, var, class_name, key):
+        """ Declares the MaxScript local var holding the class_name instance tagged with key, or undefined. """
+        if class_name not in self._tagged_classes: self._tagged_classes.append(class_name)
+        self.ops.append(("find", var, class_name, key))
+        return Ref(var)
+
+    def raw(self, code):
+        self.ops.append(("raw", code))
+
+    def build(self, result="OK"):
+        """ Renders the batch as one MaxScript block. The block counts the error-isolated blocks that succeeded in
+            the local 'okCount' and evaluates to result, a MaxScript expression. """
+        lines = ["(", "local okCount = 0"]
+        if self._bitmap_slots:
+            lines += [
+                "local gsgScene = Dictionary #string",
+                'for t in getClassInstances RGB_image where t.filename != undefined do PutDictValue gsgScene ((toLower (substituteString t.filename "\\\\" "/")) + "|" + (t.gamma as string)) t',
+                "fn gsgBitmap scene f g = (",
+                '    local k = (toLower f) + "|" + (g as string)',
+                "    if HasDictValue scene k then GetDictValue scene k",
+                "    else if doesFileExist f then (local b = RGB_image filename:f; b.gamma = g; PutDictValue scene k b; b)",
+                "    else undefined",
+                ")",
+                f"local gsgBitmaps = #(); gsgBitmaps[{len(self._bitmap_slots)}] = undefined",
+            ]
+        # Bitmaps are resolved up front, so a failing block cannot leave a slot unset for later blocks sharing it.
+        lines += [f"gsgBitmaps[{slot}] = gsgBitmap gsgScene {mxs_path(path)} {gamma!r}" for kind, slot, path, gamma in (op for op in self.ops if op[0] == "bitmap")]
+        if self._uses_view:
+            lines += ["local activeView = sme.GetView sme.activeView",
+                      "fn gsgPlace view n x y = if view != undefined and n != undefined do view.CreateNode n [x, y]"]
+        if self._tagged_classes:
+            lines += [
+                "local gsgTagged = Dictionary #string",
+                f"for c in #({', '.join(self._tagged_classes)}) do for m in getClassInstances c do (local k = getAppData m {TAG_APPDATA_ID}; if k != undefined do PutDictValue gsgTagged k m)",
+            ]
+        for op in self.ops:
+            kind = op[0]
+            if kind == "create":
+                _, var, class_name, name = op
+                lines.append(f"local {var} = {class_name}()" if name is None else f"local {var} = {class_name} name:{mxs_string(name)}")
+            elif kind == "set":
+                _, target, prop, value = op
+                lines.append(f"{target}.{prop} = {mxs_value(value)}")
+            elif kind == "connect":
+                _, target, prop, slot, input_type_prop = op
+                input_type = f"{target}.{input_type_prop} = 2; " if input_type_prop else ""
+                lines.append(f"if gsgBitmaps[{slot}] != undefined do ({input_type}{target}.{prop} = gsgBitmaps[{slot}])")
+            elif kind == "begin":
+                lines.append("try (")
+            elif kind == "end":
+                lines.append(f'okCount += 1\n) catch (format "GSG: % failed: %\\n" {mxs_string(op[1])} (getCurrentException()))')
+            elif kind == "place":
+                _, target, x, y = op
+                lines.append(f"gsgPlace activeView {target} {x} {y}")
+            elif kind == "tag":
+                _, target, key, record = op
+                lines.append(tag_code(target, key, record))
+            elif kind == "find":
+                _, var, class_name, key = op
+                lines.append(f"local {var} = if HasDictValue gsgTagged {mxs_string(key)} then GetDictValue gsgTagged {mxs_string(key)} else undefined")
+            elif kind == "raw":
+                lines.append(op[1])
+        lines += [result, ")"]
+        return "\n".join(lines)
@@ -0,0 +1,157 @@
+#
+#   GSG Asset Importer unofficial for Octane - performance tracing
+#   Nested timing spans and counters for the hot paths of an import, exported as Chrome trace JSON (open it in
+#   chrome://tracing or https://ui.perfetto.dev) and summarized as a table. Tracing is off unless enabled from the
+#   UI or with the GSG_TRACE environment variable; when off, span() returns a shared no-op context and count()
+#   returns after one check, so instrumented code runs at full speed.
+#
+#   License: MIT License (see LICENSE)
+#
+
+import os
+import json
+import time
+import threading
+import functools
+
+# Events kept for the Chrome trace; the summary keeps counting after the limit is reached
+MAX_EVENTS = 200000
+
+_enabled = bool(os.environ.get("GSG_TRACE"))
+_lock = threading.Lock()
+_local = threading.local()
+_origin = time.perf_counter()
+_events = []
+_dropped = 0
+_threads = {}
+_totals = {}    # span name -> [calls, total seconds, self seconds, max seconds]
+_counters = {}  # counter name -> value
+_PID = os.getpid()
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable(reset_data=True):
+    """ Starts recording. By default the previous recording is discarded. """
+    global _enabled
+    if reset_data: reset()
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    global _origin, _dropped
+    with _lock:
+        _origin = time.perf_counter(); _events.clear(); _dropped = 0; _threads.clear(); _totals.clear(); _counters.clear()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start", "children")
+
+    def __init__(self, name, args):
+        self.name = name; self.args = args; self.children = 0.0
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None: stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _dropped
+        end = time.perf_counter(); duration = end - self.start
+        # Spans in job generators can be suspended at a yield while other spans run, so they do not always end last.
+        stack = _local.stack; position = len(stack) - 1 if stack[-1] is self else stack.index(self)
+        del stack[position]
+        if position: stack[position - 1].children += duration
+        if exc_type is not None: self.args["error"] = exc_type.__name__
+        tid = threading.get_ident()
+        with _lock:
+            totals = _totals.get(self.name)
+            if totals is None: totals = _totals[self.name] = [0, 0.0, 0.0, 0.0]
+            totals[0] += 1; totals[1] += duration; totals[2] += duration - self.children; totals[3] = max(totals[3], duration)
+            if len(_events) < MAX_EVENTS:
+                if tid not in _threads: _threads[tid] = threading.current_thread().name
+                event = {"name": self.name, "ph": "X", "ts": (self.start - _origin) * 1e6, "dur": duration * 1e6, "pid": _PID, "tid": tid}
+                if self.args: event["args"] = self.args
+                _events.append(event)
+            else:
+                _dropped += 1
+        return False
+
+    def set(self, **args):
+        """ Adds arguments (shown in the trace viewer) to the running span. """
+        self.args.update(args)
+
+
+def span(name, **args):
+    """ Times the enclosed block as a nested span: 'with span("parse_gsgm", path=p): ...'. """
+    if not _enabled: return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """ Decorator that wraps every call of a function in a span named after the function. """
+    def decorate(fn):
+        span_name = name or fn.__name__
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled: return fn(*args, **kwargs)
+            with _Span(span_name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, value=1):
+    """ Adds value to a counter, e.g. count("bytes_read", size). """
+    if not _enabled: return
+    with _lock: _counters[name] = _counters.get(name, 0) + value
+
+
+def export_chrome_trace(file_path):
+    """ Writes the recording as Chrome trace JSON. Counters are added as counter events at the end of the trace. """
+    with _lock:
+        events = list(_events); threads = dict(_threads); counters = dict(_counters); dropped = _dropped
+        now = (time.perf_counter() - _origin) * 1e6
+    pid = _PID
+    events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}} for tid, thread_name in threads.items()]
+    events += [{"name": counter, "ph": "C", "ts": now, "pid": pid, "tid": 0, "args": {counter: value}} for counter, value in counters.items()]
+    temp_path = file_path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"counters": counters, "dropped_events": dropped}}, f)
+    os.replace(temp_path, file_path)
+    return len(events)
+
+
+def summary_lines(limit=25):
+    """ Returns the summary table: the spans with the most self time first, then the counters. """
+    with _lock:
+        totals = sorted(_totals.items(), key=lambda item: -item[1][2]); counters = sorted(_counters.items())
+    lines = [f"{'span':<40} {'calls':>8} {'total ms':>10} {'self ms':>10} {'max ms':>9}"]
+    lines += [f"{name[:40]:<40} {calls:>8} {total * 1000:>10.1f} {self_time * 1000:>10.1f} {longest * 1000:>9.1f}" for name, (calls, total, self_time, longest) in totals[:limit]]
+    if len(totals) > limit: lines.append(f"... {len(totals) - limit} more span(s)")
+    lines += [f"{name:<40} {value:>8}" for name, value in counters]
+    return lines
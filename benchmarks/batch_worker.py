@@ -0,0 +1,42 @@
+#
+#   Stand-in for a 3dsmaxbatch worker: runs a GSGBatch job file against the fake pymxs runtime.
+#
+#   Usage: python benchmarks/batch_worker.py <job.json> [--startup 0.5] [--execute-latency 0.002]
+#                                            [--char-latency 2e-6] [--crash-rate 0.1]
+#
+#   Use it as the scheduler's worker command to test the batch protocol without 3ds Max:
+#       python GSGBatch.py <library> --worker-command "python benchmarks/batch_worker.py {job} --startup 0.5"
+#   --startup stands in for the 3ds Max start-up of every worker; --crash-rate makes that share of
+#   the jobs exit without a result, to exercise the retries.
+#
+
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake 3ds Max batch worker for GSGBatch.")
+    parser.add_argument("job")
+    parser.add_argument("--startup", type=float, default=0.0, help="seconds slept before the job runs")
+    parser.add_argument("--execute-latency", type=float, default=0.0, help="seconds added to every rt.execute call")
+    parser.add_argument("--char-latency", type=float, default=0.0, help="seconds added per MaxScript character executed")
+    parser.add_argument("--crash-rate", type=float, default=0.0, help="share of jobs that exit without writing a result")
+    args = parser.parse_args()
+    from fake_pymxs import FakeRuntime, install
+    install(FakeRuntime(execute_latency=args.execute_latency, execute_char_latency=args.char_latency))
+    import GSGBatch
+    time.sleep(args.startup)
+    if random.Random(os.getpid() ^ time.time_ns()).random() < args.crash_rate:
+        print("Simulated worker crash.", flush=True); os._exit(3)
+    return GSGBatch.run_job_file(args.job)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#
+#   Zipped asset pack benchmark: opening a pack and building one material from it, against unpacking the whole pack.
+#
+#   Usage: python benchmarks/bench_archive.py [pack.zip] [--materials 600] [--map-kb 1024] [--execute-latency 0.002]
+#
+#   Builds a pack from a synthetic library (texture maps padded to --map-kb KB of incompressible
+#   data and stored, as JPEG and PNG maps usually are; 600 materials at 1 MB per map make about a
+#   5 GB pack) or uses the given one. Reported are the time to read the central directory, to list
+#   the pack for the Browser tab, to build its first material into a fake scene (parsing the .gsgm
+#   from the archive and extracting only that material's maps), to build it again, and to extract
+#   the whole pack with zipfile, which is what importing used to require.
+#
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import zipfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+
+def write_pack(library, pack_path, map_kb, seed=1):
+    """ Zips library into pack_path; maps get map_kb KB of random data each (a shared block behind a unique header). """
+    block = random.Random(seed).randbytes(map_kb * 1024)
+    with zipfile.ZipFile(pack_path, 'w') as pack:
+        for root, _, names in os.walk(library):
+            for name in sorted(names):
+                path = os.path.join(root, name); member = os.path.relpath(path, library).replace("\\", "/")
+                if name.lower().endswith(('.jpg', '.png', '.exr')): pack.writestr(member, member.encode("utf-8") + block, zipfile.ZIP_STORED)
+                else: pack.write(path, member, zipfile.ZIP_DEFLATED)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSG zipped asset pack benchmark.")
+    parser.add_argument("pack", nargs="?")
+    parser.add_argument("--materials", type=int, default=600)
+    parser.add_argument("--map-kb", type=int, default=1024)
+    parser.add_argument("--execute-latency", type=float, default=0.002)
+    args = parser.parse_args()
+    from fake_pymxs import FakeRuntime, install
+    from make_library import generate_library
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = os.path.join(temp_dir, "cache")
+        rt = install(FakeRuntime(execute_latency=args.execute_latency))
+        import GSGCore as core
+        pack_path = args.pack
+        if not pack_path:
+            library = os.path.join(temp_dir, "library"); pack_path = os.path.join(temp_dir, "Pack.zip")
+            generate_library(library, materials=args.materials)
+            start = time.perf_counter(); write_pack(library, pack_path, args.map_kb)
+            print(f"Wrote {pack_path} in {time.perf_counter() - start:.1f}s.")
+        print(f"Pack: {os.path.getsize(pack_path) / 1e9:.2f} GB")
+
+        start = time.perf_counter(); archive = core.get_archive(pack_path); open_time = time.perf_counter() - start
+        folders = archive.material_folders()
+        start = time.perf_counter(); items = core.list_browser_assets(pack_path); list_time = time.perf_counter() - start
+        folder = archive.member_path(folders[0])
+        core._archives.clear()  # The build below opens the pack again, as the first action on it would
+
+        def build(label):
+            rt.reset(scene=False); messages = []
+            start = time.perf_counter(); stats = core.run_job(core.iter_sync_materials([folder], messages.append)); wall = time.perf_counter() - start
+            extracted = next((m for m in messages if m.startswith("Archive cache")), "no extraction")
+            print(f"{label:<38} {wall * 1000:>9.1f} ms  {stats['created']} created, {stats['skipped']} unchanged; {extracted}")
+            return wall
+
+        print(f"{'open pack (central directory)':<38} {open_time * 1000:>9.1f} ms  {len(archive.members)} members, {len(folders)} material folder(s)")
+        print(f"{'list pack for the Browser tab':<38} {list_time * 1000:>9.1f} ms  {len(items)} asset(s)")
+        first = build("open + build one material")
+        build("build it again")
+        start = time.perf_counter()
+        with zipfile.ZipFile(pack_path) as pack: pack.extractall(os.path.join(temp_dir, "unpacked"))
+        unpack = time.perf_counter() - start
+        print(f"{'unpack the whole pack (before)':<38} {unpack * 1000:>9.1f} ms")
+        print(f"One material from the pack: {first:.2f}s ({'within' if first < 1.0 else 'OVER'} the 1 s budget), {unpack / max(first, 1e-9):.0f}x faster than unpacking first.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#
+#   Batch build benchmark: throughput of GSGBatch with 1, 2, 4 and 8 stand-in workers.
+#
+#   Usage: python benchmarks/bench_batch.py [--materials 2000] [--workers 1,2,4,8] [--shard-size 100]
+#                                           [--startup 1.0] [--char-latency 5e-6] [--crash-rate 0.0]
+#
+#   Runs the real scheduler on a synthetic library with benchmarks/batch_worker.py as the worker, so
+#   sharding, the job protocol, retries and the merge are measured without 3ds Max. --startup and
+#   --char-latency stand in for the 3ds Max start-up and the time it spends building materials
+#   (about 700 MaxScript characters per material). Efficiency is throughput / (workers x the
+#   throughput of one worker).
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSGBatch scaling benchmark with stand-in workers.")
+    parser.add_argument("--materials", type=int, default=2000)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--shard-size", type=int, default=100)
+    parser.add_argument("--startup", type=float, default=1.0)
+    parser.add_argument("--char-latency", type=float, default=5e-6)
+    parser.add_argument("--crash-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    from make_library import generate_library
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = os.path.join(temp_dir, "cache")
+        import GSGBatch
+        library = os.path.join(temp_dir, "library")
+        generate_library(library, materials=args.materials)
+        GSGBatch.GSGCore.get_asset_index().refresh(library)
+        command = [sys.executable, os.path.join(BENCH_DIR, "batch_worker.py"), "{job}", "--startup", str(args.startup),
+                   "--char-latency", str(args.char_latency), "--crash-rate", str(args.crash_rate)]
+        single = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            output = os.path.join(temp_dir, f"library_{workers}.mat")
+            start = time.perf_counter()
+            report = GSGBatch.run_batch(library, output, workers=workers, shard_size=args.shard_size, command=command, status_callback=lambda message: None)
+            wall = time.perf_counter() - start
+            throughput = report["built"] / wall
+            single = single or throughput / workers
+            retries = sum(shard["attempts"] - 1 for shard in report["shards"])
+            print(f"{workers:>2} worker(s): {report['built']}/{report['materials']} materials in {wall:6.2f}s  {throughput:7.1f} materials/s  "
+                  f"efficiency {throughput / (workers * single):4.0%}  retries {retries}  {report['status']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#
+#   Asset browser benchmark: time to first paint, thumbnail loading, scrolling and memory.
+#
+#   Usage: python benchmarks/bench_browser.py [item_count]
+#
+#   Runs the Browser tab offscreen (QT_QPA_PLATFORM=offscreen works) on a synthetic library of
+#   small JPEG albedo maps, with the caches in a temporary folder. The first pass makes the
+#   visible thumbnails, the second pass reads them back from the disk cache.
+#
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PySide6 import QtWidgets, QtCore, QtGui
+
+
+class PaintWatcher(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.painted = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Type.Paint: self.painted = True
+        return False
+
+
+def wait_until(app, condition, timeout=60.0):
+    end = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < end:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 10)
+
+
+def write_albedo_maps(folder, count):
+    image = QtGui.QImage(256, 256, QtGui.QImage.Format.Format_RGB32)
+    paths = []
+    for i in range(count):
+        image.fill(QtGui.QColor.fromHsv(i * 7 % 360, 160, 200))
+        path = os.path.join(folder, f"Material{i:05d}_Albedo_1K.jpg"); image.save(path, "JPG", 80); paths.append(path)
+    return paths
+
+
+def run_pass(app, gsg, items):
+    """ Shows a fresh Browser tab with items. Returns (first paint, visible thumbnails loaded) in seconds, and the tab. """
+    gsg._thumbnail_cache = None  # An empty memory cache; the disk cache is kept.
+    tab = gsg.BrowserTab(); tab.resize(800, 700)
+    watcher = PaintWatcher(); tab.view.viewport().installEventFilter(watcher)
+    start = time.perf_counter()
+    tab.model.set_items(items); tab.apply_filter(); tab.show()
+    wait_until(app, lambda: watcher.painted); first_paint = time.perf_counter() - start
+    wait_until(app, lambda: tab.loader.pending() == 0); loaded = time.perf_counter() - start
+    return first_paint, loaded, tab
+
+
+def main(count):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = temp_dir
+        import GSGAssetImporter as gsg
+        start = time.perf_counter(); paths = write_albedo_maps(temp_dir, count)
+        print(f"Wrote {count} albedo maps in {time.perf_counter() - start:.1f}s")
+
+        tracemalloc.start()
+        items = [{"kind": "material", "name": os.path.basename(p)[:-13], "path": os.path.dirname(p), "thumbnail": p} for p in paths]
+        model = gsg.AssetListModel(gsg.ThumbnailCache(temp_dir), gsg.ThumbnailLoader(None)); model.set_items(items)
+        item_bytes, _ = tracemalloc.get_traced_memory(); tracemalloc.stop()
+
+        cold_paint, cold_loaded, tab = run_pass(app, gsg, items)
+        visible = len(tab.cache._memory)
+        print(f"Cold: first paint {cold_paint * 1000:.0f} ms, {visible} visible thumbnails made in {cold_loaded * 1000:.0f} ms")
+        frames = []
+        bar = tab.view.verticalScrollBar()
+        for value in range(0, bar.maximum() + 1, max(1, bar.pageStep() // 2)):
+            bar.setValue(value)
+            start = time.perf_counter(); tab.view.viewport().repaint(); frames.append(time.perf_counter() - start)
+            app.processEvents()
+        frames.sort()
+        print(f"Scrolled {len(frames)} frames: median {frames[len(frames) // 2] * 1000:.1f} ms, max {frames[-1] * 1000:.1f} ms")
+        wait_until(app, lambda: tab.loader.pending() == 0)
+        thumbnail_bytes = tab.cache.memory_bytes() / max(len(tab.cache._memory), 1)
+        tab.close(); tab.deleteLater()
+
+        warm_paint, warm_loaded, tab = run_pass(app, gsg, items)
+        print(f"Warm: first paint {warm_paint * 1000:.0f} ms, visible thumbnails from the disk cache in {warm_loaded * 1000:.0f} ms")
+        print(f"Memory: {item_bytes / count * 1000 / 1024:.0f} KB per 1,000 items without thumbnails; {thumbnail_bytes / 1024:.0f} KB per thumbnail in memory, at most {gsg.THUMBNAIL_MEMORY_ITEMS} kept")
+        tab.loader.pool.waitForDone(); tab.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,66 @@
+#
+#   Map classifier corpus check and scaling benchmark.
+#
+#   Usage: python benchmarks/bench_classifier.py
+#
+#   Every case in map_classifier_corpus.json must classify exactly as expected, and its
+#   texture_sets cases must group into exactly the expected texture sets; the benchmark
+#   then classifies synthetic folders of growing size to show linear scaling.
+#
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import GSGCore as core
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "map_classifier_corpus.json")
+
+
+def check_corpus():
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f: cases = json.load(f)["cases"]
+    failures = 0
+    for case in cases:
+        classifier = core.MapClassifier(preferred_resolution=case.get("preferred_resolution"))
+        maps = {slot: os.path.basename(path) for slot, path in classifier.classify_folder("", case["files"])["maps"].items()}
+        # The listing order must not matter.
+        reversed_maps = {slot: os.path.basename(path) for slot, path in classifier.classify_folder("", case["files"][::-1])["maps"].items()}
+        if maps != case["expected"] or reversed_maps != maps:
+            failures += 1
+            print(f"FAIL {case['name']}\n  expected: {case['expected']}\n  got:      {maps}")
+    print(f"Corpus: {len(cases) - failures}/{len(cases)} cases passed.")
+    return failures == 0
+
+
+def check_texture_sets():
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f: cases = json.load(f)["texture_sets"]
+    failures = 0
+    for case in cases:
+        paths = [f"C:/GSG/Textures/{name}" for name in case["files"]]
+        groups = [{texture_set["name"]: {"maps": {slot: os.path.basename(path) for slot, path in texture_set["maps"].items()},
+                                         "loose": sorted(os.path.basename(path) for path, slot in texture_set["files"] if slot is None)}
+                   for texture_set in core.group_texture_sets(files)} for files in (paths, paths[::-1])]
+        if groups[0] != case["expected"] or groups[1] != groups[0]:
+            failures += 1
+            print(f"FAIL {case['name']}\n  expected: {case['expected']}\n  got:      {groups[0]}")
+    print(f"Texture sets: {len(cases) - failures}/{len(cases)} cases passed.")
+    return failures == 0
+
+
+def bench_scaling():
+    classifier = core.MapClassifier()
+    suffixes = ["Albedo", "Roughness", "Normal", "Metallic", "Height", "AO", "Preview", "ScatteringWeight"]
+    for count in (100, 1000, 10000):
+        files = [f"Material_{i // 32:04d}_{suffixes[i % len(suffixes)]}_{(i % 3 + 1) * 1}K.{'jpg' if i % 5 else 'exr'}" for i in range(count)]
+        start = time.perf_counter()
+        classifier.classify_folder("C:/GSG/Library", files)
+        elapsed = time.perf_counter() - start
+        print(f"{count:>6} files: {elapsed * 1000:8.2f} ms ({elapsed / count * 1e6:.2f} us/file)")
+
+
+if __name__ == "__main__":
+    ok = check_corpus() & check_texture_sets()
+    bench_scaling()
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,63 @@
+#
+#   MaxScript code generation check and library build benchmark.
+#
+#   Usage: python benchmarks/bench_codegen.py [material_count]
+#
+#   Generates the library build scripts for a synthetic library whose material variants share
+#   texture maps, and compares rt.execute calls and RGB_image nodes against creating every
+#   material on its own. No 3ds Max is needed: the scripts are only generated, not run.
+#
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import GSGCore as core
+from GSGMaxScript import ScriptBuilder, mxs_path, mxs_string
+
+
+def check_escaping():
+    """ Paths and names with quotes and backslashes must come out as single, valid MaxScript string literals. """
+    cases = [('C:\\Assets\\Wood "Oak"\\albedo.jpg', '"C:/Assets/Wood \\"Oak\\"/albedo.jpg"'), ('D:\\x\\tab\tname.png', '"D:/x/tab\\tname.png"')]
+    failures = [(path, mxs_path(path)) for path, expected in cases if mxs_path(path) != expected]
+    if mxs_string('Back\\slash "q"') != '"Back\\\\slash \\"q\\""': failures.append(("mxs_string", mxs_string('Back\\slash "q"')))
+    for name, got in failures: print(f"FAIL {name}: {got}")
+    print(f"Escaping: {'ok' if not failures else f'{len(failures)} failure(s)'}.")
+    return not failures
+
+
+def synthetic_materials(count, variants=4):
+    """ GSG-like materials where every base texture set is shared by a few color/roughness variants. """
+    materials = []
+    for i in range(count):
+        base = f"C:/GSG/Library/Set{i // variants:04d}/Set{i // variants:04d}"
+        maps = {"albedo": f"{base}_Albedo_2K.jpg", "roughness": f"{base}_Roughness_2K.jpg", "normal": f"{base}_Normal_2K.jpg", "displacement": f"{base}_Height_2K.exr"}
+        materials.append({"folder": f"{base}_Variant{i % variants}", "name": f'Set{i // variants:04d} "Variant {i % variants}"', "params": {"metallic": 0, "specular_roughness": 0.5, "base_color": {"r": 0.5, "g": 0.4, "b": 0.3}}, "maps": maps})
+    return materials
+
+
+def main(count):
+    if not check_escaping(): sys.exit(1)
+    materials = synthetic_materials(count)
+    map_references = sum(len(m["maps"]) for m in materials)
+
+    start = time.perf_counter()
+    chunks = core.library_chunks(materials, core.LIBRARY_CHUNK_SIZE)
+    build_time = time.perf_counter() - start
+    # Count unique bitmaps per batch the same way the generated scripts do; the scene dictionary then shares them across batches.
+    per_batch = 0; scene = set()
+    for first in range(0, len(materials), core.LIBRARY_CHUNK_SIZE):
+        builder = ScriptBuilder()
+        for material in materials[first:first + core.LIBRARY_CHUNK_SIZE]: core.add_material_ops(builder, material)
+        per_batch += builder.bitmap_count
+        scene.update((path.lower(), gamma) for kind, slot, path, gamma in (op for op in builder.ops if op[0] == "bitmap"))
+
+    print(f"Materials: {count} ({map_references} map references)")
+    print(f"One script per material: {count} rt.execute calls, {map_references} RGB_image nodes")
+    print(f"ScriptBuilder batches:   {len(chunks)} rt.execute calls, {per_batch} RGB_image nodes ({len(scene)} unique across batches)")
+    print(f"Generated {sum(len(c) for c in chunks) / 1024:.0f} KB of MaxScript in {build_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
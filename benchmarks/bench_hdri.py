@@ -0,0 +1,77 @@
+#
+#   Streaming HDRI analysis benchmark.
+#
+#   Usage: python benchmarks/bench_hdri.py [file.hdr|file.exr]
+#
+#   Without a file, a synthetic 8192 x 4096 RLE .hdr with a sun at a known direction is written to a
+#   temporary folder. Reports the analysis time per gigapixel and the peak memory traced during a second
+#   analysis pass, next to the size the whole image would take as float32 RGB.
+#
+
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import GSGHDRI as hdri
+
+SUN_AZIMUTH = -60.0
+SUN_ELEVATION = 35.0
+
+
+def _encode_rle_row(rgbe):
+    """ RLE-encodes one (4, width) uint8 scanline: constant 127-byte chunks become run packets, the rest literal packets. """
+    out = [bytes((2, 2, rgbe.shape[1] >> 8, rgbe.shape[1] & 255))]
+    for channel in rgbe:
+        for first in range(0, len(channel), 127):
+            chunk = channel[first:first + 127]
+            if chunk.min() == chunk.max(): out.append(bytes((128 + len(chunk), int(chunk[0]))))
+            else: out.append(bytes((len(chunk),)) + chunk.tobytes())
+    return b"".join(out)
+
+
+def write_synthetic_hdr(path, width=8192, height=4096):
+    """ A blue sky gradient over a grey ground with a small, very bright sun disc. """
+    lon = ((np.arange(width) + 0.5) / width - 0.5) * 2.0 * math.pi
+    sun = (math.cos(math.radians(SUN_ELEVATION)) * math.cos(math.radians(SUN_AZIMUTH)), math.cos(math.radians(SUN_ELEVATION)) * math.sin(math.radians(SUN_AZIMUTH)), math.sin(math.radians(SUN_ELEVATION)))
+    with open(path, 'wb') as f:
+        f.write(b"#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n" + f"-Y {height} +X {width}\n".encode("ascii"))
+        for y in range(height):
+            lat = (0.5 - (y + 0.5) / height) * math.pi
+            sky = np.array([0.4, 0.6, 1.0] if lat > 0 else [0.25, 0.25, 0.25], dtype=np.float32) * (1.0 + 0.5 * math.sin(abs(lat)))
+            rgb = np.repeat(sky[None, :], width, axis=0)
+            cos_angle = math.cos(lat) * np.cos(lon) * sun[0] + math.cos(lat) * np.sin(lon) * sun[1] + math.sin(lat) * sun[2]
+            rgb[cos_angle > math.cos(math.radians(0.8))] = (50000.0, 48000.0, 45000.0)
+            peak = rgb.max(axis=1)
+            mantissa, exponent = np.frexp(peak)
+            rgbe = np.empty((4, width), dtype=np.uint8)
+            rgbe[:3] = (rgb * (mantissa * 256.0 / peak)[:, None]).T.astype(np.uint8)
+            rgbe[3] = exponent + 128
+            f.write(_encode_rle_row(rgbe))
+
+
+def main(path=None):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if path is None:
+            path = os.path.join(temp_dir, "synthetic.hdr")
+            start = time.perf_counter(); write_synthetic_hdr(path)
+            print(f"Wrote synthetic HDRI ({os.path.getsize(path) / 1e6:.0f} MB) in {time.perf_counter() - start:.1f}s; sun at azimuth {SUN_AZIMUTH}, elevation {SUN_ELEVATION}")
+        start = time.perf_counter(); stats, preview = hdri.analyze_hdri(path); elapsed = time.perf_counter() - start
+        # tracemalloc slows the decoder down several times, so memory is measured in a second, untimed pass.
+        tracemalloc.start(); hdri.analyze_hdri(path)
+        _, peak_bytes = tracemalloc.get_traced_memory(); tracemalloc.stop()
+    pixels = stats["width"] * stats["height"]
+    print(f"Image: {stats['width']} x {stats['height']} ({pixels / 1e6:.1f} MP), preview {preview.shape[1]} x {preview.shape[0]}")
+    print(f"Analysis: {elapsed:.2f}s ({elapsed / pixels * 1e9:.1f}s per gigapixel)")
+    print(f"Peak traced memory: {peak_bytes / 1e6:.1f} MB (the full image as float32 RGB: {pixels * 12 / 1e6:.0f} MB)")
+    print(f"Average luminance {stats['average_luminance']:.3f}, log average {stats['log_average_luminance']:.3f}, peak {stats['peak_luminance']:.0f}")
+    print(f"Sun: {stats['sun']}; suggested power {hdri.suggest_power(stats, 0.5)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,35 @@
+#
+#   Cold vs. warm asset index refresh benchmark.
+#
+#   Usage: python benchmarks/bench_index.py <gsg_library_folder>
+#
+#   The cold run indexes the library into an empty database; the warm run refreshes
+#   the same database again, which only stats folders whose mtime is unchanged.
+#
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import GSGCore as core
+
+
+def main(library_folder):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = core.AssetIndex(os.path.join(temp_dir, "bench_index.sqlite"))
+        start = time.perf_counter(); cold = index.refresh(library_folder); cold_time = time.perf_counter() - start
+        start = time.perf_counter(); warm = index.refresh(library_folder); warm_time = time.perf_counter() - start
+        materials = len(index.materials(library_folder, refresh=False))
+        index.close()
+    print(f"Library: {library_folder} ({cold['folders']} folders, {materials} materials)")
+    print(f"Cold refresh: {cold_time:.3f}s ({cold['rescanned']} folders scanned)")
+    print(f"Warm refresh: {warm_time:.3f}s ({warm['rescanned']} folders scanned)")
+    print(f"Speed-up:     {cold_time / max(warm_time, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python benchmarks/bench_index.py <gsg_library_folder>")
+    main(sys.argv[1])
@@ -0,0 +1,76 @@
+#
+#   Incremental re-import benchmark: a full import of a library, then re-syncs with nothing and with a few assets changed.
+#
+#   Usage: python benchmarks/bench_manifest.py [--materials 3000] [--changed 20] [--execute-latency 0.002] [--char-latency 5e-6]
+#
+#   Imports every material of a synthetic library into a fake scene and builds it into a material
+#   library, then runs both again unchanged and after editing --changed materials (half of them the
+#   .gsgm file, half a texture map). --execute-latency and --char-latency stand in for the time 3ds
+#   Max spends per rt.execute and per MaxScript character, which is what an incremental re-import
+#   saves; the rest of the wall time is the manifest check (one os.stat per source file).
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+
+def edit_materials(materials, count):
+    """ Edits count materials spread over the library: the .gsgm file of even ones, the first map of odd ones. """
+    step = max(1, len(materials) // max(1, count))
+    for n, material in enumerate(materials[::step][:count]):
+        maps = [path for path in material["maps"].values() if path]
+        path = maps[0] if n % 2 and maps else material["gsgm"]
+        with open(path, 'ab') as f: f.write(b" ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSG importer incremental re-import benchmark.")
+    parser.add_argument("--materials", type=int, default=3000)
+    parser.add_argument("--changed", type=int, default=20)
+    parser.add_argument("--execute-latency", type=float, default=0.002)
+    parser.add_argument("--char-latency", type=float, default=5e-6)
+    args = parser.parse_args()
+    from fake_pymxs import FakeRuntime, install
+    from make_library import generate_library
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = os.path.join(temp_dir, "cache")
+        rt = install(FakeRuntime(execute_latency=args.execute_latency, execute_char_latency=args.char_latency))
+        import GSGCore as core
+        library = os.path.join(temp_dir, "library")
+        generate_library(library, materials=args.materials)
+        materials = core.get_asset_index().materials(library)
+        folders = [material["folder"] for material in materials]
+        library_path = os.path.join(temp_dir, "GSG_Library.mat")
+
+        def measure(label, job):
+            rt.reset(scene=False); messages = []
+            start = time.perf_counter(); result = core.run_job(job(messages.append)); wall = time.perf_counter() - start
+            if isinstance(result, dict): outcome = f"{result['created']} created, {result['updated']} updated, {result['skipped']} unchanged"
+            else: outcome = next((m for m in reversed(messages) if m.startswith("Library manifest") or m.startswith("-> Saved")), "")
+            print(f"{label:<34} {wall:>8.2f}s  execute {rt.calls['execute']:>4}  {rt.execute_chars / 1024:>8.0f} KB MaxScript  {outcome}", flush=True)
+            return wall
+
+        scene = lambda log: core.iter_sync_materials(folders, log)
+        build = lambda log: core.iter_build_material_library(library, log, library_path=library_path)
+        print(f"{len(materials)} materials, {args.changed} changed; execute latency {args.execute_latency * 1000:g} ms + {args.char_latency * 1e6:g} us/char")
+        full = measure("scene: first import", scene)
+        measure("scene: re-sync, nothing changed", scene)
+        edit_materials(materials, args.changed)
+        incremental = measure(f"scene: re-sync, {args.changed} changed", scene)
+        library_full = measure("library: first build", build)
+        measure("library: rebuild, nothing changed", build)
+        edit_materials(materials[1:], args.changed)
+        library_incremental = measure(f"library: rebuild, {args.changed} changed", build)
+        print(f"Re-sync with {args.changed} changed: {full / max(incremental, 1e-9):.0f}x faster than the first import (scene), "
+              f"{library_full / max(library_incremental, 1e-9):.0f}x (library).")
+
+
+if __name__ == "__main__":
+    main()
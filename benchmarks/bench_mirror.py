@@ -0,0 +1,65 @@
+#
+#   Network mirror cache benchmark: cold copies, warm hits, changed files and resumed copies.
+#
+#   Usage: python benchmarks/bench_mirror.py [source_folder] [--files 200] [--mb 4] [--threads 1,4,8]
+#
+#   Mirrors every file of source_folder (a folder on a network share gives the real picture) or
+#   of a generated folder of --files files of --mb MB each. For every copy thread count the cache
+#   starts empty; reported are the cold copy throughput, the time to validate a warm cache, the
+#   re-copy after 10% of the files changed and the bytes a resumed copy still had to read after
+#   half of its files were interrupted halfway.
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSG network mirror cache benchmark.")
+    parser.add_argument("source_folder", nargs="?")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--mb", type=float, default=4)
+    parser.add_argument("--threads", default="1,4,8")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = os.path.join(temp_dir, "cache")
+        import GSGCore as core
+        if args.source_folder:
+            sources = [os.path.join(root, name) for root, _, names in os.walk(args.source_folder) for name in names]
+        else:
+            share = os.path.join(temp_dir, "share"); os.makedirs(share)
+            sources = []
+            for i in range(args.files):
+                path = os.path.join(share, f"Map_{i:05d}_4K.jpg")
+                with open(path, 'wb') as f: f.write(os.urandom(int(args.mb * 1024 * 1024)))
+                sources.append(path)
+        total_mb = sum(os.path.getsize(path) for path in sources) / 1e6
+        print(f"{len(sources)} file(s), {total_mb:.0f} MB")
+        for threads in (int(t) for t in args.threads.split(",")):
+            cache = core.MirrorCache(os.path.join(temp_dir, f"mirror_{threads}"))
+            start = time.perf_counter(); cache.ensure(sources, max_workers=threads); cold = time.perf_counter() - start
+            start = time.perf_counter(); cache.ensure(sources, max_workers=threads); warm = time.perf_counter() - start
+            changed = sources[::10] if args.source_folder is None else []
+            for path in changed:
+                with open(path, 'r+b') as f: f.write(os.urandom(16))
+            start = time.perf_counter(); cache.ensure(sources, max_workers=threads); recopy = time.perf_counter() - start
+            interrupted = sources[::2]
+            for path in interrupted:
+                local_path = cache.path_for(path); st = os.stat(path)
+                os.replace(local_path, f"{local_path}.{st.st_size}_{st.st_mtime_ns}.part")
+                with open(f"{local_path}.{st.st_size}_{st.st_mtime_ns}.part", 'r+b') as f: f.truncate(st.st_size // 2)
+            copied = cache.stats["bytes_copied"]
+            start = time.perf_counter(); cache.ensure(sources, max_workers=threads); resume = time.perf_counter() - start
+            resumed_mb = (cache.stats["bytes_copied"] - copied) / 1e6
+            print(f"{threads:>2} thread(s): cold {cold:6.2f}s ({total_mb / max(cold, 1e-9):7.1f} MB/s)  warm {warm * 1000:7.1f} ms  "
+                  f"{len(changed)} changed {recopy:5.2f}s  resume of {len(interrupted)} {resume:5.2f}s ({resumed_mb:.0f} MB read)  "
+                  f"hits {cache.stats['hits']}  copies {cache.stats['copies']}  {cache.stats['bytes_saved'] / 1e6:.0f} MB served locally")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#
+#   Startup benchmark: cold and warm time-to-window, warm start and first show of every tab.
+#
+#   Usage: python benchmarks/bench_startup.py [--runs 5] [--materials 1000] [--json startup.json] [--compare baseline.json]
+#
+#   Every run is a fresh Python process (QT_QPA_PLATFORM=offscreen works) with PySide6 and the
+#   QApplication already loaded, as they are in 3ds Max. It times importing the Qt-free core,
+#   then the first launch (import GSGAssetImporter, main(), first paint) and relaunches the way the
+#   3ds Max macro does (reload the module, main(), first paint). The cache folder is shared by the
+#   runs and the last browsed folder is a synthetic library, so the warm start has real work to do.
+#
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+RELAUNCHES = 5
+
+
+# --- worker: one launch sequence in a fresh process ---
+
+def run_worker(library):
+    from fake_pymxs import FakeRuntime, install
+    install(FakeRuntime())
+    results = {}
+    start = time.perf_counter()
+    import GSGCore
+    results["import GSGCore"] = time.perf_counter() - start
+    results["Qt loaded by GSGCore"] = "PySide6" in sys.modules
+    GSGCore.get_asset_index().set_setting("browser_root", library)
+
+    from PySide6 import QtWidgets, QtCore
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    class PaintWatcher(QtCore.QObject):
+        painted = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Type.Paint: self.painted = True
+            return False
+
+    def wait_until(condition, timeout=60.0):
+        end = time.perf_counter() + timeout
+        while not condition() and time.perf_counter() < end:
+            app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+
+    def launch(module):
+        """ main() until the current tab has painted; returns (seconds, window). """
+        watcher = PaintWatcher(); app.installEventFilter(watcher)
+        start = time.perf_counter()
+        window = module.main()
+        wait_until(lambda: watcher.painted); elapsed = time.perf_counter() - start
+        app.removeEventFilter(watcher)
+        return elapsed, window
+
+    start = time.perf_counter()
+    import GSGAssetImporter as gsg
+    results["import GSGAssetImporter"] = time.perf_counter() - start
+    cold, window = launch(gsg)
+    results["cold time-to-window"] = results["import GSGAssetImporter"] + cold
+    start = time.perf_counter()
+    wait_until(lambda: not window.warm_runner.is_running())
+    results["warm start after show"] = time.perf_counter() - start
+    browser = window.browser_page.ensure()
+    wait_until(lambda: not browser.job_panel.runner.is_running())
+    results["assets in reopened browser"] = browser.model.rowCount()
+
+    warm = []
+    for _ in range(RELAUNCHES):
+        window.close(); app.processEvents()
+        start = time.perf_counter()
+        gsg = importlib.reload(gsg)
+        _, relaunched = launch(gsg)
+        warm.append(time.perf_counter() - start)
+        results["window reused"] = relaunched is window
+    results["warm time-to-window"] = statistics.median(warm)
+
+    for index in range(1, window.tabs.count()):
+        watcher = PaintWatcher(); window.tabs.widget(index).installEventFilter(watcher)
+        start = time.perf_counter()
+        window.tabs.setCurrentIndex(index)
+        wait_until(lambda: watcher.painted)
+        results[f"first show of {window.tabs.tabText(index)} tab"] = time.perf_counter() - start
+    window.close()
+    print(json.dumps(results))
+
+
+# --- driver ---
+
+def main():
+    parser = argparse.ArgumentParser(description="GSG importer startup benchmark.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--materials", type=int, default=1000, help="materials in the library the Browser tab reopens")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run to compare with")
+    args = parser.parse_args()
+    from make_library import generate_library
+    runs = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library = os.path.join(temp_dir, "library")
+        generate_library(library, materials=args.materials)
+        env = dict(os.environ, LOCALAPPDATA=os.path.join(temp_dir, "cache"), QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+        for run in range(args.runs):
+            process = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", library], env=env, capture_output=True, text=True)
+            if process.returncode != 0:
+                print(f"Run {run + 1} failed:\n{process.stderr[-2000:]}"); return 1
+            runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    # The first run opens an empty cache; the medians are over the runs that follow, as for a returning user.
+    results = {name: statistics.median(run[name] for run in runs[1:] or runs) if isinstance(runs[0][name], float) else runs[-1][name] for name in runs[0]}
+    results["first run cold time-to-window"] = runs[0]["cold time-to-window"]
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f: baseline = json.load(f)["results"]
+    for name, value in results.items():
+        if isinstance(value, float):
+            line = f"{name:<36} {value * 1000:>9.1f} ms"
+            if isinstance(baseline.get(name), float): line += f"  {value / max(baseline[name], 1e-9):.2f}x baseline"
+        else:
+            line = f"{name:<36} {value!s:>9}"
+        print(line)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f: json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "args": vars(args), "results": results}, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        run_worker(sys.argv[2])
+    else:
+        sys.exit(main())
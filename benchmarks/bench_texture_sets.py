@@ -0,0 +1,61 @@
+#
+#   Texture import benchmark: grouping loose textures into texture sets and creating them in one batch.
+#
+#   Usage: python benchmarks/bench_texture_sets.py [--textures 1000,5000] [--execute-latency 0.002] [--char-latency 0]
+#
+#   Takes the given number of texture files from a synthetic library (every naming scheme of
+#   make_library.py, with AO and preview maps and 1K/2K/4K variants) and imports them into an empty
+#   fake scene as bitmap nodes only and with a material per texture set, then once more unchanged.
+#   Reported are the texture sets found, rt.execute calls, MaxScript size, the extent of the node
+#   grid and the wall time against the budget of 5 s per 1,000 textures.
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+BUDGET_PER_1000 = 5.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GSG texture set import benchmark.")
+    parser.add_argument("--textures", default="1000,5000")
+    parser.add_argument("--execute-latency", type=float, default=0.002)
+    parser.add_argument("--char-latency", type=float, default=0.0)
+    args = parser.parse_args()
+    counts = [int(n) for n in args.textures.split(",")]
+    from fake_pymxs import FakeRuntime, install
+    from make_library import generate_library
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["LOCALAPPDATA"] = os.path.join(temp_dir, "cache")
+        rt = install(FakeRuntime(execute_latency=args.execute_latency, execute_char_latency=args.char_latency))
+        import GSGCore as core
+        library = os.path.join(temp_dir, "library")
+        generate_library(library, materials=max(counts) // 6 + 1)
+        all_files = core.get_asset_index().files_below(library, core.TEXTURE_EXTENSIONS)
+        print(f"execute latency {args.execute_latency * 1000:g} ms + {args.char_latency * 1e6:g} us/char; budget {BUDGET_PER_1000:g} s per 1,000 textures")
+        for n in counts:
+            files = all_files[:n]
+            start = time.perf_counter(); texture_sets = core.group_texture_sets(files); grouping = time.perf_counter() - start
+            positions = core.layout_texture_sets(texture_sets, True)
+            extent = (max(x for x, _ in positions) + 2 * core.NODE_GRID_COLUMN - core.NODE_GRID_ORIGIN[0],
+                      max(y + len(s["files"]) * core.NODE_GRID_ROW for s, (_, y) in zip(texture_sets, positions)) - core.NODE_GRID_ORIGIN[1])
+            print(f"{len(files)} textures: {len(texture_sets)} texture set(s) grouped in {grouping * 1000:.1f} ms, grid {extent[0]} x {extent[1]}")
+            for label, create_materials in (("nodes only", False), ("with materials", True)):
+                for run in ("", ", unchanged"):
+                    if not run: rt.reset()
+                    else: rt.reset(scene=False)
+                    start = time.perf_counter(); stats = core.run_job(core.iter_import_textures_as_nodes(files, lambda message: None, create_materials)); wall = time.perf_counter() - start
+                    budget = BUDGET_PER_1000 * len(files) / 1000
+                    print(f"  {label + run:<28} {wall:>7.2f}s  execute {rt.calls['execute']:>2}  {rt.execute_chars / 1024:>7.0f} KB MaxScript  "
+                          f"{stats['nodes']:>5} node(s) {stats['materials']:>4} material(s)  {'within' if wall < budget else 'OVER'} the {budget:g} s budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#
+#   Tracing overhead benchmark.
+#
+#   Usage: python benchmarks/bench_trace.py [gsg_library_folder]
+#
+#   Measures the cost of span(), a traced() function and count() with tracing disabled and
+#   enabled. With a library folder, also compares a cold asset index refresh with tracing
+#   off and on, and prints the trace summary.
+#
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import GSGTrace
+from GSGTrace import span, traced, count
+
+CALLS = 200000
+
+
+@traced()
+def traced_noop():
+    pass
+
+
+def per_call_ns(fn):
+    start = time.perf_counter()
+    for _ in range(CALLS): fn()
+    return (time.perf_counter() - start) / CALLS * 1e9
+
+
+def with_span():
+    with span("noop"): pass
+
+
+def bench_calls():
+    baseline = per_call_ns(lambda: None)
+    for state in ("disabled", "enabled"):
+        GSGTrace.enable() if state == "enabled" else GSGTrace.disable()
+        results = {name: per_call_ns(fn) - baseline for name, fn in (("span", with_span), ("traced", traced_noop), ("count", lambda: count("calls")))}
+        print(f"Tracing {state:<8}: " + ", ".join(f"{name} {ns:.0f} ns" for name, ns in results.items()) + " per call")
+    GSGTrace.disable(); GSGTrace.reset()
+
+
+def bench_index(library_folder):
+    import GSGCore as core
+    times = {}
+    for state in ("off", "on"):
+        GSGTrace.enable() if state == "on" else GSGTrace.disable()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = core.AssetIndex(os.path.join(temp_dir, "bench_index.sqlite"))
+            start = time.perf_counter(); index.refresh(library_folder); times[state] = time.perf_counter() - start
+            index.close()
+    GSGTrace.disable()
+    print(f"Cold index refresh: {times['off']:.3f}s with tracing off, {times['on']:.3f}s with tracing on")
+    print("\n".join(GSGTrace.summary_lines()))
+
+
+if __name__ == "__main__":
+    bench_calls()
+    if len(sys.argv) > 1: bench_index(sys.argv[1])
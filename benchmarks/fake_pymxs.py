@@ -0,0 +1,133 @@
+#
+#   A recording stand-in for pymxs.runtime, so the importer can be driven outside 3ds Max.
+#
+#   Usage (before GSGCore or GSGAssetImporter is imported, or after - install() patches them too):
+#       from fake_pymxs import FakeRuntime, install
+#       rt = install(FakeRuntime(execute_latency=0.002, import_latency=0.05))
+#
+#   Every call is counted; execute() answers the scripts the importer generates with plausible
+#   results (built material counts, FBX scenes saved with saveNodes, ...) after sleeping for the
+#   configured latency, which stands in for the time 3ds Max would spend. Asset tags written with
+#   setAppData are kept as the scene, so incremental re-imports see what earlier runs created.
+#
+
+import os
+import re
+import sys
+import time
+import types
+from collections import Counter
+
+
+class FakeRuntime:
+    """ Records execute/importFile/messageBox calls and answers them after a configurable latency (seconds).
+        execute_char_latency adds time per MaxScript character, for the cost of parsing large scripts. """
+    def __init__(self, execute_latency=0.0, execute_char_latency=0.0, import_latency=0.0, message_latency=0.0, record_scripts=False):
+        self.execute_latency = execute_latency; self.execute_char_latency = execute_char_latency
+        self.import_latency = import_latency; self.message_latency = message_latency
+        self.record_scripts = record_scripts
+        self.renderers = types.SimpleNamespace(current="Octane_Renderer")
+        self.reset()
+
+    def reset(self, scene=True):
+        """ Clears the counters and, with scene, the scene (File > Reset). """
+        self.calls = Counter(); self.execute_chars = 0; self.scripts = []; self.messages = []
+        if scene: self.library_count = 0; self.tagged = {}
+
+    def _sleep(self, seconds):
+        if seconds > 0: time.sleep(seconds)
+
+    # --- pymxs.runtime surface used by the importer ---
+
+    def execute(self, script):
+        self.calls["execute"] += 1; self.execute_chars += len(script)
+        if self.record_scripts: self.scripts.append(script)
+        self._sleep(self.execute_latency + self.execute_char_latency * len(script))
+        return self.respond(script)
+
+    def importFile(self, file_path, *args, **kwargs):
+        self.calls["importFile"] += 1
+        self._sleep(self.import_latency)
+        return True
+
+    def messageBox(self, message, title=None, **kwargs):
+        self.calls["messageBox"] += 1; self.messages.append(message)
+        self._sleep(self.message_latency)
+
+    def classOf(self, value):
+        return value
+
+    def name(self, value):
+        return value
+
+    # --- answers to the generated scripts ---
+
+    def respond(self, script):
+        stripped = script.rstrip()
+        if "gsgLibraryBuild" not in script:
+            for _, key, record in re.findall(r'setAppData (\S+) \d+ "((?:[^"\\]|\\.)*)"(?:; setAppData \1 \d+ "((?:[^"\\]|\\.)*)")?', script):
+                self.tagged[self._unescape(key)] = self._unescape(record) if record else None
+        if "local found = #()" in script: return [[key, record] for key, record in self.tagged.items()]
+        if "local records = Dictionary" in script:
+            for key, record in re.findall(r'PutDictValue records "((?:[^"\\]|\\.)*)" "((?:[^"\\]|\\.)*)"', script):
+                if self._unescape(key) in self.tagged: self.tagged[self._unescape(key)] = self._unescape(record)
+            return "OK"
+        if stripped.endswith("okCount\n)"):
+            built = script.count("okCount += 1"); self.library_count += built
+            return built
+        if stripped.endswith("gsgDone\n)"):
+            done = [int(i) for i in re.findall(r"append gsgDone (\d+)", script)]
+            if "gsgLibraryBuild" in script: self.library_count += len(done)
+            return done
+        match = re.search(r'global gsgLibraryBuild = loadTempMaterialLibrary "((?:[^"\\]|\\.)*)"', script)
+        if match:
+            path = self._unescape(match.group(1))
+            dropped = len(re.findall(r'"(?:[^"\\]|\\.)*"', script.split("for k in #(", 1)[1].split(")", 1)[0]))
+            self.library_count = max(0, (int(open(path).read()) if os.path.isfile(path) else 0) - dropped)
+            return self.library_count
+        match = re.search(r'saveTempMaterialLibrary ::gsgLibraryBuild "((?:[^"\\]|\\.)*)"', script)
+        if match:
+            # Saved libraries are text files holding their material count, so merges can add them up.
+            self._write(match.group(1), str(self.library_count)); self.library_count = 0
+            return "OK"
+        if "loadTempMaterialLibrary" in script:
+            paths = [self._unescape(p) for p in re.findall(r'"((?:[^"\\]|\\.)*)"', script.split("for f in #(", 1)[1].split(")", 1)[0])]
+            merged = sum(int(open(p).read()) for p in paths if os.path.isfile(p))
+            self._write(re.search(r'saveTempMaterialLibrary merged "((?:[^"\\]|\\.)*)"', script).group(1), str(merged))
+            return merged
+        if "RendererClass.classes" in script: return "octane" in str(self.renderers.current).lower()
+        if "FBXImporterGetParam" in script: return "27000|#centimeters|1.0|Mode=#create"
+        match = re.search(r'saveNodes added "((?:[^"\\]|\\.)*)"', script)
+        if match:
+            # The import + saveNodes script: import takes import_latency, and the saved scene is what the FBX cache keeps.
+            self.calls["importFile"] += 1; self._sleep(self.import_latency)
+            self._write(match.group(1), "fake max scene")
+            return 3
+        if "mergeMAXFile" in script: return 3
+        if "importFile " in script:
+            self.calls["importFile"] += 1; self._sleep(self.import_latency)
+            return 3
+        if "sme.GetView sme.activeView) != undefined" in script: return True
+        if "collect t.filename" in script: return []
+        if "PutDictValue remap" in script: return 0
+        return "OK"
+
+    @staticmethod
+    def _unescape(text):
+        return text.replace('\\"', '"').replace("\\\\", "\\")
+
+    def _write(self, escaped_path, text):
+        with open(self._unescape(escaped_path), 'w') as f: f.write(text)
+
+    def report(self):
+        return {"execute": self.calls["execute"], "importFile": self.calls["importFile"], "messageBox": self.calls["messageBox"], "execute_chars": self.execute_chars}
+
+
+def install(runtime=None):
+    """ Makes 'from pymxs import runtime' return runtime, and patches already imported GSGCore and GSGAssetImporter modules. """
+    runtime = runtime or FakeRuntime()
+    module = types.ModuleType("pymxs"); module.runtime = runtime
+    sys.modules["pymxs"] = module
+    for name in ("GSGCore", "GSGAssetImporter"):
+        if name in sys.modules: sys.modules[name].rt = runtime
+    return runtime
@@ -0,0 +1,90 @@
+#
+#   Synthetic GSG library generator for the offline benchmarks.
+#
+#   Usage: python benchmarks/make_library.py <output_folder> [--materials N] [--hdris N] [--hdr-size 2048x1024]
+#                                            [--fbx N] [--fbx-kb 256] [--seed 1]
+#
+#   Writes Materials/<Category>/<Name>/ folders with a realistic .gsgm file and texture maps named
+#   after the naming schemes found in GSG and other libraries, HDRIs/*.hdr RLE files of the given
+#   size, and Models/*.fbx binary FBX stubs (every tenth one a duplicate of another). Texture
+#   maps are small placeholders, not decodable images: the importer only needs their names.
+#
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_hdri import write_synthetic_hdr
+
+CATEGORIES = ["Wood", "Metal", "Stone", "Fabric", "Concrete", "Plastic", "Ground", "Tiles"]
+ADJECTIVES = ["Old", "Polished", "Brushed", "Rough", "Painted", "Worn", "Clean", "Rusted", "Wet", "Aged"]
+# Map naming schemes: map slot -> file name pattern ({name} is the material name, {res} the resolution)
+NAMING_SCHEMES = [
+    {"albedo": "{name}_Albedo_{res}.jpg", "roughness": "{name}_Roughness_{res}.jpg", "normal": "{name}_Normal_{res}.png", "displacement": "{name}_Displacement_{res}.exr"},
+    {"albedo": "{name}_BaseColor_{res}.jpg", "roughness": "{name}_Roughness_{res}.jpg", "metallic": "{name}_Metalness_{res}.jpg", "normal": "{name}_NormalGL_{res}.png"},
+    {"albedo": "{name}_col_{res}.jpg", "roughness": "{name}_rgh_{res}.jpg", "normal": "{name}_nrm_{res}.jpg", "metallic": "{name}_met_{res}.jpg", "displacement": "{name}_disp_{res}.exr"},
+    {"albedo": "{name}_diffuse.jpg", "roughness": "{name}_roughness.jpg", "normal": "{name}_normal_map.jpg"},
+    {"albedo": "{name}_Albedo.jpg", "scattering_weight": "{name}_ScatteringWeight.jpg", "scattering_distance": "{name}_Scattering_Distance.jpg", "normal": "{name}_Normal.png"},
+]
+EXTRA_FILES = ["{name}_Preview.jpg", "{name}_AO_{res}.jpg"]
+PLACEHOLDER = b"\xff\xd8\xff\xe0GSG placeholder map\xff\xd9"
+
+
+def gsgm_data(name, rng):
+    """ A .gsgm document shaped like the ones GSG ships: metadata plus a standard_surface parameter block. """
+    surface = {"base_color": {"r": round(rng.random(), 3), "g": round(rng.random(), 3), "b": round(rng.random(), 3)}, "specular_roughness": round(rng.uniform(0.05, 0.95), 3),
+               "metallic": rng.choice([0, 0, 0, 1]), "specular_IOR": round(rng.uniform(1.3, 1.8), 2)}
+    if rng.random() < 0.1: surface.update({"transmission": round(rng.random(), 2), "transmission_color": {"r": 1.0, "g": 1.0, "b": 1.0}})
+    if rng.random() < 0.1: surface.update({"scattering_weight": {"r": 0.8, "g": 0.3, "b": 0.2}, "scatteringdistancescale": round(rng.uniform(0.1, 2.0), 2)})
+    return {"name": name, "version": "1.2", "vendor": "Greyscalegorilla", "tags": [rng.choice(CATEGORIES).lower(), "pbr"],
+            "params": {"standard_surface": surface}, "preview": f"{name}_Preview.jpg"}
+
+
+def generate_library(root, materials=100, hdris=0, hdr_size=(1024, 512), fbx=0, fbx_kb=64, seed=1):
+    """ Writes a synthetic library below root and returns the counts of what was written. """
+    rng = random.Random(seed)
+    material_root = os.path.join(root, "Materials"); texture_count = 0
+    for i in range(materials):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        name = f"{rng.choice(ADJECTIVES)}_{category}_{i:05d}"
+        folder = os.path.join(material_root, category, name); os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"{name}.gsgm"), 'w', encoding='utf-8') as f: json.dump(gsgm_data(name, rng), f, indent=4)
+        scheme = NAMING_SCHEMES[i % len(NAMING_SCHEMES)]
+        resolutions = ["2K"] if rng.random() < 0.7 else ["1K", "2K", "4K"]
+        file_names = {pattern.format(name=name, res=res) for res in resolutions for pattern in list(scheme.values()) + EXTRA_FILES}
+        for file_name in file_names:
+            with open(os.path.join(folder, file_name), 'wb') as f: f.write(PLACEHOLDER)
+        texture_count += len(file_names)
+    hdri_root = os.path.join(root, "HDRIs")
+    if hdris: os.makedirs(hdri_root, exist_ok=True)
+    for i in range(hdris):
+        write_synthetic_hdr(os.path.join(hdri_root, f"Sky_{i:04d}.hdr"), *hdr_size)
+    model_root = os.path.join(root, "Models")
+    if fbx: os.makedirs(model_root, exist_ok=True)
+    payloads = []
+    for i in range(fbx):
+        if i % 10 == 9 and payloads: payload = rng.choice(payloads)
+        else: payload = b"Kaydara FBX Binary  \x00\x1a\x00\xe8\x1c\x00\x00" + rng.randbytes(fbx_kb * 1024); payloads.append(payload)
+        with open(os.path.join(model_root, f"Model_{i:05d}.fbx"), 'wb') as f: f.write(payload)
+    return {"materials": materials, "textures": texture_count, "hdris": hdris, "fbx": fbx}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic GSG library for the benchmarks.")
+    parser.add_argument("output_folder")
+    parser.add_argument("--materials", type=int, default=100)
+    parser.add_argument("--hdris", type=int, default=0)
+    parser.add_argument("--hdr-size", default="1024x512", help="width x height of the HDR files")
+    parser.add_argument("--fbx", type=int, default=0)
+    parser.add_argument("--fbx-kb", type=int, default=64, help="size of each FBX stub")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.hdr_size.lower().split("x"))
+    print(generate_library(args.output_folder, args.materials, args.hdris, (width, height), args.fbx, args.fbx_kb, args.seed))
+
+
+if __name__ == "__main__":
+    main()
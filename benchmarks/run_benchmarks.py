@@ -0,0 +1,138 @@
+#
+#   Offline benchmark suite: drives the importer against a fake pymxs runtime on synthetic libraries.
+#
+#   Usage: python benchmarks/run_benchmarks.py [--scales 10,1000,10000] [--execute-latency 0.002]
+#                                              [--import-latency 0.05] [--json results.json] [--compare baseline.json]
+#
+#   For every scale a synthetic library with that many materials, texture nodes and FBX files (and
+#   up to --max-hdris HDRIs) is generated, then each benchmark runs in its own Python process with
+#   empty caches. Reported per benchmark: wall time, rt.execute / importFile calls, MaxScript
+#   characters executed and the peak resident memory of the process. Save the results with --json
+#   and pass them to --compare on a later version to see the change in wall time.
+#
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, os.path.dirname(BENCH_DIR))
+
+BENCHMARKS = ["create_octane_material", "build_material_library", "import_fbx_files", "import_textures_as_nodes", "create_octane_hdri"]
+
+
+def peak_rss_mb():
+    """ Peak resident memory of this process in MB. """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        import ctypes
+        from ctypes import wintypes
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [(n, ctypes.c_size_t) for n in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+        counters = Counters(); counters.cb = ctypes.sizeof(Counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+
+# --- worker: runs one benchmark in a fresh process ---
+
+def run_worker(name, library, scale, options):
+    from fake_pymxs import FakeRuntime, install
+    rt = install(FakeRuntime(execute_latency=options["execute_latency"], import_latency=options["import_latency"], message_latency=options["message_latency"]))
+    import GSGCore as core
+    messages = []; log = messages.append
+    material_root = os.path.join(library, "Materials"); model_root = os.path.join(library, "Models"); hdri_root = os.path.join(library, "HDRIs")
+    baseline_mb = peak_rss_mb()
+    results = []
+
+    def measure(label, fn, assets):
+        rt.reset(); start = time.perf_counter(); fn(); wall = time.perf_counter() - start
+        results.append(dict(rt.report(), benchmark=label, scale=scale, assets=assets, wall=wall, peak_rss_mb=peak_rss_mb(), baseline_rss_mb=baseline_mb, log_lines=len(messages)))
+
+    if name == "create_octane_material":
+        folders = [m["folder"] for m in core.get_asset_index().materials(material_root)]
+        measure(name, lambda: [core.create_octane_material(folder, log) for folder in folders], len(folders))
+    elif name == "build_material_library":
+        measure(name, lambda: core.build_material_library(material_root, log), scale)
+    elif name == "import_fbx_files":
+        measure(name + " (cold cache)", lambda: core.import_fbx_files(model_root, log), scale)
+        measure(name + " (warm cache)", lambda: core.import_fbx_files(model_root, log), scale)
+    elif name == "import_textures_as_nodes":
+        files = core.get_asset_index().files_below(material_root, core.TEXTURE_EXTENSIONS)[:scale]
+        measure(name, lambda: core.import_textures_as_nodes(files, log), len(files))
+    elif name == "create_octane_hdri":
+        hdris = core.get_asset_index().files_below(hdri_root, core.HDRI_EXTENSIONS) if os.path.isdir(hdri_root) else []
+        def create_all():
+            for path in hdris:
+                analysis = core.run_job(core.iter_analyze_hdri(path, log))
+                core.create_octane_hdri(path, log, power=core.suggest_power(analysis[0], core.HDRI_TARGET_KEY) if analysis else 1.0)
+        measure(name + " (with analysis)", create_all, len(hdris))
+    print(json.dumps(results))
+
+
+# --- driver ---
+
+def run_scale(scale, args):
+    from make_library import generate_library
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        library = os.path.join(temp_dir, "library")
+        start = time.perf_counter()
+        counts = generate_library(library, materials=scale, hdris=min(scale, args.max_hdris), hdr_size=tuple(int(v) for v in args.hdr_size.split("x")), fbx=scale, fbx_kb=args.fbx_kb)
+        print(f"Scale {scale}: generated {counts} in {time.perf_counter() - start:.1f}s", flush=True)
+        options = json.dumps({"execute_latency": args.execute_latency, "import_latency": args.import_latency, "message_latency": args.message_latency})
+        for name in args.benchmarks.split(","):
+            cache_dir = os.path.join(temp_dir, f"cache_{name}")
+            env = dict(os.environ, LOCALAPPDATA=cache_dir, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+            process = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", name, library, str(scale), options], env=env, capture_output=True, text=True)
+            if process.returncode != 0:
+                print(f"  {name} failed:\n{process.stderr[-2000:]}", flush=True); continue
+            for result in json.loads(process.stdout.strip().splitlines()[-1]):
+                results.append(result); print_result(result)
+    return results
+
+
+def print_result(r, baseline=None):
+    per_asset = r["wall"] / max(r["assets"], 1) * 1000
+    line = (f"  {r['benchmark']:<40} {r['assets']:>6} assets {r['wall']:>8.2f}s {per_asset:>8.2f} ms/asset  execute {r['execute']:>6}  importFile {r['importFile']:>6}  "
+            f"{r['execute_chars'] / 1024:>8.0f} KB MaxScript  peak RSS {r['peak_rss_mb']:>6.0f} MB (+{r['peak_rss_mb'] - r['baseline_rss_mb']:.0f})")
+    if baseline: line += f"  {r['wall'] / max(baseline['wall'], 1e-9):.2f}x baseline time"
+    print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline GSG importer benchmarks with a fake pymxs runtime.")
+    parser.add_argument("--scales", default="10,1000,10000")
+    parser.add_argument("--benchmarks", default=",".join(BENCHMARKS))
+    parser.add_argument("--execute-latency", type=float, default=0.0, help="seconds added to every rt.execute call")
+    parser.add_argument("--import-latency", type=float, default=0.0, help="seconds added to every FBX import")
+    parser.add_argument("--message-latency", type=float, default=0.0, help="seconds added to every messageBox")
+    parser.add_argument("--max-hdris", type=int, default=10)
+    parser.add_argument("--hdr-size", default="1024x512")
+    parser.add_argument("--fbx-kb", type=int, default=8)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run to compare wall times with")
+    args = parser.parse_args()
+    results = []
+    for scale in (int(s) for s in args.scales.split(",")): results += run_scale(scale, args)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f: json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "args": vars(args), "results": results}, f, indent=1)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f: baseline = {(r["benchmark"], r["scale"]): r for r in json.load(f)["results"]}
+        print(f"Compared with {args.compare}:")
+        for r in results: print_result(r, baseline.get((r["benchmark"], r["scale"])))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        run_worker(sys.argv[2], sys.argv[3], int(sys.argv[4]), json.loads(sys.argv[5]))
+    else:
+        main()